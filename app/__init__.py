@@ -3,14 +3,13 @@ from flask import Flask
 def create_app(config=None):
     app = Flask(__name__, instance_relative_config=True)
 
-    if config is None:
-        # Load the default configuration
-        app.config.from_mapping(
-            SECRET_KEY='dev', # Should be overridden in production
-            # Add other default configurations here
-        )
-    else:
-        # Load the passed-in configuration
+    # Load the default configuration
+    app.config.from_mapping(
+        SECRET_KEY='dev', # Should be overridden in production
+        # Add other default configurations here
+    )
+    if config is not None:
+        # Override with the passed-in configuration (e.g. tests pointing storage at a temp dir)
         app.config.from_mapping(config)
 
     # Ensure the instance folder exists (if using instance_relative_config)
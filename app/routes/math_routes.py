@@ -1,154 +1,633 @@
-from flask import Blueprint, jsonify, render_template, Response, stream_with_context
+from flask import Blueprint, abort, jsonify, render_template, request, url_for, Response, stream_with_context
+import math
+import os
+import queue
+import secrets
+import threading
 import time
-import io
-import sys
 import json
-from contextlib import redirect_stdout
+from concurrent.futures import CancelledError, ThreadPoolExecutor
+from fractions import Fraction
 from ..services.math_core import (
     PiVerification, PhiVerification, ProbabilityVerification,
     CalculusVerification, BinaryVerification, PrimesVerification,
     SymmetryVerification, EVerification
 )
+from ..services.math_core import bayes, continued_fraction
+from ..services.math_core.clt import DISTRIBUTIONS
+from ..services.math_core.estimators import ESTIMATORS
+from ..services.math_core.prime_table import prime_table
+from ..services.dashboard import DashboardAggregator, is_accurate, summarize
+from ..services.render_pool import RenderPool
+from ..services.symbolic_worker import symbolic_pool
+from ..services.utils.config import (
+    BAYES_CONFIG, CACHE_CONFIG, CLT_CONFIG, CONTINUED_FRACTION_CONFIG, DASHBOARD_CONFIG, EVENTS_CONFIG,
+    FIBONACCI_CONFIG, GAP_CONFIG, MONTE_CARLO_CONFIG, PI_ENGINE_CONFIG, PLOT_MODES, PLOT_STORE_CONFIG,
+    PRIMALITY_CONFIG, PRIME_COUNTING_CONFIG, QUADRATURE_CONFIG, RENDER_POOL_CONFIG, SIEVE_CONFIG, STREAM_CONFIG,
+    SYMBOLIC_CONFIG
+)
+from ..services.utils.events import CancellableSink, MemorySink, cancel_scope
+from ..services.utils.result_cache import ResultCache
+from ..services.visualization.base64_encoder import png_to_base64
+from ..services.visualization.plot_store import PlotStore
+from ..services.visualization.series_encoder import series_to_json, series_to_npz
 
 math_bp = Blueprint('math', __name__, url_prefix='/math')
 
+# 검증 소요 시간과 핵심 지표를 모으는 이벤트 수집기
+event_sink = MemorySink(max_events=EVENTS_CONFIG['max_events'])
+# 검증기가 쓰는 수집기: emit 지점마다 스트리밍 요청의 취소 여부를 확인
+verifier_sink = CancellableSink(event_sink)
+
+# 대규모 몬테카를로 블록을 나눠 실행하는 프로세스 풀 (블록이 둘 이상일 때만 사용)
+monte_carlo_pool = RenderPool(max_workers=MONTE_CARLO_CONFIG['workers'])
+
+# 소수 구간 체 블록을 나눠 실행하는 프로세스 풀 (블록이 둘 이상일 때만 사용)
+sieve_pool = RenderPool(max_workers=SIEVE_CONFIG['workers'])
+
 # Instantiate verifiers
-pi_verifier = PiVerification()
-phi_verifier = PhiVerification()
-probability_verifier = ProbabilityVerification()
-calculus_verifier = CalculusVerification()
-binary_verifier = BinaryVerification()
-primes_verifier = PrimesVerification()
-symmetry_verifier = SymmetryVerification()
-e_verifier = EVerification()
+pi_verifier = PiVerification(sink=verifier_sink, mapper=monte_carlo_pool.map)
+phi_verifier = PhiVerification(sink=verifier_sink)
+probability_verifier = ProbabilityVerification(sink=verifier_sink)
+calculus_verifier = CalculusVerification(sink=verifier_sink)
+binary_verifier = BinaryVerification(sink=verifier_sink)
+primes_verifier = PrimesVerification(sink=verifier_sink, mapper=sieve_pool.map)
+symmetry_verifier = SymmetryVerification(sink=verifier_sink)
+e_verifier = EVerification(sink=verifier_sink)
+
+# 검증 이름 → (개념, 설명, 검증 함수, 무작위 여부)
+VERIFICATIONS = {
+    'pi': ('π (건☰)', '원주율 π의 다양한 계산 방법과 몬테카를로 시뮬레이션',
+           pi_verifier.verify_pi_with_visualization, True),
+    'golden-ratio': ('φ (리☲)', '황금비 φ와 피보나치 수열, 황금 사각형 및 나선 구조',
+                     phi_verifier.verify_golden_ratio_with_visualization, False),
+    'probability': ('확률론 (감☵)', '중심극한정리 및 베이즈 정리 시각화',
+                    probability_verifier.verify_probability_with_visualization, True),
+    'calculus': ('미적분학 (진☳손☴)', '미분과 적분의 기본 원리 및 수치적 검증',
+                 calculus_verifier.verify_calculus_with_visualization, False),
+    'binary': ('이진법 (곤☷)', '이진수 표현, 논리 게이트 및 이항 분포',
+               binary_verifier.verify_binary_with_visualization, False),
+    'primes': ('소수 (간☶)', '에라토스테네스의 체, 소수 정리 및 메르센 소수',
+               primes_verifier.verify_primes_with_visualization, False),
+    'symmetry': ('대칭성 (태☱)', '기하학적 대칭 변환 및 군론적 대칭성 소개',
+                 symmetry_verifier.verify_symmetry_with_visualization, False),
+    'e': ('자연상수 e', '자연상수 e의 다양한 정의와 계산 방법 시각화',
+          e_verifier.verify_e_with_visualization, False),
+}
+
+result_cache = ResultCache(**CACHE_CONFIG)
+latest_results = {}
+plot_store = PlotStore(memory_items=PLOT_STORE_CONFIG['memory_items'],
+                       max_disk_bytes=PLOT_STORE_CONFIG['max_disk_bytes'])
+render_pool = RenderPool(
+    max_workers=RENDER_POOL_CONFIG['workers'],
+    verifiers=RENDER_POOL_CONFIG['verifiers'],
+    timeout=RENDER_POOL_CONFIG['timeout']
+)
+
+@math_bp.record
+def configure_services(state):
+    """앱 설정으로 모듈 공유 서비스 구성 (앱을 만들 때마다 실행되므로 마지막 앱의 설정이 적용됨)"""
+    config = state.app.config
+    result_cache.max_size = config.get('RESULT_CACHE_SIZE', CACHE_CONFIG['max_size'])
+    result_cache.ttl = config.get('RESULT_CACHE_TTL', CACHE_CONFIG['ttl'])
+    plot_store.directory = config.get('PLOT_STORE_DIR', os.path.join(state.app.instance_path, 'plots'))
+    plot_store.max_disk_bytes = config.get('PLOT_STORE_MAX_BYTES', PLOT_STORE_CONFIG['max_disk_bytes'])
+    render_pool.max_workers = config.get('RENDER_POOL_WORKERS', RENDER_POOL_CONFIG['workers'])
+    render_pool.verifiers = set(config.get('RENDER_POOL_VERIFIERS', RENDER_POOL_CONFIG['verifiers']))
+    render_pool.timeout = config.get('RENDER_POOL_TIMEOUT', RENDER_POOL_CONFIG['timeout'])
+    symbolic_pool.max_workers = config.get('SYMBOLIC_WORKERS', SYMBOLIC_CONFIG['workers'])
+    symbolic_pool.timeout = config.get('SYMBOLIC_TIMEOUT', SYMBOLIC_CONFIG['timeout'])
+    symbolic_pool.memory_limit = config.get('SYMBOLIC_MEMORY_LIMIT', SYMBOLIC_CONFIG['memory_limit'])
+    symbolic_pool.cpu_limit = config.get('SYMBOLIC_CPU_LIMIT', SYMBOLIC_CONFIG['cpu_limit'])
+    symbolic_pool.memo.path = config.get('SYMBOLIC_MEMO_PATH',
+                                         os.path.join(state.app.instance_path, SYMBOLIC_CONFIG['memo_file']))
+    prime_table.directory = config.get('PRIME_TABLE_DIR', os.path.join(state.app.instance_path, 'primes'))
+    # 렌더 워커도 같은 소수 표와 기호 계산 메모를 읽도록 경로 전달 (바뀌면 워커를 새로 띄움)
+    worker_settings = {
+        'prime_table_dir': prime_table.directory,
+        'symbolic_memo_path': symbolic_pool.memo.path
+    }
+    if worker_settings != render_pool.worker_settings:
+        render_pool.shutdown(wait=False)
+        render_pool.worker_settings = worker_settings
+    monte_carlo_pool.max_workers = config.get('MONTE_CARLO_WORKERS', MONTE_CARLO_CONFIG['workers'])
+    sieve_pool.max_workers = config.get('SIEVE_WORKERS', SIEVE_CONFIG['workers'])
+    dashboard.interval = config.get('DASHBOARD_REFRESH_INTERVAL', DASHBOARD_CONFIG['refresh_interval'])
+
+def encode_plots(plots):
+    """PNG 그래프를 URL(기본) 또는 base64(?plot_format=base64, 레거시)로 변환"""
+    if request.args.get('plot_format') == 'base64':
+        return {name: png_to_base64(png) for name, png in plots.items()}
+    return {
+        name: url_for('math.get_plot', digest=plot_store.put(png))
+        for name, png in plots.items()
+    }
+
+def compute_verification(name, plot_mode='png', seed=None, params=None):
+    """검증 실행 → (결과, 그래프, 캐시 적중 여부, 시드)
+
+    요청 컨텍스트 없이 동작하므로 스트리밍 작업 스레드에서도 호출할 수 있다.
+    결정적 검증은 (검증기, 파라미터)로, 무작위 검증은 시드가 주어진 경우에만
+    (검증기, 파라미터, 시드)로 캐시한다. 시드가 없으면 새 시드로 실행하고 돌려준다.
+    """
+    _, _, func, randomized = VERIFICATIONS[name]
+    params = dict(params or {}, plot_mode=plot_mode)
+
+    def execute(**call_params):
+        if plot_mode == 'png':
+            return render_pool.run(name, func, **call_params)
+        # 그래프를 그리지 않는 모드는 가벼우므로 프로세스 풀을 거치지 않는다
+        return func(**call_params)
+
+    if not randomized:
+        seed = None
+    elif seed is None:
+        seed = secrets.randbits(32)
+        result, plots = execute(seed=seed, **params)
+        return result, plots, False, seed
+
+    call_params = dict(params, seed=seed) if randomized else params
+    key = ResultCache.make_key(name, params, seed)
+    (result, plots), cached = result_cache.get_or_compute(key, lambda: execute(**call_params))
+    return result, plots, cached, seed
+
+def timed_verification(name, plot_mode='png', seed=None, params=None):
+    """compute_verification + 'verification' 이벤트(소요 시간, 캐시 적중 여부) 기록
+
+    대시보드가 쓸 수 있도록 검증별 마지막 결과도 남긴다.
+    """
+    with event_sink.timer('verification', verification=name, plot_mode=plot_mode) as event:
+        result, plots, cached, seed = compute_verification(name, plot_mode, seed, params)
+        event['cached'] = cached
+    latest_results[name] = {
+        'result': result, 'seed': seed, 'timestamp': time.time(),
+        'plot_count': len(plots) if plot_mode == 'png' else 0
+    }
+    return result, plots, cached, seed
+
+def build_dashboard():
+    """대시보드 스냅샷 생성 (백그라운드 스레드에서 호출)"""
+    requests_by_name = {}
+    for event in event_sink.events('verification'):
+        requests_by_name.setdefault(event['verification'], []).append(event)
+
+    summary, verifications, accurate = [], {}, 0
+    for name, (concept, _, func, randomized) in VERIFICATIONS.items():
+        latest = latest_results.get(name)
+        if latest is None:
+            # 아직 요청이 없던 검증은 그래프 없이 한 번 계산해 둔다
+            seed = DASHBOARD_CONFIG['seed'] if randomized else None
+            result, _ = func(plot_mode='none', **({'seed': seed} if randomized else {}))
+            latest = latest_results.setdefault(name, {
+                'result': result, 'seed': seed, 'timestamp': time.time(), 'plot_count': 0
+            })
+
+        requests = requests_by_name.get(name, [])
+        computed_durations = [event['duration'] for event in requests if not event.get('cached')]
+        computed = event_sink.latest(f"{name.replace('-', '_')}.computed")
+        summary.append(summarize(name, latest['result']))
+        accurate += is_accurate(name, latest['result'])
+        verifications[name] = {
+            'concept': concept,
+            'result': latest['result'],
+            'updated_at': latest['timestamp'],
+            'compute_time': computed['duration'] if computed else None,
+            'requests': len(requests),
+            'cache_hits': len(requests) - len(computed_durations),
+            'mean_request_time': (sum(computed_durations) / len(computed_durations)
+                                  if computed_durations else None)
+        }
+
+    return {
+        'verification_count': len(summary),
+        'plot_count': sum(latest['plot_count'] for latest in latest_results.values()),
+        'accuracy': accurate / len(summary),
+        'summary': summary,
+        'verifications': verifications,
+        'cache': result_cache.stats(),
+        'symbolic': symbolic_pool.stats()
+    }
+
+dashboard = DashboardAggregator(build_dashboard, interval=DASHBOARD_CONFIG['refresh_interval'])
+
+def build_payload(name, result, plots, cached, seed, plot_mode):
+    """검증 결과를 JSON 응답 본문으로 구성"""
+    concept, description, _, randomized = VERIFICATIONS[name]
+    payload = {
+        'success': True, 'concept': concept, 'result': result,
+        'plots': encode_plots(plots) if plot_mode == 'png' else series_to_json(plots),
+        'description': description, 'cached': cached
+    }
+    if randomized:
+        payload['seed'] = seed
+    return payload
+
+def get_plot_mode(default='png'):
+    """?plots= 값 검증, 잘못된 값이면 None"""
+    plot_mode = request.args.get('plots', default)
+    return plot_mode if plot_mode in PLOT_MODES else None
+
+def plot_mode_error(concept=None):
+    return jsonify({
+        'success': False, 'concept': concept,
+        'error': f"plots must be one of {', '.join(PLOT_MODES)}"
+    }), 400
+
+def run_verification(name, params=None):
+    """검증 실행 후 JSON 응답 생성
+
+    ?seed= 로 무작위 검증을 재현할 수 있고, ?plots=png|data|none 으로 그래프 출력
+    방식을 고른다. data 모드는 matplotlib을 거치지 않고 그래프의 원본 배열을
+    JSON(기본) 또는 ?format=npz 바이너리로 돌려준다.
+    """
+    concept = VERIFICATIONS[name][0]
+    plot_mode = get_plot_mode()
+    if plot_mode is None:
+        return plot_mode_error(concept)
+
+    try:
+        seed = request.args.get('seed', type=int)
+        result, plots, cached, seed = timed_verification(name, plot_mode, seed, params)
+
+        if plot_mode == 'data' and request.args.get('format') == 'npz':
+            return Response(
+                series_to_npz(plots), mimetype='application/octet-stream',
+                headers={'Content-Disposition': f'attachment; filename={name}.npz'}
+            )
+        return jsonify(build_payload(name, result, plots, cached, seed, plot_mode))
+    except Exception as e:
+        return jsonify({'success': False, 'error': str(e), 'concept': concept})
+
+def run_report(name, func, params, concept, description, cache=True):
+    """부가 보고서(report, plots)를 풀에서 실행하고 JSON 응답 본문으로 구성"""
+    execute = lambda: render_pool.run(name, func, **params)
+    if cache:
+        (report, plots), cached = result_cache.get_or_compute(ResultCache.make_key(name, params), execute)
+    else:
+        (report, plots), cached = execute(), False
+    return {
+        'success': True, 'concept': concept, 'result': report,
+        'plots': encode_plots(plots) if params['plot_mode'] == 'png' else series_to_json(plots),
+        'description': description, 'cached': cached
+    }
+
+def get_int_args(limits):
+    """정수 쿼리 인자 검증 → (주어진 인자 dict, 오류 메시지)
+
+    limits: 인자 이름 → 최댓값. 주어지지 않은 인자는 결과에서 빠지므로
+    검증 함수의 기본값과 캐시 키가 그대로 유지된다.
+    """
+    params = {}
+    for arg, maximum in limits.items():
+        if arg not in request.args:
+            continue
+        value = request.args.get(arg, type=int)
+        if value is None or not 1 <= value <= maximum:
+            return None, f"{arg} must be an integer between 1 and {maximum}"
+        params[arg] = value
+    return params, None
+
+def args_error(error, name='pi'):
+    return jsonify({'success': False, 'concept': VERIFICATIONS[name][0], 'error': error}), 400
 
 @math_bp.route('/api/verification/pi')
 def verify_pi_route():
-    try:
-        result, plots = pi_verifier.verify_pi_with_visualization()
+    params, error = get_int_args({
+        'precision': PI_ENGINE_CONFIG['max_digits'],
+        'points': MONTE_CARLO_CONFIG['max_points']
+    })
+    if error:
+        return args_error(error)
+    if 'points' in params:
+        params['n_points'] = params.pop('points')
+    return run_verification('pi', params)
+
+@math_bp.route('/api/verification/pi/engine')
+def pi_engine_route():
+    """π 계산 방법별 자릿수 vs 시간 보고서 (?digits= 추드노프스키 최대 자릿수)"""
+    plot_mode = get_plot_mode()
+    if plot_mode is None:
+        return plot_mode_error(VERIFICATIONS['pi'][0])
+    params, error = get_int_args({'digits': PI_ENGINE_CONFIG['max_digits']})
+    if error:
+        return args_error(error)
+
+    params = {'max_digits': params.get('digits', PI_ENGINE_CONFIG['benchmark_digits']), 'plot_mode': plot_mode}
+    return jsonify(run_report(
+        'pi-engine', pi_verifier.benchmark_pi_engine, params, VERIFICATIONS['pi'][0],
+        'π 계산 방법별 정확한 자릿수, 오차, 초당 자릿수 비교'
+    ))
+
+ESTIMATOR_REPORTS = {
+    'pi': pi_verifier.compare_estimators,
+    'calculus': calculus_verifier.compare_estimators,
+}
+
+@math_bp.route('/api/verification/<name>/estimators')
+def estimators_route(name):
+    """추정기별 표본 수 대비 RMSE (?estimators=sobol,halton ?seed=)"""
+    if name not in ESTIMATOR_REPORTS:
+        abort(404)
+    concept = VERIFICATIONS[name][0]
+    plot_mode = get_plot_mode()
+    if plot_mode is None:
+        return plot_mode_error(concept)
+
+    methods = tuple(request.args.get('estimators', ','.join(ESTIMATORS)).split(','))
+    if not set(methods) <= set(ESTIMATORS):
         return jsonify({
-            'success': True, 'concept': 'π (건☰)', 'result': result,
-            'plots': plots, 'description': '원주율 π의 다양한 계산 방법과 몬테카를로 시뮬레이션'
-        })
-    except Exception as e:
-        return jsonify({'success': False, 'error': str(e), 'concept': 'π (건☰)'})
+            'success': False, 'concept': concept,
+            'error': f"estimators must be among {', '.join(ESTIMATORS)}"
+        }), 400
+
+    # 시드가 없으면 새로 뽑아 응답에 돌려주고, 시드를 지정한 요청만 캐시
+    seed = request.args.get('seed', type=int)
+    cache = seed is not None
+    if seed is None:
+        seed = secrets.randbits(32)
+    params = {'methods': methods, 'seed': seed, 'plot_mode': plot_mode}
+    payload = run_report(
+        f'{name}-estimators', ESTIMATOR_REPORTS[name], params, concept,
+        '유사난수, 준난수(Sobol, Halton), 대조변량, 층화 추정기의 표본 수 대비 오차 비교',
+        cache=cache
+    )
+    payload['seed'] = seed
+    return jsonify(payload)
 
 @math_bp.route('/api/verification/golden-ratio')
 def verify_golden_ratio_route():
+    params, error = get_int_args({
+        'n': FIBONACCI_CONFIG['max_n'],
+        'modulus': FIBONACCI_CONFIG['max_modulus']
+    })
+    if error:
+        return args_error(error, 'golden-ratio')
+    return run_verification('golden-ratio', params)
+
+def get_expansion():
+    """?constant= / ?value= / ?quadratic= 로 연분수 전개 선택 → (전개, 이름)"""
+    if 'value' in request.args:
+        value = request.args['value']
+        # 지수 표기(1e999999)는 짧은 문자열로도 거대한 정수를 만들므로 허용하지 않음
+        if len(value) > CONTINUED_FRACTION_CONFIG['max_value_length'] or 'e' in value.lower():
+            raise ValueError("value must be a fraction p/q or a decimal of limited length")
+        try:
+            value = Fraction(value)
+        except ZeroDivisionError:
+            raise ValueError("value must have a non-zero denominator") from None
+        return continued_fraction.rational(value.numerator, value.denominator), str(value)
+    if 'quadratic' in request.args:
+        P, D, Q = (int(part) for part in request.args['quadratic'].split(','))
+        return continued_fraction.quadratic(P, D, Q), f'({P} + √{D})/{Q}'
+    name = request.args.get('constant', 'golden_ratio')
+    return continued_fraction.constant(name), name
+
+@math_bp.route('/api/verification/continued-fraction')
+def continued_fraction_route():
+    """연분수 부분 몫과 수렴값
+
+    ?constant=pi|e|golden_ratio|sqrt_2, ?value=p/q (유리수), ?quadratic=P,D,Q ((P + √D)/Q) 중 하나와
+    ?terms= 항 수, ?max_denominator= 최선 유리 근사. ?format=ndjson 이면 수렴값을 한 줄씩 스트리밍한다.
+    """
+    params, error = get_int_args({
+        'terms': CONTINUED_FRACTION_CONFIG['max_terms'],
+        'max_denominator': CONTINUED_FRACTION_CONFIG['max_denominator']
+    })
+    if error:
+        return jsonify({'success': False, 'error': error}), 400
     try:
-        result, plots = phi_verifier.verify_golden_ratio_with_visualization()
-        return jsonify({
-            'success': True, 'concept': 'φ (리☲)', 'result': result,
-            'plots': plots, 'description': '황금비 φ와 피보나치 수열, 황금 사각형 및 나선 구조'
-        })
-    except Exception as e:
-        return jsonify({'success': False, 'error': str(e), 'concept': 'φ (리☲)'})
+        expansion, label = get_expansion()
+    except ValueError as e:
+        return jsonify({'success': False, 'error': str(e)}), 400
+    terms = params.get('terms', CONTINUED_FRACTION_CONFIG['terms'])
+
+    if request.args.get('format') == 'ndjson':
+        def generate():
+            for k, a, p, q in expansion.iter_convergents():
+                if k >= terms:
+                    break
+                yield json.dumps({'k': k, 'quotient': a, 'numerator': str(p), 'denominator': str(q)}) + '\n'
+        return Response(stream_with_context(generate()), mimetype='application/x-ndjson')
+
+    # 수렴값의 분자/분모는 JavaScript 정수 범위를 넘으므로 문자열로 보냄
+    result = {
+        'quotients': expansion.quotients(terms),
+        'convergents': [[str(p), str(q)] for p, q in expansion.convergents(terms)],
+        'finite': expansion.finite
+    }
+    if 'max_denominator' in params:
+        best = expansion.best_rational(params['max_denominator'])
+        result['best_rational'] = {
+            'numerator': str(best.numerator), 'denominator': str(best.denominator),
+            'value': float(best), 'max_denominator': params['max_denominator']
+        }
+    return jsonify({
+        'success': True, 'constant': label, 'result': result,
+        'description': '정수 연산으로 계산한 연분수 부분 몫, 수렴값과 최선 유리 근사'
+    })
 
 @math_bp.route('/api/verification/probability')
 def verify_probability_route():
+    params, error = get_int_args({'samples': CLT_CONFIG['max_samples']})
+    if error:
+        return args_error(error, 'probability')
+    if 'samples' in params:
+        params['n_samples'] = params.pop('samples')
+    if 'distribution' in request.args:
+        if request.args['distribution'] not in DISTRIBUTIONS:
+            return args_error(f"distribution must be one of {', '.join(DISTRIBUTIONS)}", 'probability')
+        params['distribution'] = request.args['distribution']
+    return run_verification('probability', params)
+
+@math_bp.route('/api/verification/probability/bayes-grid')
+def bayes_grid_route():
+    """유병률 × 민감도 × 특이도 격자의 사후확률 텐서
+
+    ?prior=, ?sensitivity=, ?specificity= 는 'start:stop:num' 또는 'a,b,c' 형식이다.
+    ?format=npy 이면 텐서를 .npy로 내려받고, ?plots=png 이면 히트맵을 포함한다 (기본 none).
+    """
+    concept = VERIFICATIONS['probability'][0]
+    plot_mode = get_plot_mode('none')
+    if plot_mode is None:
+        return plot_mode_error(concept)
     try:
-        result, plots = probability_verifier.verify_probability_with_visualization()
-        return jsonify({
-            'success': True, 'concept': '확률론 (감☵)', 'result': result,
-            'plots': plots, 'description': '중심극한정리 및 베이즈 정리 시각화'
-        })
-    except Exception as e:
-        return jsonify({'success': False, 'error': str(e), 'concept': '확률론 (감☵)'})
+        axes = [bayes.parse_axis(request.args.get(axis, BAYES_CONFIG['defaults'][axis]),
+                                 BAYES_CONFIG['max_axis_points'])
+                for axis in bayes.AXES]
+    except ValueError as e:
+        return args_error(str(e), 'probability')
+    if math.prod(len(axis) for axis in axes) > BAYES_CONFIG['max_cells']:
+        return args_error(f"grid must have at most {BAYES_CONFIG['max_cells']} cells", 'probability')
+
+    report, plots = probability_verifier.bayes_grid(*axes, plot_mode=plot_mode)
+    if request.args.get('format') == 'npy':
+        return Response(
+            bayes.tensor_to_npy(report['posterior']), mimetype='application/octet-stream',
+            headers={'Content-Disposition': 'attachment; filename=bayes_posterior.npy'}
+        )
+    return jsonify({
+        'success': True, 'concept': concept, 'result': series_to_json(report),
+        'shape': list(report['posterior'].shape), 'plots': encode_plots(plots),
+        'description': '유병률, 민감도, 특이도 격자 전체에 대한 양성 판정 후 질병 확률'
+    })
 
 @math_bp.route('/api/verification/calculus')
 def verify_calculus_route():
-    try:
-        result, plots = calculus_verifier.verify_calculus_with_visualization()
-        return jsonify({
-            'success': True, 'concept': '미적분학 (진☳손☴)', 'result': result,
-            'plots': plots, 'description': '미분과 적분의 기본 원리 및 수치적 검증'
-        })
-    except Exception as e:
-        return jsonify({'success': False, 'error': str(e), 'concept': '미적분학 (진☳손☴)'})
+    params = {}
+    if 'integrand' in request.args:
+        if request.args['integrand'] not in QUADRATURE_CONFIG['integrands']:
+            return args_error(f"integrand must be one of {', '.join(QUADRATURE_CONFIG['integrands'])}", 'calculus')
+        params['integrand'] = request.args['integrand']
+    return run_verification('calculus', params)
 
 @math_bp.route('/api/verification/binary')
 def verify_binary_route():
-    try:
-        result, plots = binary_verifier.verify_binary_with_visualization()
-        return jsonify({
-            'success': True, 'concept': '이진법 (곤☷)', 'result': result,
-            'plots': plots, 'description': '이진수 표현, 논리 게이트 및 이항 분포'
-        })
-    except Exception as e:
-        return jsonify({'success': False, 'error': str(e), 'concept': '이진법 (곤☷)'})
+    return run_verification('binary')
 
 @math_bp.route('/api/verification/primes')
 def verify_primes_route():
-    try:
-        result, plots = primes_verifier.verify_primes_with_visualization()
-        return jsonify({
-            'success': True, 'concept': '소수 (간☶)', 'result': result,
-            'plots': plots, 'description': '에라토스테네스의 체, 소수 정리 및 메르센 소수'
-        })
-    except Exception as e:
-        return jsonify({'success': False, 'error': str(e), 'concept': '소수 (간☶)'})
+    params, error = get_int_args({
+        'limit': SIEVE_CONFIG['max_limit'],
+        'mersenne': PRIMALITY_CONFIG['max_mersenne_exponent'],
+        'gaps': GAP_CONFIG['max_limit']
+    })
+    if error:
+        return args_error(error, 'primes')
+    return run_verification('primes', params)
+
+@math_bp.route('/api/verification/primes/counting')
+def prime_counting_route():
+    """π(10^k) 정확한 값과 x/ln x, li(x) 비교표 (?max_exponent= 최대 k, 10^12까지)"""
+    plot_mode = get_plot_mode()
+    if plot_mode is None:
+        return plot_mode_error(VERIFICATIONS['primes'][0])
+    params, error = get_int_args({'max_exponent': PRIME_COUNTING_CONFIG['max_max_exponent']})
+    if error:
+        return args_error(error, 'primes')
+
+    params = dict(params, plot_mode=plot_mode)
+    return jsonify(run_report(
+        'primes-counting', primes_verifier.prime_counting_table, params, VERIFICATIONS['primes'][0],
+        'Lucy_Hedgehog 알고리즘으로 계산한 π(x)와 소수 정리 근사 x/ln x, li(x)의 상대 오차'
+    ))
 
 @math_bp.route('/api/verification/symmetry')
 def verify_symmetry_route():
-    try:
-        result, plots = symmetry_verifier.verify_symmetry_with_visualization()
-        return jsonify({
-            'success': True, 'concept': '대칭성 (태☱)', 'result': result,
-            'plots': plots, 'description': '기하학적 대칭 변환 및 군론적 대칭성 소개'
-        })
-    except Exception as e:
-        return jsonify({'success': False, 'error': str(e), 'concept': '대칭성 (태☱)'})
+    return run_verification('symmetry')
 
 @math_bp.route('/api/verification/e')
 def verify_e_route():
-    try:
-        result, plots = e_verifier.verify_e_with_visualization()
+    return run_verification('e')
+
+@math_bp.route('/plots/<digest>.png')
+def get_plot(digest):
+    png_bytes = plot_store.get(digest)
+    if png_bytes is None:
+        abort(404)
+    response = Response(png_bytes, mimetype='image/png')
+    response.headers['Cache-Control'] = f"public, max-age={PLOT_STORE_CONFIG['max_age']}, immutable"
+    response.set_etag(digest)
+    return response.make_conditional(request)
+
+@math_bp.route('/api/verification/dashboard')
+def verification_dashboard():
+    """미리 집계한 대시보드 스냅샷 반환 (검증을 직접 실행하지 않음)
+
+    첫 집계가 끝나기 전에는 ready=False와 빈 요약을 즉시 돌려준다.
+    """
+    snapshot = dashboard.snapshot()
+    if snapshot is None:
         return jsonify({
-            'success': True, 'concept': '자연상수 e', 'result': result,
-            'plots': plots, 'description': '자연상수 e의 다양한 정의와 계산 방법 시각화'
+            'success': True, 'ready': False, 'verification_count': 0, 'plot_count': 0,
+            'accuracy': 0, 'summary': [], 'verifications': {}, 'cache': result_cache.stats(),
+            'symbolic': symbolic_pool.stats()
         })
-    except Exception as e:
-        return jsonify({'success': False, 'error': str(e), 'concept': '자연상수 e'})
-
-# @math_bp.route('/api/verification/all')
-# def stream_all_verifications():
-#     verifiers = {
-#         'π (건☰)': pi_verifier.verify_pi_with_visualization,
-#         'φ (리☲)': phi_verifier.verify_golden_ratio_with_visualization,
-#         '확률론 (감☵)': probability_verifier.verify_probability_with_visualization,
-#         '미적분학 (진☳손☴)': calculus_verifier.verify_calculus_with_visualization,
-#         '이진법 (곤☷)': binary_verifier.verify_binary_with_visualization,
-#         '소수 (간☶)': primes_verifier.verify_primes_with_visualization,
-#         '대칭성 (태☱)': symmetry_verifier.verify_symmetry_with_visualization,
-#         '자연상수 e': e_verifier.verify_e_with_visualization
-#     }
-#
-#     def generate_logs():
-#         yield f"data: {json.dumps({'log': '종합 검증을 시작합니다...\n'})}\n\n"
-#         time.sleep(1)
-#
-#         for name, func in verifiers.items():
-#             try:
-#                 yield f"data: {json.dumps({'log': f'\n▶ {name} 검증 중...\n'})}\n\n"
-#                 time.sleep(0.5)
-#                
-#                 with io.StringIO() as captured_output, redirect_stdout(captured_output):
-#                     func() # 검증 함수 실행
-#                     output = captured_output.getvalue()
-#                
-#                 # 캡처된 로그를 한 줄씩 전송
-#                 for line in output.splitlines():
-#                     yield f"data: {json.dumps({'log': line})}\n\n"
-#                     time.sleep(0.05) # 실시간처럼 보이게 약간의 딜레이
-#
-#             except Exception as e:
-#                 error_message = f'오류 발생 ({name}): {str(e)}'
-#                 yield f"data: {json.dumps({'error': error_message})}\n\n"
-#
-#         yield f"data: {json.dumps({'log': '\n\n✅ 모든 검증이 완료되었습니다.'})}\n\n"
-#         yield f"data: [DONE]\n\n" # 스트림 종료 신호
-#
-#     return Response(stream_with_context(generate_logs()), mimetype='text/event-stream')
+    return jsonify(dict(snapshot, success=True, ready=True, age=time.time() - snapshot['generated_at']))
+
+def sse_event(data):
+    return f"data: {json.dumps(data, ensure_ascii=False)}\n\n"
+
+@math_bp.route('/api/verification/all')
+def stream_all_verifications():
+    """모든 검증을 동시에 실행하고 끝나는 순서대로 Server-Sent Events로 전송
+
+    이벤트(data의 'event' 필드): begin, started, finished, error, progress, complete.
+    finished/error에는 소요 시간(duration, 초)이 포함되고 마지막에 [DONE]을 보낸다.
+    클라이언트 연결이 끊기면 아직 시작하지 않은 검증은 취소되고, 실행 중인 검증은 다음 진행 지점
+    (emit, 렌더 풀 대기, 기호 계산)에서 멈추며 finished/error를 보내지 않는다.
+    """
+    plot_mode = get_plot_mode()
+    if plot_mode is None:
+        return plot_mode_error()
+    seed = request.args.get('seed', type=int)
+    names = list(VERIFICATIONS)
+    events = queue.Queue()
+    cancelled = threading.Event()
+
+    def task(name):
+        if cancelled.is_set():
+            return
+        events.put(('started', name, None))
+        start = time.perf_counter()
+        try:
+            # 실행 중인 검증은 emit 지점, 렌더 풀 대기, 기호 계산에서 cancelled를 확인해 멈춤
+            with cancel_scope(cancelled):
+                outcome = timed_verification(name, plot_mode, seed)
+        except CancelledError:
+            return
+        except Exception as e:
+            events.put(('error', name, (str(e), time.perf_counter() - start)))
+            return
+        if not cancelled.is_set():
+            events.put(('finished', name, (outcome, time.perf_counter() - start)))
+
+    executor = ThreadPoolExecutor(max_workers=STREAM_CONFIG['workers'])
+    for name in names:
+        executor.submit(task, name)
+
+    def generate_events():
+        completed = 0
+        stream_start = time.perf_counter()
+        try:
+            yield sse_event({'event': 'begin', 'total': len(names), 'verifications': names})
+            while completed < len(names):
+                try:
+                    kind, name, data = events.get(timeout=STREAM_CONFIG['heartbeat'])
+                except queue.Empty:
+                    # 연결 유지 및 끊긴 클라이언트 감지
+                    yield ": keep-alive\n\n"
+                    continue
+
+                concept = VERIFICATIONS[name][0]
+                if kind == 'started':
+                    yield sse_event({'event': 'started', 'name': name, 'concept': concept})
+                    continue
+
+                completed += 1
+                if kind == 'finished':
+                    (result, plots, cached, used_seed), duration = data
+                    payload = build_payload(name, result, plots, cached, used_seed, plot_mode)
+                    yield sse_event(dict(payload, event='finished', name=name, duration=duration))
+                else:
+                    error, duration = data
+                    yield sse_event({
+                        'event': 'error', 'name': name, 'concept': concept,
+                        'error': error, 'duration': duration
+                    })
+                yield sse_event({
+                    'event': 'progress', 'completed': completed, 'total': len(names),
+                    'percent': completed / len(names) * 100
+                })
+
+            yield sse_event({'event': 'complete', 'duration': time.perf_counter() - stream_start})
+            yield "data: [DONE]\n\n"
+        finally:
+            cancelled.set()
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    return Response(stream_with_context(generate_events()), mimetype='text/event-stream',
+                    headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'})
 
 @math_bp.route('/page/verification')
 def verification_page():
@@ -0,0 +1,100 @@
+"""
+검증 대시보드 집계
+
+요청마다 여덟 개의 검증을 실행하지 않도록, 백그라운드 스레드가 주기적으로
+대시보드 스냅샷(마지막 결과, 오차, 계산 시간, 캐시 적중률)을 미리 만들어 둔다.
+요청은 만들어 둔 스냅샷을 그대로 돌려주므로 캐시가 비어 있어도 즉시 응답한다.
+"""
+
+import logging
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+# 검증 이름 → (괘, 수학적 개념, 결과에서 (검증값, 실제값)을 꺼내는 함수)
+SUMMARY_FIELDS = {
+    'pi': ('건☰', '원주율 π (몬테카를로)',
+           lambda r: (r['monte_carlo'], r['actual'])),
+    'golden-ratio': ('리☲', '황금비 φ (피보나치 비율)',
+                     lambda r: (r['phi_fibonacci'], r['phi_actual'])),
+    'probability': ('감☵', '베이즈 사후확률',
+                    lambda r: (r['posterior'], r['sensitivity'] * r['prior'] / (
+                        r['sensitivity'] * r['prior'] + (1 - r['specificity']) * (1 - r['prior'])))),
+    'calculus': ('진☳손☴', '∫₀³ x² dx (리만 합)',
+                 lambda r: (r['riemann_approximations'][-1], r['analytical_integral'])),
+    'binary': ('곤☷', '4비트 조합수',
+               lambda r: (r['binary_representations']['4비트 조합수'], 2**4)),
+    'primes': ('간☶', 'π(100) vs 100/ln(100)',
+               lambda r: (r['prime_theorem']['이론값 100/ln(100)'], r['prime_theorem']['실제 π(100)'])),
+    'symmetry': ('태☱', '90° 회전 행렬식',
+                 lambda r: (r['transformation_matrices']['Determinant of 90-deg Rotation Matrix'], 1.0)),
+    'e': ('-', '자연상수 e (20항 급수)',
+          lambda r: (r['e_approximations']['급수 (20항)'], r['e_approximations']['NumPy e'])),
+}
+
+
+def is_accurate(name, result, tolerance=0.01):
+    """검증값의 상대 오차가 tolerance 이내인지"""
+    verified, actual = SUMMARY_FIELDS[name][2](result)
+    return abs(float(verified) - float(actual)) <= tolerance * abs(float(actual))
+
+
+def summarize(name, result):
+    """검증 결과를 대시보드 요약 행으로 변환"""
+    trigram, concept, extract = SUMMARY_FIELDS[name]
+    verified, actual = extract(result)
+    return {
+        '괘': trigram,
+        '개념': concept,
+        '검증값': f'{float(verified):.6g}',
+        '실제값': f'{float(actual):.6g}',
+        '오차': f'{abs(float(verified) - float(actual)):.2e}'
+    }
+
+
+class DashboardAggregator:
+    """백그라운드에서 주기적으로 갱신되는 대시보드 스냅샷
+
+    build_snapshot: 스냅샷 dict를 만드는 함수 (백그라운드 스레드에서만 호출)
+    interval: 갱신 주기 (초)
+    갱신 스레드는 첫 snapshot() 호출 때 데몬 스레드로 시작한다.
+    """
+
+    def __init__(self, build_snapshot, interval=10):
+        self.build_snapshot = build_snapshot
+        self.interval = interval
+        self._snapshot = None
+        self._thread = None
+        self._lock = threading.Lock()
+        self._refreshed = threading.Event()
+
+    def start(self):
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name='dashboard-refresh', daemon=True)
+                self._thread.start()
+
+    def snapshot(self):
+        """가장 최근 스냅샷, 아직 없으면 None (기다리지 않음)"""
+        self.start()
+        return self._snapshot
+
+    def wait(self, timeout=None):
+        """첫 스냅샷이 준비될 때까지 대기"""
+        self.start()
+        return self._refreshed.wait(timeout)
+
+    def refresh(self):
+        snapshot = self.build_snapshot()
+        snapshot['generated_at'] = time.time()
+        self._snapshot = snapshot
+        self._refreshed.set()
+
+    def _run(self):
+        while True:
+            try:
+                self.refresh()
+            except Exception:
+                logger.exception("대시보드 갱신 실패")
+            time.sleep(self.interval)
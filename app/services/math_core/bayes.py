@@ -0,0 +1,65 @@
+"""
+베이즈 정리: 진단 검사의 사후확률
+
+P(질병|양성) = 민감도 · 유병률 / (민감도 · 유병률 + (1 − 특이도) · (1 − 유병률))
+
+스칼라와 NumPy 배열 모두 브로드캐스팅으로 계산하며, posterior_grid는
+유병률 × 민감도 × 특이도 격자 전체의 사후확률 텐서를 한 번에 만든다.
+"""
+
+from io import BytesIO
+import numpy as np
+
+# 격자 축 이름 (텐서 차원 순서)
+AXES = ('prior', 'sensitivity', 'specificity')
+
+
+def posterior(prior, sensitivity, specificity):
+    """양성 판정 후 질병 확률 (분모가 0이면 nan)"""
+    prior = np.asarray(prior, dtype=float)
+    true_positive = np.asarray(sensitivity, dtype=float) * prior
+    false_positive = (1 - np.asarray(specificity, dtype=float)) * (1 - prior)
+    evidence = true_positive + false_positive
+    with np.errstate(invalid='ignore', divide='ignore'):
+        result = np.where(evidence > 0, true_positive / evidence, np.nan)
+    return result[()] if result.ndim == 0 else result
+
+
+def posterior_grid(priors, sensitivities, specificities):
+    """사후확률 텐서 (유병률, 민감도, 특이도 순의 3차원 배열)"""
+    return posterior(
+        np.asarray(priors, dtype=float)[:, None, None],
+        np.asarray(sensitivities, dtype=float)[None, :, None],
+        np.asarray(specificities, dtype=float)[None, None, :]
+    )
+
+
+def parse_axis(text, max_points=1000):
+    """격자 축 문자열 → 확률 배열
+
+    'start:stop:num' 은 np.linspace(start, stop, num), 'a,b,c' 는 값 목록이다.
+    모든 값은 [0, 1] 안에 있어야 한다.
+    """
+    try:
+        if ':' in text:
+            start, stop, num = text.split(':')
+            num = int(num)
+            if not 1 <= num <= max_points:
+                raise ValueError(f"number of points must be between 1 and {max_points}")
+            values = np.linspace(float(start), float(stop), num)
+        else:
+            values = np.array([float(value) for value in text.split(',')])
+    except ValueError as e:
+        raise ValueError(f"invalid axis '{text}': {e}") from None
+    if len(values) > max_points:
+        raise ValueError(f"axis '{text}' has more than {max_points} points")
+    if not np.all((values >= 0) & (values <= 1)):
+        raise ValueError(f"axis '{text}' must contain probabilities in [0, 1]")
+    return values
+
+
+def tensor_to_npy(tensor):
+    """배열을 NumPy .npy 바이트로 변환"""
+    buffer = BytesIO()
+    np.save(buffer, tensor)
+    return buffer.getvalue()
@@ -2,25 +2,100 @@
 곤(☷): 이진법 검증 및 시각화 모듈
 """
 
+import time
 import numpy as np
-import matplotlib.pyplot as plt
 import scipy.stats
 from ...services.utils.config import configure_matplotlib
-from ..visualization.base64_encoder import save_plot_to_base64
+from ..utils.events import NullSink
+from ..visualization.base64_encoder import save_plot_to_png
+from ..visualization.figures import create_figure
 
 configure_matplotlib()
 
 class BinaryVerification:
     """이진법 관련 수학적 검증 클래스"""
     
-    def verify_binary_with_visualization(self):
-        """곤(☷): 이진법 검증 및 시각화"""
-        print("\n" + "=" * 50)
-        print("🟤 곤(☷): 이진법 검증 및 시각화")
-        print("=" * 50)
+    def __init__(self, sink=None):
+        self.sink = sink or NullSink()
+    
+    def verify_binary_with_visualization(self, plot_mode='png'):
+        """곤(☷): 이진법 검증 및 시각화
+
+        plot_mode: 'png'(그래프 PNG), 'data'(그래프의 원본 데이터), 'none'(그래프 없음)
+        """
+        start = time.perf_counter()
+        
+        # 베르누이 시행과 이항분포
+        p = 0.6  # 성공 확률
+        n_trials = [5, 10, 20, 50]
+        pmfs = [scipy.stats.binom.pmf(np.arange(0, n+1), n, p) for n in n_trials]
+        
+        # 논리 게이트 진리표
+        gates = {
+            'AND': {'inputs': [(0,0), (0,1), (1,0), (1,1)], 
+                   'outputs': [0, 0, 0, 1]},
+            'OR': {'inputs': [(0,0), (0,1), (1,0), (1,1)], 
+                  'outputs': [0, 1, 1, 1]},
+            'XOR': {'inputs': [(0,0), (0,1), (1,0), (1,1)], 
+                   'outputs': [0, 1, 1, 0]},
+            'NAND': {'inputs': [(0,0), (0,1), (1,0), (1,1)], 
+                    'outputs': [1, 1, 1, 0]}
+        }
+        
+        # 이진 트리 구조 (3레벨) 노드 위치
+        tree_positions = {
+            1: (0.5, 0.9),    # 루트
+            2: (0.25, 0.7), 3: (0.75, 0.7),    # 레벨 1
+            4: (0.125, 0.5), 5: (0.375, 0.5), 6: (0.625, 0.5), 7: (0.875, 0.5),  # 레벨 2
+        }
         
+        # 검증 결과 계산
+        results = {
+            'binary_representations': {
+                '4비트 조합수': 2**4,
+                '8비트 조합수': 2**8,
+                '32비트 조합수': 2**32
+            },
+            'binomial_distribution': {
+                'n=10, p=0.6의 평균': 10 * 0.6,
+                'n=10, p=0.6의 분산': 10 * 0.6 * 0.4,
+                '베르누이 시행 성공확률': 0.6
+            },
+            'logic_gates': {
+                'AND(1,1)': 1,
+                'OR(0,1)': 1,
+                'XOR(1,1)': 0,
+                'NAND(1,1)': 0
+            }
+        }
+        
+        self.sink.emit('binary.computed', duration=time.perf_counter() - start,
+                       n_trials=n_trials, binomial_mean=results['binomial_distribution']['n=10, p=0.6의 평균'])
+
+        if plot_mode == 'png':
+            plots = {
+                'binary_space': self._plot_binary_space(p, n_trials, pmfs, gates, tree_positions)
+            }
+        elif plot_mode == 'data':
+            plots = {
+                'binary_space': {
+                    'codes': [format(i, '04b') for i in range(16)],
+                    'n_trials': np.array(n_trials),
+                    'binomial_pmf': {f'n={n}': pmf for n, pmf in zip(n_trials, pmfs)},
+                    'logic_gates': {name: gate['outputs'] for name, gate in gates.items()},
+                    'tree_positions': {str(node): pos for node, pos in tree_positions.items()}
+                }
+            }
+        else:
+            plots = {}
+        
+        return results, plots
+    
+    def _plot_binary_space(self, p, n_trials, pmfs, gates, tree_positions):
+        """이진법 공간, 이항분포, 논리 게이트, 이진 트리 시각화"""
         # 1. 이진법 공간 시각화 (2^4 = 16가지 조합)
-        fig, ((ax1, ax2), (ax3, ax4)) = plt.subplots(2, 2, figsize=(15, 12))
+        fig = create_figure(figsize=(15, 12))
+        ((ax1, ax2), (ax3, ax4)) = fig.subplots(2, 2)
         
         # 4비트 이진수 시각화
         for i in range(16):
@@ -42,13 +117,9 @@ class BinaryVerification:
         ax1.axis('off')
         
         # 2. 베르누이 시행과 이항분포
-        p = 0.6  # 성공 확률
-        n_trials = [5, 10, 20, 50]
-        
         colors = ['red', 'blue', 'green', 'orange']
-        for i, n in enumerate(n_trials):
+        for i, (n, pmf) in enumerate(zip(n_trials, pmfs)):
             x = np.arange(0, n+1)
-            pmf = scipy.stats.binom.pmf(x, n, p)
             ax2.plot(x, pmf, 'o-', label=f'n={n}', color=colors[i], 
                     markersize=4, alpha=0.8)
         
@@ -59,17 +130,6 @@ class BinaryVerification:
         ax2.grid(True, alpha=0.3)
         
         # 3. 논리 게이트 진리표
-        gates = {
-            'AND': {'inputs': [(0,0), (0,1), (1,0), (1,1)], 
-                   'outputs': [0, 0, 0, 1]},
-            'OR': {'inputs': [(0,0), (0,1), (1,0), (1,1)], 
-                  'outputs': [0, 1, 1, 1]},
-            'XOR': {'inputs': [(0,0), (0,1), (1,0), (1,1)], 
-                   'outputs': [0, 1, 1, 0]},
-            'NAND': {'inputs': [(0,0), (0,1), (1,0), (1,1)], 
-                    'outputs': [1, 1, 1, 0]}
-        }
-        
         gate_names = list(gates.keys())
         colors_gates = ['red', 'blue', 'green', 'orange']
         
@@ -87,13 +147,6 @@ class BinaryVerification:
         ax3.set_ylim(0, 1.2)
         
         # 4. 이진 트리 구조 (3레벨)
-        # 트리 노드 위치 계산
-        tree_positions = {
-            1: (0.5, 0.9),    # 루트
-            2: (0.25, 0.7), 3: (0.75, 0.7),    # 레벨 1
-            4: (0.125, 0.5), 5: (0.375, 0.5), 6: (0.625, 0.5), 7: (0.875, 0.5),  # 레벨 2
-        }
-        
         # 이진 트리 시각화
         for node, (x, y) in tree_positions.items():
             ax4.scatter(x, y, s=300, c='lightblue', edgecolor='black', linewidth=2)
@@ -110,36 +163,5 @@ class BinaryVerification:
         ax4.set_title('Binary Tree Structure (3 levels)')
         ax4.axis('off')
         
-        plt.tight_layout()
-        plot1_base64 = save_plot_to_base64(fig)
-        
-        # 검증 결과 계산
-        results = {
-            'binary_representations': {
-                '4비트 조합수': 2**4,
-                '8비트 조합수': 2**8,
-                '32비트 조합수': 2**32
-            },
-            'binomial_distribution': {
-                'n=10, p=0.6의 평균': 10 * 0.6,
-                'n=10, p=0.6의 분산': 10 * 0.6 * 0.4,
-                '베르누이 시행 성공확률': 0.6
-            },
-            'logic_gates': {
-                'AND(1,1)': 1,
-                'OR(0,1)': 1,
-                'XOR(1,1)': 0,
-                'NAND(1,1)': 0
-            }
-        }
-        
-        plots = {
-            'binary_space': plot1_base64
-        }
-        
-        print(f"📊 이진법 검증 완료:")
-        print(f"   4비트 조합수: {results['binary_representations']['4비트 조합수']}")
-        print(f"   논리 게이트 검증: AND(1,1)={results['logic_gates']['AND(1,1)']}")
-        print(f"   베르누이 평균: {results['binomial_distribution']['n=10, p=0.6의 평균']}")
-        
-        return results, plots
+        fig.tight_layout()
+        return save_plot_to_png(fig)
@@ -2,44 +2,153 @@
 진(☳)손(☴): 미적분학 검증 및 시각화 모듈
 """
 
+import time
 import numpy as np
-import matplotlib.pyplot as plt
-import sympy as sp
+from matplotlib.patches import Rectangle
 from math import pi, e
-from ..utils.config import MATH_CONSTANTS, PLOT_CONFIG
-from ..visualization.base64_encoder import save_plot_to_base64
+from ..utils.config import MATH_CONSTANTS, PLOT_CONFIG, QUADRATURE_CONFIG
+from ..utils.events import NullSink
+from .estimators import ESTIMATORS, convergence
+from . import quadrature
+from .expressions import compile_expression
+from ..visualization.base64_encoder import save_plot_to_png
+from ..visualization.convergence_plot import plot_estimator_convergence
+from ..visualization.figures import create_figure
 from ...services.utils.config import configure_matplotlib
 
 configure_matplotlib()
 
 class CalculusVerification:
     """미적분학 검증 클래스"""
-    
-    def __init__(self):
+
+    def __init__(self, sink=None):
+        self.sink = sink or NullSink()
         self.results = {}
         self.plots = {}
-    
-    def verify_calculus_with_visualization(self):
-        """진(☳): 미분, 손(☴): 적분 검증 및 시각화"""
-        print("\\n" + "=" * 50)
-        print("📈 진(☳)손(☴): 미적분학 검증 및 시각화")
-        print("=" * 50)
-        
-        # 1. 미분 검증 - f(x) = x³
-        x = sp.Symbol('x')
-        f = x**3
-        f_prime = sp.diff(f, x)  # 3x²
-        
+
+    def verify_calculus_with_visualization(self, plot_mode='png', integrand=QUADRATURE_CONFIG['integrand']):
+        """진(☳): 미분, 손(☴): 적분 검증 및 시각화
+
+        plot_mode: 'png'(그래프 PNG), 'data'(그래프의 원본 데이터), 'none'(그래프 없음)
+        integrand: 구적법 비교에 쓸 적분 이름 (QUADRATURE_CONFIG['integrands'])
+        """
+        start = time.perf_counter()
+
+        # 1. 미분 검증 - f(x) = x³ (식 캐시의 도함수와 컴파일된 NumPy 함수 사용)
+        f = compile_expression('x**3')
+
         # 수치적 미분과 해석적 미분 비교
         x_vals = np.linspace(-2, 2, 100)
         h_vals = [0.1, 0.01, 0.001, 0.0001]
-        
-        fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(15, 6))
-        
+
         # 원함수와 도함수
-        y_vals = x_vals**3
-        y_prime_vals = 3 * x_vals**2
-        
+        y_vals = f(x_vals)
+        y_prime_vals = f.derivative_function(x_vals)
+
+        # 수치적 미분 오차 분석: (x, h) 격자 전체를 한 번에 계산
+        x_test = 1.0
+        analytical_derivative = float(f.derivative_function(x_test))  # x=1에서 f'(x) = 3
+        errors = np.abs(f.central_difference(x_test, h_vals) - analytical_derivative).tolist()
+        grid_errors = np.abs(f.central_difference(x_vals[:, None], np.array(h_vals)[None, :])
+                             - y_prime_vals[:, None])
+        max_errors = grid_errors.max(axis=0).tolist()
+
+        # 2. 적분 검증 - ∫x²dx from 0 to 3 (기본정리 F(3) − F(0), x³/3 = 9)
+        x_squared = compile_expression('x**2')
+        analytical_integral = x_squared.definite_integral(0, 3)
+
+        # 리만 합으로 수치적 적분 (청크 단위 벡터화, n = 10^7까지)
+        a, b = 0, 3
+        n_subdivisions = QUADRATURE_CONFIG['riemann_subdivisions']
+        riemann_sums = [quadrature.left_riemann(x_squared, a, b, n)[0] for n in n_subdivisions]
+
+        # 3. 구적법 비교: 규칙별 함수 평가 횟수 대비 오차와 수렴 차수
+        expression, low, high = QUADRATURE_CONFIG['integrands'][integrand]
+        benchmark_integrand = compile_expression(expression)
+        exact = float(benchmark_integrand.definite_integral(low, high))
+        quadrature_report = {
+            'integrand': expression,
+            'interval': [float(low), float(high)],
+            'exact': exact,
+            'rules': quadrature.benchmark(benchmark_integrand, float(low), float(high), exact)
+        }
+
+        self.sink.emit('calculus.computed', duration=time.perf_counter() - start,
+                       analytical_integral=float(analytical_integral),
+                       riemann_sum=riemann_sums[-1],
+                       integral_error=abs(riemann_sums[-1] - float(analytical_integral)),
+                       derivative_errors=errors)
+
+        # 결과 저장
+        results = {
+            'analytical_integral': float(analytical_integral),
+            'riemann_approximations': riemann_sums,
+            'subdivisions': n_subdivisions,
+            'final_error': abs(riemann_sums[-1] - float(analytical_integral)),
+            'derivative': str(f.derivative),
+            'derivative_errors': errors,
+            'max_derivative_errors': max_errors,
+            'quadrature': quadrature_report
+        }
+
+        if plot_mode == 'png':
+            plots = {
+                'derivative_analysis': self._plot_derivative(x_vals, y_vals, y_prime_vals, h_vals, errors),
+                'integration_convergence': self._plot_integration(a, b, quadrature_report)
+            }
+        elif plot_mode == 'data':
+            plots = {
+                'derivative_analysis': {
+                    'x': x_vals,
+                    'f': y_vals,
+                    'f_prime': y_prime_vals,
+                    'h': np.array(h_vals),
+                    'errors': np.array(errors)
+                },
+                'integration_convergence': {
+                    'subdivisions': np.array(n_subdivisions),
+                    'riemann_sums': np.array(riemann_sums),
+                    'analytical_integral': float(analytical_integral),
+                    'quadrature': {
+                        rule: {'evaluations': np.array(runs['evaluations']), 'errors': np.array(runs['errors'])}
+                        for rule, runs in quadrature_report['rules'].items()
+                    }
+                }
+            }
+        else:
+            plots = {}
+
+        self.results['calculus'] = results
+        self.plots['calculus'] = plots
+        return results, plots
+
+    def compare_estimators(self, methods=ESTIMATORS, seed=None, plot_mode='png'):
+        """∫₀³ x² dx = 9 에 대한 추정기별 표본 수 대비 오차 (리만 합의 확률적 대안)
+
+        methods: 비교할 추정기 (pseudo, sobol, halton, antithetic, stratified)
+        plot_mode: 'png'(그래프 PNG), 'data'(그래프의 원본 데이터), 'none'(그래프 없음)
+        """
+        start = time.perf_counter()
+        report = convergence(lambda points: points[:, 0]**2, (0,), (3,), 9.0, methods, seed=seed)
+        self.sink.emit('calculus.estimators', duration=time.perf_counter() - start,
+                       rmse={method: runs['rmse'][-1] for method, runs in report.items()})
+
+        if plot_mode == 'png':
+            plots = {'estimator_convergence': plot_estimator_convergence(report, '∫₀³ x² dx Estimators: RMSE vs Number of Samples')}
+        elif plot_mode == 'data':
+            plots = {'estimator_convergence': {
+                method: {'samples': np.array(runs['samples']), 'rmse': np.array(runs['rmse'])}
+                for method, runs in report.items()
+            }}
+        else:
+            plots = {}
+        return report, plots
+
+    def _plot_derivative(self, x_vals, y_vals, y_prime_vals, h_vals, errors):
+        """시각화 1: 함수와 도함수, 수치 미분 오차"""
+        fig = create_figure(figsize=(15, 6))
+        ax1, ax2 = fig.subplots(1, 2)
+
         ax1.plot(x_vals, y_vals, 'b-', linewidth=2, label='f(x) = x³')
         ax1.plot(x_vals, y_prime_vals, 'r-', linewidth=2, label="f'(x) = 3x²")
         ax1.set_xlabel('x')
@@ -47,99 +156,59 @@ class CalculusVerification:
         ax1.set_title('Function and its Derivative')
         ax1.legend()
         ax1.grid(True, alpha=0.3)
-        
-        # 수치적 미분 오차 분석
-        x_test = 1.0
-        analytical_derivative = 3 * x_test**2  # x=1에서 f'(x) = 3
-        
-        errors = []
-        for h in h_vals:
-            numerical_derivative = (f.subs(x, x_test + h) - f.subs(x, x_test - h)) / (2 * h)
-            error = abs(float(numerical_derivative) - analytical_derivative)
-            errors.append(error)
-        
+
         ax2.loglog(h_vals, errors, 'go-', linewidth=2, markersize=8)
         ax2.set_xlabel('h (Interval)')
         ax2.set_ylabel('Absolute Error')
         ax2.set_title('Error of Numerical Differentiation (at x=1)')
         ax2.grid(True, alpha=0.3)
-        
-        plt.tight_layout()
-        plot1_base64 = save_plot_to_base64(fig)
-        
-        # 2. 적분 검증 - ∫x²dx from 0 to 3
-        integrand = x**2
-        analytical_integral = sp.integrate(integrand, (x, 0, 3))  # x³/3 = 9
-        
-        # 리만 합으로 수치적 적분
-        a, b = 0, 3
-        n_subdivisions = [10, 50, 100, 500]
-        
-        fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(15, 6))
-        
+
+        fig.tight_layout()
+        return save_plot_to_png(fig)
+
+    def _plot_integration(self, a, b, quadrature_report):
+        """시각화 2: 리만 합과 구적법 규칙별 수렴 차수"""
+        fig = create_figure(figsize=(15, 6))
+        ax1, ax2 = fig.subplots(1, 2)
+
         # 리만 합 시각화 (n=20)
         n_demo = 20
         dx = (b - a) / n_demo
         x_riemann = np.linspace(a, b, n_demo + 1)
-        y_riemann = x_riemann**2
-        
+
         x_smooth = np.linspace(a, b, 200)
         y_smooth = x_smooth**2
-        
+
         ax1.plot(x_smooth, y_smooth, 'b-', linewidth=2, label='f(x) = x²')
-        
+
         # 리만 사각형 그리기
         for i in range(n_demo):
             x_left = x_riemann[i]
-            x_right = x_riemann[i + 1]
             y_height = x_left**2  # 왼쪽 끝점 사용
-            
-            rect = plt.Rectangle((x_left, 0), dx, y_height, 
-                               alpha=0.3, facecolor='red', edgecolor='black')
+
+            rect = Rectangle((x_left, 0), dx, y_height,
+                             alpha=0.3, facecolor='red', edgecolor='black')
             ax1.add_patch(rect)
-        
+
         ax1.set_xlabel('x')
         ax1.set_ylabel('f(x)')
         ax1.set_title(f'Riemann Sum (n={n_demo})')
         ax1.legend()
         ax1.grid(True, alpha=0.3)
-        
-        # 수렴성 분석
-        riemann_sums = []
-        for n in n_subdivisions:
-            dx = (b - a) / n
-            x_points = np.linspace(a, b - dx, n)
-            riemann_sum = sum(x_i**2 * dx for x_i in x_points)
-            riemann_sums.append(riemann_sum)
-        
-        ax2.plot(n_subdivisions, riemann_sums, 'ro-', linewidth=2, markersize=8, label='Riemann Sum')
-        ax2.axhline(y=float(analytical_integral), color='g', linestyle='--', 
-                   linewidth=2, label=f'Analytical Value = {float(analytical_integral):.3f}')
-        ax2.set_xlabel('Number of Subdivisions (n)')
-        ax2.set_ylabel('Integral Value')
-        ax2.set_title('Convergence of Riemann Sum')
-        ax2.legend()
+
+        # 수렴성 분석: 함수 평가 횟수 대비 오차 (오차 0은 표시하지 않음)
+        for rule, runs in quadrature_report['rules'].items():
+            errors = np.array(runs['errors'])
+            order = runs['convergence_order']
+            label = f'{rule} (order {order:.2f})' if order is not None else f'{rule} (exact)'
+            ax2.loglog(runs['evaluations'], np.where(errors > 0, errors, np.nan), 'o-',
+                       linewidth=1.5, markersize=4, label=label)
+        ax2.set_xlabel('Function Evaluations')
+        ax2.set_ylabel('Absolute Error')
+        low, high = quadrature_report['interval']
+        ax2.set_title(f"Quadrature Convergence: ∫ {quadrature_report['integrand']} dx on [{low:g}, {high:g}]")
+        ax2.legend(fontsize=8)
         ax2.grid(True, alpha=0.3)
-        
-        plt.tight_layout()
-        plot2_base64 = save_plot_to_base64(fig)
-        
-        print(f"\\n📊 미적분 검증 결과:")
-        print(f"해석적 적분값: {float(analytical_integral):.6f}")
-        print(f"리만 합 근사값 (n=500): {riemann_sums[-1]:.6f}")
-        print(f"오차: {abs(riemann_sums[-1] - float(analytical_integral)):.6f}")
-        
-        # 결과 저장
-        self.results['calculus'] = {
-            'analytical_integral': float(analytical_integral),
-            'riemann_approximations': riemann_sums,
-            'subdivisions': n_subdivisions,
-            'final_error': abs(riemann_sums[-1] - float(analytical_integral))
-        }
-        
-        self.plots['calculus'] = {
-            'derivative_analysis': plot1_base64,
-            'integration_convergence': plot2_base64
-        }
-        
-        return self.results['calculus'], self.plots['calculus']
+
+        fig.tight_layout()
+        return save_plot_to_png(fig)
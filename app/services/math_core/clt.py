@@ -0,0 +1,107 @@
+"""
+중심극한정리 시뮬레이터
+
+표본 크기마다 (표본 수, 표본 크기) 블록을 한 번에 뽑아 행별 평균을 구하고,
+표본평균을 모아 두지 않고 고정된 구간의 히스토그램 개수만 누적한다.
+블록의 원소 수가 block_elements로 제한되므로 표본평균이 10^6개를 넘어도
+메모리 사용량이 일정하다.
+
+원본 분포는 균등, 지수, 베르누이와 반례인 코시 분포를 지원한다.
+분산이 유한하면 표본평균은 N(μ, σ²/n)에 가까워지고, 코시 분포의 표본평균은
+n과 관계없이 표준 코시 분포를 따른다. 히스토그램 구간 경계에서 잰
+경험 누적분포와 극한 분포의 최대 차이(콜모고로프 거리)로 수렴 정도를 나타낸다.
+"""
+
+from math import inf, sqrt
+import numpy as np
+import scipy.stats
+
+# 한 블록에서 생성하는 최대 원소 수 (float64 기준 약 32MB)
+DEFAULT_BLOCK_ELEMENTS = 2**22
+
+BERNOULLI_P = 0.3
+
+# 코시 분포 히스토그램 범위 (표준 코시 분포 질량의 약 94%)
+CAUCHY_RANGE = 10.0
+
+# 이름 → (블록 표본 생성 함수, 평균, 표준편차, 지지집합). 코시 분포는 평균과 분산이 없다.
+DISTRIBUTIONS = {
+    'uniform': (lambda rng, shape: rng.random(shape), 0.5, sqrt(1 / 12), (0.0, 1.0)),
+    'exponential': (lambda rng, shape: rng.standard_exponential(shape), 1.0, 1.0, (0.0, inf)),
+    'bernoulli': (lambda rng, shape: rng.random(shape) < BERNOULLI_P,
+                  BERNOULLI_P, sqrt(BERNOULLI_P * (1 - BERNOULLI_P)), (0.0, 1.0)),
+    'cauchy': (lambda rng, shape: rng.standard_cauchy(shape), None, None, (-inf, inf)),
+}
+
+
+def limit_distribution(distribution, sample_size):
+    """크기 sample_size인 표본평균의 극한(근사) 분포 (scipy frozen 분포)"""
+    _, mean, std, _ = DISTRIBUTIONS[distribution]
+    if mean is None:
+        # 코시 분포는 안정 분포라 표본평균도 같은 분포
+        return scipy.stats.cauchy()
+    return scipy.stats.norm(mean, std / sqrt(sample_size))
+
+
+def histogram_edges(distribution, sample_size, bins=50):
+    """표본평균 히스토그램의 고정 구간 (μ ± 6σ/√n 을 지지집합으로 자름)"""
+    _, mean, std, (low, high) = DISTRIBUTIONS[distribution]
+    if mean is None:
+        return np.linspace(-CAUCHY_RANGE, CAUCHY_RANGE, bins + 1)
+    spread = 6 * std / sqrt(sample_size)
+    return np.linspace(max(low, mean - spread), min(high, mean + spread), bins + 1)
+
+
+def simulate_sample_means(distribution, sample_size, n_samples, rng, bins=50,
+                          block_elements=DEFAULT_BLOCK_ELEMENTS):
+    """표본평균 n_samples개의 스트리밍 히스토그램
+
+    반환: 구간 경계, 구간별 개수, 범위 밖 개수, 표본평균의 평균/표준편차,
+    이론값, 극한 분포와의 콜모고로프 거리 (구간 경계에서 측정)
+    """
+    if distribution not in DISTRIBUTIONS:
+        raise ValueError(f"unknown distribution: {distribution}")
+    draw, mean, std, _ = DISTRIBUTIONS[distribution]
+    edges = histogram_edges(distribution, sample_size, bins)
+    rows = max(1, block_elements // sample_size)
+
+    counts = np.zeros(bins, dtype=np.int64)
+    underflow = overflow = 0
+    total = total_sq = 0.0
+    done = 0
+    while done < n_samples:
+        size = min(rows, n_samples - done)
+        means = draw(rng, (size, sample_size)).mean(axis=1)
+        counts += np.histogram(means, edges)[0]
+        underflow += int(np.count_nonzero(means < edges[0]))
+        overflow += int(np.count_nonzero(means > edges[-1]))
+        total += float(means.sum())
+        total_sq += float(np.dot(means, means))
+        done += size
+
+    empirical_mean = total / n_samples
+    empirical_std = sqrt(max(total_sq / n_samples - empirical_mean**2, 0.0))
+
+    # 구간 경계에서의 경험 누적분포 (np.histogram의 마지막 구간은 오른쪽 끝 포함)
+    empirical_cdf = (underflow + np.concatenate([[0], np.cumsum(counts)])) / n_samples
+    limit = limit_distribution(distribution, sample_size)
+    ks_distance = float(np.max(np.abs(empirical_cdf - limit.cdf(edges))))
+
+    return {
+        'sample_size': sample_size,
+        'n_samples': n_samples,
+        'bin_edges': edges,
+        'counts': counts,
+        'underflow': underflow,
+        'overflow': overflow,
+        'mean': empirical_mean,
+        'std': empirical_std,
+        'theoretical_mean': mean,
+        'theoretical_std': None if std is None else std / sqrt(sample_size),
+        'ks_distance': ks_distance
+    }
+
+
+def density(histogram):
+    """스트리밍 히스토그램의 확률밀도 (전체 표본 수로 정규화)"""
+    return histogram['counts'] / (histogram['n_samples'] * np.diff(histogram['bin_edges']))
@@ -0,0 +1,203 @@
+"""
+연분수 전개와 수렴값
+
+MATH_CONSTANTS의 상수(π, e, φ, √2)와 사용자가 준 유리수 p/q, 이차 무리수 (P + √D)/Q의
+부분 몫과 수렴값 pₖ/qₖ를 정수 연산만으로 계산한다.
+전개마다 부분 몫과 수렴값을 접두사 단위로 캐시하므로, 더 깊은 요청은
+이미 계산한 접두사에 이어서만 계산한다.
+
+- 유리수: 유클리드 호제법 (유한)
+- 이차 무리수: (P, Q) 점화식 (주기적, 무한)
+- e: [2; 1, 2, 1, 1, 4, 1, ...] 규칙
+- π: mpmath의 π 하한/상한 두 유리수의 공통 부분 몫 (정밀도를 두 배씩 늘려 이어감)
+"""
+
+import math
+import threading
+from fractions import Fraction
+from functools import lru_cache
+from mpmath.libmp import mpf_pi, round_ceiling, round_floor
+
+# 부분 몫 하나당 필요한 비트 수 (레비 상수: 2·log₂ e^(π²/12 ln 2) ≈ 3.42)
+BITS_PER_TERM = 3.5
+
+# 스트리밍 반복자가 한 번에 늘리는 항 수
+CHUNK_TERMS = 256
+
+
+def rational_quotients(p, q):
+    """p/q의 부분 몫 (유클리드 호제법)"""
+    while q:
+        a, r = divmod(p, q)
+        yield a
+        p, q = q, r
+
+
+def quadratic_quotients(P, D, Q):
+    """이차 무리수 (P + √D)/Q 의 부분 몫 (D는 제곱수가 아닌 양의 정수)"""
+    if (D - P * P) % Q:
+        # 점화식이 정수로 유지되도록 Q | D − P² 가 되게 조정
+        P, D, Q = P * abs(Q), D * Q * Q, Q * abs(Q)
+    root = math.isqrt(D)
+    while True:
+        # √D는 정수가 아니므로 floor((P + √D)/Q) 를 정수 연산으로 구함
+        a = (P + root) // Q if Q > 0 else (P + root + 1) // Q
+        yield a
+        P = a * Q - P
+        Q = (D - P * P) // Q
+
+
+def e_quotients():
+    """e = [2; 1, 2, 1, 1, 4, 1, 1, 6, ...]"""
+    yield 2
+    k = 1
+    while True:
+        yield 1
+        yield 2 * k
+        yield 1
+        k += 1
+
+
+def _to_fraction(value):
+    sign, man, exp, _ = value
+    result = Fraction(man * 2**exp) if exp >= 0 else Fraction(man, 2**-exp)
+    return -result if sign else result
+
+
+def pi_quotients(initial_terms=64):
+    """π의 부분 몫
+
+    π의 하한과 상한(이진 유리수)을 전개해 공통 접두사만 내보낸다.
+    구간 안의 모든 수가 그 접두사를 공유하므로 참값의 부분 몫과 같다
+    (경계가 유한 전개로 끝나는 경우를 피해 마지막 공통 항은 버린다).
+    더 필요하면 정밀도를 두 배로 늘려 이어서 내보낸다.
+    """
+    terms, emitted = initial_terms, 0
+    while True:
+        prec = int(terms * BITS_PER_TERM) + 64
+        lower = _to_fraction(mpf_pi(prec, round_floor))
+        upper = _to_fraction(mpf_pi(prec, round_ceiling))
+
+        prefix = []
+        for a, b in zip(rational_quotients(lower.numerator, lower.denominator),
+                        rational_quotients(upper.numerator, upper.denominator)):
+            if a != b:
+                break
+            prefix.append(a)
+        yield from prefix[emitted:-1]
+        emitted = max(emitted, len(prefix) - 1)
+        terms *= 2
+
+
+CONSTANT_SOURCES = {
+    'pi': pi_quotients,
+    'e': e_quotients,
+    'golden_ratio': lambda: quadratic_quotients(1, 5, 2),
+    'sqrt_2': lambda: quadratic_quotients(0, 2, 1),
+}
+
+
+class ContinuedFraction:
+    """부분 몫과 수렴값을 접두사 단위로 캐시하는 연분수 전개"""
+
+    def __init__(self, source):
+        self._source = source
+        self._quotients = []
+        # p₋₂/q₋₂ = 0/1, p₋₁/q₋₁ = 1/0 에서 시작하는 수렴값 점화식
+        self._convergents = [(0, 1), (1, 0)]
+        self.finite = False
+        self._lock = threading.Lock()
+
+    def _extend(self, n_terms):
+        with self._lock:
+            while len(self._quotients) < n_terms and not self.finite:
+                a = next(self._source, None)
+                if a is None:
+                    self.finite = True
+                    break
+                (p0, q0), (p1, q1) = self._convergents[-2:]
+                self._quotients.append(a)
+                self._convergents.append((a * p1 + p0, a * q1 + q0))
+
+    def quotients(self, n_terms):
+        """처음 n_terms개의 부분 몫 (유한 전개면 더 적을 수 있음)"""
+        self._extend(n_terms)
+        return self._quotients[:n_terms]
+
+    def convergents(self, n_terms):
+        """처음 n_terms개의 수렴값 (pₖ, qₖ)"""
+        self._extend(n_terms)
+        return self._convergents[2:n_terms + 2]
+
+    def iter_convergents(self, start=0):
+        """(k, aₖ, pₖ, qₖ)를 차례로 내보내는 스트리밍 반복자 (CHUNK_TERMS개씩 캐시를 늘림)"""
+        k = start
+        while True:
+            if k >= len(self._quotients):
+                self._extend(k + CHUNK_TERMS)
+                if k >= len(self._quotients):
+                    return
+            p, q = self._convergents[k + 2]
+            yield k, self._quotients[k], p, q
+            k += 1
+
+    def best_rational(self, max_denominator):
+        """분모가 max_denominator 이하인 가장 가까운 유리수
+
+        마지막으로 분모 한도 안에 드는 수렴값과 그 다음 중간 수렴값
+        (pₖ₋₁ + t·pₖ)/(qₖ₋₁ + t·qₖ) 중 참값에 더 가까운 것이 답이다.
+        참값 대신 분모가 (2·max_denominator)²를 넘는 수렴값과 비교한다.
+        """
+        if max_denominator < 1:
+            raise ValueError("max_denominator must be at least 1")
+        (p0, q0), (p1, q1) = (0, 1), (1, 0)
+        for k, a, p, q in self.iter_convergents():
+            if q > max_denominator:
+                break
+            (p0, q0), (p1, q1) = (p1, q1), (p, q)
+        else:
+            return Fraction(p1, q1)
+
+        reference = Fraction(p, q)
+        for k, a, p, q in self.iter_convergents(k + 1):
+            reference = Fraction(p, q)
+            if q > 4 * max_denominator**2:
+                break
+
+        t = (max_denominator - q0) // q1
+        semiconvergent = Fraction(p0 + t * p1, q0 + t * q1)
+        convergent = Fraction(p1, q1)
+        if abs(semiconvergent - reference) < abs(convergent - reference):
+            return semiconvergent
+        return convergent
+
+
+@lru_cache(maxsize=None)
+def constant(name):
+    """MATH_CONSTANTS 이름(pi, e, golden_ratio, sqrt_2)의 공유 전개"""
+    if name not in CONSTANT_SOURCES:
+        raise ValueError(f"unknown constant: {name}")
+    return ContinuedFraction(CONSTANT_SOURCES[name]())
+
+
+def rational(p, q=1):
+    """유리수 p/q의 전개 (기약분수로 정규화해 캐시)"""
+    if q == 0:
+        raise ValueError("denominator must be non-zero")
+    value = Fraction(p, q)
+    return _rational(value.numerator, value.denominator)
+
+
+@lru_cache(maxsize=256)
+def _rational(p, q):
+    return ContinuedFraction(rational_quotients(p, q))
+
+
+@lru_cache(maxsize=256)
+def quadratic(P, D, Q):
+    """이차 무리수 (P + √D)/Q 의 전개"""
+    if Q == 0:
+        raise ValueError("Q must be non-zero")
+    if D <= 0 or math.isqrt(D)**2 == D:
+        raise ValueError("D must be a positive non-square integer")
+    return ContinuedFraction(quadratic_quotients(P, D, Q))
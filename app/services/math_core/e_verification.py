@@ -2,16 +2,22 @@
 자연상수 e 검증 및 시각화 모듈
 """
 
+from time import perf_counter
 import numpy as np
-import matplotlib.pyplot as plt
+from matplotlib import colormaps
 from ...services.utils.config import configure_matplotlib
-from ...services.visualization.base64_encoder import save_plot_to_base64
+from ...services.utils.events import NullSink
+from ...services.visualization.base64_encoder import save_plot_to_png
+from ...services.visualization.figures import create_figure
 
 configure_matplotlib()
 
 class EVerification:
     """자연상수 e 관련 수학적 검증 클래스"""
     
+    def __init__(self, sink=None):
+        self.sink = sink or NullSink()
+    
     def factorial(self, n):
         """팩토리얼 계산"""
         if n <= 1:
@@ -26,20 +32,102 @@ class EVerification:
         """e = lim(n→∞) (1 + 1/n)^n 근사"""
         return (1 + 1/n) ** n
     
-    def verify_e_with_visualization(self):
-        """자연상수 e 검증 및 시각화"""
-        print("\n" + "=" * 50)
-        print("📈 자연상수 e 검증 및 시각화")
-        print("=" * 50)
+    def verify_e_with_visualization(self, plot_mode='png'):
+        """자연상수 e 검증 및 시각화
+
+        plot_mode: 'png'(그래프 PNG), 'data'(그래프의 원본 데이터), 'none'(그래프 없음)
+        """
+        start = perf_counter()
         
         # 1. 다양한 방법으로 e 근사
-        fig, ((ax1, ax2), (ax3, ax4)) = plt.subplots(2, 2, figsize=(15, 12))
-        
         # 급수 근사: e = Σ(1/n!)
         n_terms = range(1, 21)
         series_values = [self.e_series_approximation(n) for n in n_terms]
+        
+        # 극한 근사: e = lim(n→∞) (1 + 1/n)^n
+        n_values = np.logspace(1, 6, 100)  # 10^1 to 10^6
+        limit_values = [self.e_limit_approximation(n) for n in n_values]
+        
+        # 2. 복리 계산과 연속 복리
+        # P(1 + r/n)^(nt) vs Pe^(rt)
+        principal = 1000  # 원금
+        rate = 0.05  # 연 5% 이자율
+        time = 10  # 10년
+        
+        n_compounds = [1, 2, 4, 12, 52, 365, 8760, np.inf]  # 연, 반기, 분기, 월, 주, 일, 시간, 연속
+        compound_names = ['Annual', 'Semi-annual', 'Quarterly', 'Monthly', 'Weekly', 'Daily', 'Hourly', 'Continuous']
+        final_amounts = []
+        
+        for n in n_compounds[:-1]:
+            amount = principal * (1 + rate/n) ** (n * time)
+            final_amounts.append(amount)
+        
+        # 연속 복리: Pe^(rt)
+        continuous_amount = principal * np.exp(rate * time)
+        final_amounts.append(continuous_amount)
+        
+        # 검증 결과 계산
+        e_approximations = {
+            '급수 (20항)': self.e_series_approximation(20),
+            '극한 (n=1000000)': self.e_limit_approximation(1000000),
+            'NumPy e': np.e,
+            '오일러 공식': complex(np.exp(1j * np.pi) + 1).real  # e^(iπ) + 1 = 0
+        }
+        
+        results = {
+            'e_approximations': e_approximations,
+            'convergence': {
+                '급수 수렴속도': '매우 빠름 (factorial!)',
+                '극한 수렴속도': '느림 (1/n)',
+                '20항 급수 오차': abs(e_approximations['급수 (20항)'] - np.e)
+            },
+            'applications': {
+                '연속복리 최종금액': continuous_amount,
+                '일복리 vs 연속복리 차이': continuous_amount - final_amounts[-2],
+                'e의 역수 (1/e)': 1/np.e
+            },
+            'mathematical_properties': {
+                'e^1': np.exp(1),
+                'ln(e)': np.log(np.e),
+                'e^(iπ) + 1': abs(complex(np.exp(1j * np.pi) + 1))  # Should be 0
+            }
+        }
+        
+        self.sink.emit('e.computed', duration=perf_counter() - start,
+                       series_error=results['convergence']['20항 급수 오차'],
+                       limit_error=abs(e_approximations['극한 (n=1000000)'] - np.e))
+
+        if plot_mode == 'png':
+            plots = {
+                'e_analysis': self._plot_e_analysis(
+                    n_terms, series_values, n_values, limit_values,
+                    compound_names, final_amounts, principal, rate, time
+                )
+            }
+        elif plot_mode == 'data':
+            plots = {
+                'e_analysis': {
+                    'series_terms': np.array(n_terms),
+                    'series_values': np.array(series_values),
+                    'limit_n': n_values,
+                    'limit_values': np.array(limit_values),
+                    'compound_periods': compound_names,
+                    'final_amounts': np.array(final_amounts)
+                }
+            }
+        else:
+            plots = {}
+        
+        return results, plots
+    
+    def _plot_e_analysis(self, n_terms, series_values, n_values, limit_values,
+                         compound_names, final_amounts, principal, rate, time):
+        """급수/극한 근사, 지수·로그 함수, 복리 효과 시각화"""
+        fig = create_figure(figsize=(15, 12))
+        ((ax1, ax2), (ax3, ax4)) = fig.subplots(2, 2)
         actual_e = np.e
         
+        # 급수 근사: e = Σ(1/n!)
         ax1.plot(n_terms, series_values, 'bo-', label='Series Approximation', markersize=4)
         ax1.axhline(y=actual_e, color='red', linestyle='--', linewidth=2, label=f'Actual e = {actual_e:.6f}')
         ax1.set_xlabel('Number of Terms (n)')
@@ -50,9 +138,6 @@ class EVerification:
         ax1.set_ylim(2.0, 2.8)
         
         # 극한 근사: e = lim(n→∞) (1 + 1/n)^n
-        n_values = np.logspace(1, 6, 100)  # 10^1 to 10^6
-        limit_values = [self.e_limit_approximation(n) for n in n_values]
-        
         ax2.semilogx(n_values, limit_values, 'g-', linewidth=2, label='Limit Approximation')
         ax2.axhline(y=actual_e, color='red', linestyle='--', linewidth=2, label=f'Actual e = {actual_e:.6f}')
         ax2.set_xlabel('n (log scale)')
@@ -62,7 +147,7 @@ class EVerification:
         ax2.grid(True, alpha=0.3)
         ax2.set_ylim(2.7, 2.73)
         
-        # 2. 지수함수와 자연로그
+        # 지수함수와 자연로그
         x = np.linspace(-2, 3, 1000)
         y_exp = np.exp(x)
         y_ln = np.log(x[x > 0])
@@ -84,25 +169,8 @@ class EVerification:
         ax3.legend()
         ax3.grid(True, alpha=0.3)
         
-        # 3. 복리 계산과 연속 복리
-        # P(1 + r/n)^(nt) vs Pe^(rt)
-        principal = 1000  # 원금
-        rate = 0.05  # 연 5% 이자율
-        time = 10  # 10년
-        
-        n_compounds = [1, 2, 4, 12, 52, 365, 8760, np.inf]  # 연, 반기, 분기, 월, 주, 일, 시간, 연속
-        compound_names = ['Annual', 'Semi-annual', 'Quarterly', 'Monthly', 'Weekly', 'Daily', 'Hourly', 'Continuous']
-        final_amounts = []
-        
-        for n in n_compounds[:-1]:
-            amount = principal * (1 + rate/n) ** (n * time)
-            final_amounts.append(amount)
-        
-        # 연속 복리: Pe^(rt)
-        continuous_amount = principal * np.exp(rate * time)
-        final_amounts.append(continuous_amount)
-        
-        colors = plt.cm.viridis(np.linspace(0, 1, len(compound_names)))
+        # 복리 계산과 연속 복리
+        colors = colormaps['viridis'](np.linspace(0, 1, len(compound_names)))
         bars = ax4.bar(range(len(compound_names)), final_amounts, color=colors, alpha=0.8)
         
         ax4.set_xlabel('Compounding Period')
@@ -117,44 +185,5 @@ class EVerification:
             ax4.text(bar.get_x() + bar.get_width()/2, bar.get_height() + 10,
                     f'${amount:.0f}', ha='center', va='bottom', fontsize=8)
         
-        plt.tight_layout()
-        plot1_base64 = save_plot_to_base64(fig)
-        
-        # 검증 결과 계산
-        e_approximations = {
-            '급수 (20항)': self.e_series_approximation(20),
-            '극한 (n=1000000)': self.e_limit_approximation(1000000),
-            'NumPy e': np.e,
-            '오일러 공식': complex(np.exp(1j * np.pi) + 1).real  # e^(iπ) + 1 = 0
-        }
-        
-        results = {
-            'e_approximations': e_approximations,
-            'convergence': {
-                '급수 수렴속도': '매우 빠름 (factorial!)',
-                '극한 수렴속도': '느림 (1/n)',
-                '20항 급수 오차': abs(e_approximations['급수 (20항)'] - np.e)
-            },
-            'applications': {
-                '연속복리 최종금액': continuous_amount,
-                '일복리 vs 연속복리 차이': continuous_amount - final_amounts[-2],
-                'e의 역수 (1/e)': 1/np.e
-            },
-            'mathematical_properties': {
-                'e^1': np.exp(1),
-                'ln(e)': np.log(np.e),
-                'e^(iπ) + 1': abs(complex(np.exp(1j * np.pi) + 1))  # Should be 0
-            }
-        }
-        
-        plots = {
-            'e_analysis': plot1_base64
-        }
-        
-        print(f"📊 자연상수 e 검증 완료:")
-        print(f"   급수 근사 (20항): {results['e_approximations']['급수 (20항)']:.6f}")
-        print(f"   NumPy e: {results['e_approximations']['NumPy e']:.6f}")
-        print(f"   수렴 오차: {results['convergence']['20항 급수 오차']:.2e}")
-        print(f"   연속복리 효과: ${results['applications']['연속복리 최종금액']:.0f}")
-        
-        return results, plots
+        fig.tight_layout()
+        return save_plot_to_png(fig)
@@ -0,0 +1,84 @@
+"""
+적분 추정기: 유사난수, 준난수(Sobol, Halton), 대조변량(antithetic), 층화(stratified) 표본
+
+[0, 1]^d 단위 입방체의 표본을 적분 구간으로 옮겨 평균을 내는 방식으로
+π 원판 판정과 구간 적분에 같은 추정기를 쓸 수 있다.
+각 추정기의 표본 수별 RMSE를 측정해 수렴 속도를 비교한다.
+"""
+
+import numpy as np
+from scipy.stats import qmc
+
+ESTIMATORS = ('pseudo', 'sobol', 'halton', 'antithetic', 'stratified')
+
+
+def unit_samples(method, n, dimension, rng):
+    """단위 입방체 [0, 1]^dimension 표본 n개 (stratified는 n에 가장 가까운 m^dimension개)"""
+    if method == 'pseudo':
+        return rng.random((n, dimension))
+    if method == 'sobol':
+        return qmc.Sobol(dimension, scramble=True, seed=rng).random(n)
+    if method == 'halton':
+        return qmc.Halton(dimension, scramble=True, seed=rng).random(n)
+    if method == 'antithetic':
+        # u와 1-u를 짝지어 단조 함수의 분산을 줄임
+        half = rng.random(((n + 1) // 2, dimension))
+        return np.concatenate([half, 1 - half])[:n]
+    if method == 'stratified':
+        # 각 축을 m등분한 격자 칸마다 한 점씩 (jittered grid)
+        m = max(1, round(n ** (1 / dimension)))
+        axes = np.meshgrid(*[np.arange(m)] * dimension, indexing='ij')
+        cells = np.stack(axes, axis=-1).reshape(-1, dimension)
+        return (cells + rng.random(cells.shape)) / m
+    raise ValueError(f"unknown estimator: {method}")
+
+
+def integrate(func, lower, upper, n, method='pseudo', rng=None):
+    """상자 [lower, upper] 위 func의 적분 추정 → (추정값, 실제 사용한 표본 수)
+
+    func는 (표본 수, 차원) 배열을 받아 함수값 배열을 돌려주는 벡터화 함수이다.
+    """
+    lower = np.asarray(lower, dtype=float)
+    upper = np.asarray(upper, dtype=float)
+    rng = np.random.default_rng(rng)
+    points = lower + (upper - lower) * unit_samples(method, n, len(lower), rng)
+    return float(np.prod(upper - lower) * np.mean(func(points))), len(points)
+
+
+def convergence(func, lower, upper, exact, methods=ESTIMATORS, sample_counts=None,
+                seed=None, replicates=8):
+    """추정기별 표본 수 대비 RMSE
+
+    각 표본 수에서 독립된 난수화 replicates회의 오차 제곱 평균으로 RMSE를 구하고,
+    log RMSE ~ log n 기울기로 수렴 차수를 추정한다.
+    sample_counts는 Sobol 균형과 2차원 층화를 위해 4의 거듭제곱을 권장한다.
+    추정기마다 ESTIMATORS에서의 위치를 spawn_key로 쓰는 자식 스트림을 쓰므로
+    같은 seed면 methods의 순서나 구성과 관계없이 추정기별 결과가 같다.
+    """
+    if sample_counts is None:
+        sample_counts = [4**k for k in range(3, 10)]
+    entropy = np.random.SeedSequence(seed).entropy
+
+    report = {}
+    for method in methods:
+        if method not in ESTIMATORS:
+            raise ValueError(f"unknown estimator: {method}")
+        rng = np.random.default_rng(np.random.SeedSequence(entropy, spawn_key=(ESTIMATORS.index(method),)))
+        samples, rmse, means = [], [], []
+        for n in sample_counts:
+            runs = [integrate(func, lower, upper, n, method, rng) for _ in range(replicates)]
+            estimates = np.array([estimate for estimate, _ in runs])
+            samples.append(runs[0][1])
+            rmse.append(float(np.sqrt(np.mean((estimates - exact)**2))))
+            means.append(float(np.mean(estimates)))
+
+        positive = np.array(rmse) > 0
+        order = (float(-np.polyfit(np.log(np.array(samples)[positive]), np.log(np.array(rmse)[positive]), 1)[0])
+                 if positive.sum() >= 2 else None)
+        report[method] = {
+            'samples': samples,
+            'rmse': rmse,
+            'estimates': means,
+            'convergence_order': order
+        }
+    return report
@@ -0,0 +1,92 @@
+"""
+컴파일된 식 캐시
+
+식을 한 번만 파싱해 기호 도함수, 부정적분, lambdify로 컴파일한 NumPy 함수를
+보관한다. 정규화한 식 문자열(sympy srepr)을 키로 하는 LRU 캐시에 두므로
+같은 식을 다시 요청하면 미분, 적분, 컴파일을 반복하지 않는다.
+컴파일된 함수는 배열 전체를 한 번에 계산하므로 (x, h) 격자 위의 수치 미분을
+점마다 subs로 대입하는 것보다 훨씬 빠르다.
+기호 미분/적분은 symbolic_worker의 시간 제한 워커 풀에서 실행되고 영구 메모에 남는다.
+
+주의: 문자열 식은 sympy.sympify(내부적으로 eval)로 파싱하므로 신뢰할 수 있는 입력에만 사용한다.
+"""
+
+from functools import cached_property, lru_cache
+import numpy as np
+import sympy as sp
+from ..utils.config import EXPRESSION_CONFIG
+from ..utils.result_cache import ResultCache
+from ..symbolic_worker import symbolic_pool
+
+X = sp.Symbol('x')
+
+expression_cache = ResultCache(max_size=EXPRESSION_CONFIG['max_size'], ttl=EXPRESSION_CONFIG['ttl'])
+
+
+def _vectorize(func):
+    """lambdify 함수가 상수식이면 스칼라를 돌려주므로 입력 모양에 맞춰 넓힘"""
+    def evaluate(values):
+        result = func(values)
+        if np.ndim(result) < np.ndim(values):
+            result = np.full(np.shape(values), result, dtype=float)
+        return result
+    return evaluate
+
+
+class CompiledExpression:
+    """한 변수 식과 그 도함수, 부정적분, 컴파일된 NumPy 함수 (처음 쓸 때 계산해 보관)"""
+
+    def __init__(self, expr, symbol=X):
+        self.expr = expr
+        self.symbol = symbol
+        self.key = sp.srepr(expr)
+
+    def __repr__(self):
+        return f'CompiledExpression({self.expr})'
+
+    @cached_property
+    def derivative(self):
+        return symbolic_pool.run('diff', self.expr, self.symbol)
+
+    @cached_property
+    def antiderivative(self):
+        return symbolic_pool.run('integrate', self.expr, self.symbol)
+
+    @cached_property
+    def function(self):
+        return _vectorize(sp.lambdify(self.symbol, self.expr, 'numpy'))
+
+    @cached_property
+    def derivative_function(self):
+        return _vectorize(sp.lambdify(self.symbol, self.derivative, 'numpy'))
+
+    @cached_property
+    def antiderivative_function(self):
+        return _vectorize(sp.lambdify(self.symbol, self.antiderivative, 'numpy'))
+
+    def __call__(self, values):
+        return self.function(values)
+
+    def central_difference(self, x, h):
+        """중심 차분 (f(x+h) − f(x−h)) / 2h, x와 h는 브로드캐스팅 (예: x[:, None], h[None, :])"""
+        x, h = np.asarray(x, dtype=float), np.asarray(h, dtype=float)
+        return (self.function(x + h) - self.function(x - h)) / (2 * h)
+
+    def definite_integral(self, a, b):
+        """미적분학의 기본정리 F(b) − F(a) (기호 계산, 캐시된 부정적분 사용)"""
+        F = self.antiderivative
+        return symbolic_pool.run('simplify', F.subs(self.symbol, b) - F.subs(self.symbol, a))
+
+
+@lru_cache(maxsize=EXPRESSION_CONFIG['max_size'])
+def _parse(text, symbol):
+    return sp.sympify(text, locals={symbol.name: symbol})
+
+
+def compile_expression(expr, symbol=X):
+    """식(문자열 또는 sympy 식)의 CompiledExpression (srepr 키 LRU 캐시)"""
+    if isinstance(expr, str):
+        expr = _parse(expr, symbol)
+    key = (sp.srepr(expr), symbol.name)
+    compiled, _ = expression_cache.get_or_compute(key, lambda: CompiledExpression(expr, symbol))
+    return compiled
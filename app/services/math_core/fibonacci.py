@@ -0,0 +1,166 @@
+"""
+피보나치/뤼카 수 엔진
+
+빠른 배가(fast doubling) 공식
+    F(2k)   = F(k) · (2F(k+1) − F(k))
+    F(2k+1) = F(k)² + F(k+1)²
+으로 F(n)을 O(log n)번의 큰 정수 곱셈으로 계산한다 (gmpy2가 있으면 mpmath의 정수 백엔드 사용).
+F(n+1)/F(n) − φ = ψⁿ / F(n) = (−1)ⁿ √5 / (φ²ⁿ − (−1)ⁿ) 이므로 비율의 오차는
+F(n)을 만들지 않고도 임의의 n에 대해 고정밀로 구할 수 있다.
+그래프용으로 int64 정확값 표와 비네(Binet) 공식을 쓰는 벡터화 부동소수점 경로를 제공한다.
+"""
+
+import math
+import numpy as np
+from mpmath.libmp import (
+    MPZ, from_int, mpf_add, mpf_div, mpf_log, mpf_mul, mpf_pow_int, mpf_sqrt, to_float, to_str
+)
+
+PHI = (1 + math.sqrt(5)) / 2
+SQRT5 = math.sqrt(5)
+_LOG10_PHI = math.log10(PHI)
+_LOG2_10 = math.log2(10)
+_LOG10_2 = math.log10(2)
+
+
+def fibonacci_pair(n, mod=None):
+    """(F(n), F(n+1)), mod가 주어지면 mod로 나눈 나머지"""
+    if n < 0:
+        raise ValueError("n must be non-negative")
+    a, b = MPZ(0), MPZ(1)
+    for bit in bin(n)[2:]:
+        c = a * (2 * b - a)
+        d = a * a + b * b
+        a, b = (d, c + d) if bit == '1' else (c, d)
+        if mod is not None:
+            a, b = a % mod, b % mod
+    return int(a), int(b)
+
+
+def fibonacci(n):
+    """피보나치 수 F(n) (F(0) = 0, F(1) = 1)"""
+    return fibonacci_pair(n)[0]
+
+
+def lucas(n):
+    """뤼카 수 L(n) = 2F(n+1) − F(n) (L(0) = 2, L(1) = 1)"""
+    f, f_next = fibonacci_pair(n)
+    return 2 * f_next - f
+
+
+# int64에 정확히 들어가는 F(0)..F(92)
+FLOAT_TABLE_MAX = 92
+_EXACT_TABLE = np.array([fibonacci(k) for k in range(FLOAT_TABLE_MAX + 1)], dtype=np.int64)
+
+
+def fibonacci_float(indices):
+    """F(k)의 벡터화 부동소수점 계산
+
+    k ≤ 92는 정확한 정수 표에서, 그보다 크면 비네 공식 φᵏ/√5 로 구한다
+    (상대 오차 약 k·ε, k > 1474 이면 inf).
+    """
+    k = np.asarray(indices)
+    exact = _EXACT_TABLE[np.clip(k, 0, FLOAT_TABLE_MAX)].astype(float)
+    with np.errstate(over='ignore'):
+        approx = PHI ** k.astype(float) / SQRT5
+    return np.where(k <= FLOAT_TABLE_MAX, exact, approx)
+
+
+def ratio_error_log10(indices):
+    """log10 |F(n+1)/F(n) − φ| 의 벡터화 계산 (n ≥ 1, 부동소수점 범위를 넘는 n에도 유한)"""
+    n = np.asarray(indices, dtype=float)
+    sign = 1 - 2 * (n % 2)
+    return math.log10(SQRT5) - 2 * n * _LOG10_PHI - np.log10(1 - sign * PHI ** (-2 * n))
+
+
+def phi_ratio_error(n, digits=30):
+    """F(n+1)/F(n) − φ 의 정확한 값을 유효숫자 digits자리로 (임의의 n ≥ 1)
+
+    닫힌 형태 (−1)ⁿ √5 / (φ²ⁿ − (−1)ⁿ) 를 계산하며, φ²ⁿ 의 상대 오차가 2n배로
+    커지는 것을 n의 비트 수만큼 보호 비트를 더해 막는다.
+    |오차| 는 1/(F(n)F(n+2)) 와 1/(F(n)F(n+1)) 사이에 있다.
+    """
+    if n < 1:
+        raise ValueError("n must be at least 1")
+    prec = int(digits * _LOG2_10) + n.bit_length() + 32
+    sign = -1 if n & 1 else 1
+    sqrt5 = mpf_sqrt(from_int(5), prec)
+    phi = mpf_div(mpf_add(from_int(1), sqrt5, prec), from_int(2), prec)
+    denominator = mpf_add(mpf_pow_int(phi, 2 * n, prec), from_int(-sign), prec)
+    error = mpf_div(mpf_mul(from_int(sign), sqrt5, prec), denominator, prec)
+
+    log10 = to_float(mpf_div(mpf_log(mpf_mul(from_int(sign), error, prec), prec),
+                             mpf_log(from_int(10), prec), prec))
+    return {
+        'n': n,
+        'error': to_str(error, digits),
+        'error_log10': log10,
+        'sign': sign,
+        'correct_digits': -log10
+    }
+
+
+def describe(value, n_digits=20):
+    """음이 아닌 큰 정수의 자릿수, 앞자리, 끝자리 (10진 문자열 전체 변환 없이)"""
+    digits = int((max(value.bit_length(), 1) - 1) * _LOG10_2) + 1
+    shown = min(n_digits, digits)
+    leading = value // 10**(digits - shown)
+    if leading >= 10**shown:
+        # 비트 수로 어림한 자릿수가 하나 모자란 경우
+        digits += 1
+        shown = min(n_digits, digits)
+        leading = value // 10**(digits - shown)
+    return {
+        'digits': digits,
+        'leading': str(leading),
+        'trailing': str(value % 10**shown).zfill(shown)
+    }
+
+
+def _factorize(m):
+    """시행 나눗셈 소인수분해 {소수: 지수}"""
+    factors = {}
+    p = 2
+    while p * p <= m:
+        while m % p == 0:
+            factors[p] = factors.get(p, 0) + 1
+            m //= p
+        p += 1 if p == 2 else 2
+    if m > 1:
+        factors[m] = factors.get(m, 0) + 1
+    return factors
+
+
+def _is_period(t, m):
+    return fibonacci_pair(t, m) == (0, 1 % m)
+
+
+def pisano_period(m):
+    """피사노 주기 π(m): F(n) mod m 의 주기
+
+    π(pᵏ)는 pᵏ⁻¹·π(p)의 약수이고 π(p)는 p−1 (p ≡ ±1 mod 5) 또는
+    2(p+1) (p ≡ ±2 mod 5)의 약수이므로, 그 배수에서 소인수를 하나씩 덜어내며
+    (F(t), F(t+1)) ≡ (0, 1) 을 만족하는 최소 t를 찾고 최소공배수로 합친다.
+    """
+    if m < 1:
+        raise ValueError("m must be positive")
+    if m == 1:
+        return 1
+
+    period = 1
+    for p, k in _factorize(m).items():
+        if p == 2:
+            bound = 3
+        elif p == 5:
+            bound = 20
+        elif p % 5 in (1, 4):
+            bound = p - 1
+        else:
+            bound = 2 * (p + 1)
+        modulus = p ** k
+        candidate = p ** (k - 1) * bound
+        for q in _factorize(candidate):
+            while candidate % q == 0 and _is_period(candidate // q, modulus):
+                candidate //= q
+        period = period * candidate // math.gcd(period, candidate)
+    return period
@@ -0,0 +1,146 @@
+"""
+몬테카를로 π 추정기
+
+표본을 고정 크기 청크로 생성하며 원 안에 들어간 점의 개수만 누적하므로
+표본 수와 관계없이 메모리 사용량이 청크 크기로 일정하다.
+수렴 곡선은 로그 간격 체크포인트에서 누적합(cumsum)으로 기록한다.
+parallel_estimate_pi는 표본을 고정 블록으로 나눠 SeedSequence 자식 스트림으로
+여러 프로세스에서 생성하고 부분 개수를 합친다.
+"""
+
+import math
+import numpy as np
+
+# 한 번에 생성하는 표본 수 (x, y 두 배열 합계 약 16MB)
+DEFAULT_CHUNK_SIZE = 2**20
+
+# 병렬 실행 단위 (블록마다 독립된 SeedSequence 자식 스트림 사용)
+DEFAULT_BLOCK_SIZE = 2**22
+
+# 95% 신뢰구간의 정규분포 분위수
+Z_95 = 1.959963984540054
+
+
+def log_checkpoints(n_points, n_checkpoints=50, start=100):
+    """1..n_points 사이의 로그 간격 체크포인트 (중복 제거, 마지막은 항상 n_points)"""
+    start = min(start, n_points)
+    points = np.geomspace(start, n_points, n_checkpoints).round().astype(np.int64)
+    points[-1] = n_points
+    return np.unique(points)
+
+
+def confidence_interval(inside, n_points, z=Z_95):
+    """π 추정값 4·p̂의 표준오차와 정규근사 신뢰구간"""
+    p_hat = inside / n_points
+    estimate = 4 * p_hat
+    standard_error = 4 * math.sqrt(p_hat * (1 - p_hat) / n_points)
+    return estimate, standard_error, (estimate - z * standard_error, estimate + z * standard_error)
+
+
+def _count_hits(rng, n_points, checkpoints, chunk_size, sample_size):
+    """청크 단위로 표본을 생성하며 원 안의 점 개수를 셈
+
+    checkpoints: 1부터 시작하는 누적 개수를 기록할 위치 (오름차순)
+    반환: (전체 개수, 체크포인트별 누적 개수, 처음 sample_size개 표본 점)
+    """
+    checkpoint_counts = np.empty(len(checkpoints), dtype=np.int64)
+    next_checkpoint = 0
+
+    inside = 0
+    done = 0
+    sample = None
+    while done < n_points:
+        size = min(chunk_size, n_points - done)
+        xy = rng.random((2, size))
+        xy *= 2
+        xy -= 1
+        hits = xy[0]**2 + xy[1]**2 <= 1
+
+        if sample is None and sample_size:
+            keep = min(sample_size, size)
+            sample = (xy[0, :keep].copy(), xy[1, :keep].copy(), hits[:keep].copy())
+
+        # 이번 청크에 속한 체크포인트만 누적합으로 기록
+        end = np.searchsorted(checkpoints, done + size, side='right')
+        if end > next_checkpoint:
+            running = np.cumsum(hits)
+            offsets = checkpoints[next_checkpoint:end] - done - 1
+            checkpoint_counts[next_checkpoint:end] = inside + running[offsets]
+            inside += int(running[-1])
+            next_checkpoint = end
+        else:
+            inside += int(np.count_nonzero(hits))
+        done += size
+
+    return inside, checkpoint_counts, sample
+
+
+def _result(n_points, inside, checkpoints, checkpoint_counts, sample):
+    estimate, standard_error, interval = confidence_interval(inside, n_points)
+    return {
+        'n_points': n_points,
+        'inside': inside,
+        'estimate': estimate,
+        'standard_error': standard_error,
+        'confidence_interval': interval,
+        'checkpoints': checkpoints,
+        'checkpoint_estimates': 4 * checkpoint_counts / checkpoints,
+        'sample': sample
+    }
+
+
+def estimate_pi(n_points, rng, chunk_size=DEFAULT_CHUNK_SIZE, n_checkpoints=50, sample_size=0):
+    """단위 정사각형 [-1, 1]² 위의 균등 표본으로 π 추정 (단일 난수 스트림)
+
+    rng: numpy Generator
+    sample_size: 산점도용으로 보관할 처음 표본 점 개수
+    반환: 추정값, 표준오차, 95% 신뢰구간, 체크포인트별 추정값, 표본 점
+    """
+    checkpoints = log_checkpoints(n_points, n_checkpoints)
+    inside, checkpoint_counts, sample = _count_hits(rng, n_points, checkpoints, chunk_size, sample_size)
+    return _result(n_points, inside, checkpoints, checkpoint_counts, sample)
+
+
+def _run_block(task):
+    """블록 하나 실행 (워커 프로세스에서 호출되므로 모듈 최상위 함수)"""
+    entropy, index, size, offsets, chunk_size, sample_size = task
+    rng = np.random.default_rng(np.random.SeedSequence(entropy, spawn_key=(index,)))
+    return _count_hits(rng, size, offsets, chunk_size, sample_size)
+
+
+def parallel_estimate_pi(n_points, seed=None, mapper=map, block_size=DEFAULT_BLOCK_SIZE,
+                         chunk_size=DEFAULT_CHUNK_SIZE, n_checkpoints=50, sample_size=0):
+    """고정 크기 블록으로 나눈 병렬 몬테카를로 π 추정
+
+    블록 i는 SeedSequence(seed)의 i번째 자식 스트림만 사용하므로, 같은 seed라면
+    블록을 몇 개의 워커가 어떤 순서로 처리하든 결과가 비트 단위로 같다.
+    mapper: map과 같은 형태의 함수 (예: 프로세스 풀의 map). 기본값은 현재 프로세스에서 실행.
+    반환 형식은 estimate_pi와 같고, 재현에 필요한 entropy가 추가된다.
+    """
+    entropy = np.random.SeedSequence(seed).entropy
+    checkpoints = log_checkpoints(n_points, n_checkpoints)
+
+    tasks = []
+    for index, start in enumerate(range(0, n_points, block_size)):
+        size = min(block_size, n_points - start)
+        inside_block = checkpoints[(checkpoints > start) & (checkpoints <= start + size)]
+        tasks.append((entropy, index, size, inside_block - start,
+                      chunk_size, sample_size if index == 0 else 0))
+
+    if len(tasks) == 1:
+        # 블록이 하나면 프로세스 간 전송 비용만 생기므로 직접 실행
+        mapper = map
+
+    # 블록별 부분 개수를 순서대로 합치며 체크포인트를 전역 누적 개수로 변환
+    inside = 0
+    checkpoint_counts = []
+    sample = None
+    for index, (block_inside, block_counts, block_sample) in enumerate(mapper(_run_block, tasks)):
+        checkpoint_counts.append(inside + block_counts)
+        inside += block_inside
+        if index == 0:
+            sample = block_sample
+
+    result = _result(n_points, inside, checkpoints, np.concatenate(checkpoint_counts), sample)
+    result['entropy'] = entropy
+    return result
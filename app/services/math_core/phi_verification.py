@@ -2,40 +2,115 @@
 리(☲): 황금비 φ 검증 및 시각화 모듈
 """
 
+import time
 import numpy as np
-import matplotlib.pyplot as plt
+from matplotlib.patches import Rectangle
+from matplotlib import colormaps
 from math import sqrt
 from ...services.utils.config import configure_matplotlib
-from ..utils.config import MATH_CONSTANTS, PLOT_CONFIG
-from ..visualization.base64_encoder import save_plot_to_base64
+from ..utils.config import FIBONACCI_CONFIG, MATH_CONSTANTS, PLOT_CONFIG
+from ..utils.events import NullSink
+from ..visualization.base64_encoder import save_plot_to_png
+from ..visualization.figures import create_figure
+from .fibonacci import describe, fibonacci_float, fibonacci_pair, phi_ratio_error, pisano_period, ratio_error_log10
 
 configure_matplotlib()
 
+# 루카스 항등식을 확인하는 워드 크기 소수 법 (2^61 − 1, 2^31 − 1, 10^9 + 7)
+IDENTITY_MODULI = (2**61 - 1, 2**31 - 1, 10**9 + 7)
+
 class PhiVerification:
     """황금비 φ 검증 클래스"""
-    
-    def __init__(self):
+
+    def __init__(self, sink=None):
+        self.sink = sink or NullSink()
         self.results = {}
         self.plots = {}
-    
-    def verify_golden_ratio_with_visualization(self):
-        """리(☲): 황금비 φ 검증 및 시각화"""
-        print("\\n" + "=" * 50)
-        print("🔵 리(☲): 황금비 φ 검증 및 시각화")
-        print("=" * 50)
-        
-        # 1. 피보나치 수열과 황금비
-        n_terms = 30
-        fib = [1, 1]
-        for i in range(n_terms - 2):
-            fib.append(fib[-1] + fib[-2])
-        
-        ratios = [fib[i+1]/fib[i] for i in range(1, len(fib)-1)]
+
+    def verify_golden_ratio_with_visualization(self, plot_mode='png', n=FIBONACCI_CONFIG['n'],
+                                               modulus=FIBONACCI_CONFIG['modulus']):
+        """리(☲): 황금비 φ 검증 및 시각화
+
+        plot_mode: 'png'(그래프 PNG), 'data'(그래프의 원본 데이터), 'none'(그래프 없음)
+        n: 빠른 배가로 정확히 계산할 큰 피보나치 항 F(n), L(n)
+        modulus: 피사노 주기를 구할 법
+        """
+        start = time.perf_counter()
+
+        # 1. 피보나치 수열과 황금비 (그래프 범위는 벡터화 부동소수점 경로)
+        n_terms = FIBONACCI_CONFIG['plot_terms']
+        fib = fibonacci_float(np.arange(1, n_terms + 1))
+        ratios = fib[2:] / fib[1:-1]
         phi_actual = (1 + sqrt(5)) / 2
-        
-        # 시각화 1: 피보나치 수열과 비율의 수렴
-        fig, (ax1, ax2) = plt.subplots(2, 1, figsize=(12, 10))
-        
+        error_n = np.arange(1, FIBONACCI_CONFIG['error_terms'] + 1)
+        error_log10 = ratio_error_log10(error_n)
+
+        # 2. 큰 n: F(n), L(n) 정확한 계산과 비율 오차의 고정밀 값
+        big_start = time.perf_counter()
+        f_n, f_next = fibonacci_pair(n)
+        l_n = 2 * f_next - f_n
+        big_n = {
+            'n': n,
+            'fibonacci': describe(f_n),
+            'lucas': describe(l_n),
+            'compute_time': time.perf_counter() - big_start,
+            # L(n)² − 5F(n)² = 4(−1)ⁿ 를 워드 크기 소수 법으로 확인 (n비트 정수 제곱 없이 O(n))
+            'lucas_identity': all(((l_n % q) ** 2 - 5 * (f_n % q) ** 2 - (-4 if n & 1 else 4)) % q == 0
+                                  for q in IDENTITY_MODULI),
+            'ratio_error': phi_ratio_error(n) if n >= 1 else None
+        }
+
+        # 3. 황금 사각형과 나선
+        rectangles, spiral = self._golden_rectangles(8)
+
+        self.sink.emit('golden_ratio.computed', duration=time.perf_counter() - start,
+                       n_terms=n_terms, ratio=ratios[-1],
+                       convergence_error=abs(ratios[-1] - phi_actual),
+                       n=n, n_digits=big_n['fibonacci']['digits'])
+
+        series = {
+            'fibonacci_convergence': {
+                'fibonacci': fib,
+                'ratios': ratios,
+                'error_n': error_n,
+                'error_log10': error_log10
+            },
+            'golden_rectangles': {
+                'rectangles': rectangles,
+                'spiral': spiral
+            }
+        }
+
+        # 결과 저장
+        results = {
+            'phi_actual': phi_actual,
+            'phi_fibonacci': float(ratios[-1]),
+            'fibonacci_sequence': [int(value) for value in fib[:15]],
+            'ratios': ratios[:10].tolist(),
+            'convergence_error': float(abs(ratios[-1] - phi_actual)),
+            'big_n': big_n,
+            'pisano_period': {'modulus': modulus, 'period': pisano_period(modulus)}
+        }
+
+        if plot_mode == 'png':
+            plots = {
+                'fibonacci_convergence': self._plot_fibonacci(fib, ratios, phi_actual, error_n, error_log10),
+                'golden_rectangles': self._plot_golden_rectangles(rectangles, spiral, phi_actual)
+            }
+        elif plot_mode == 'data':
+            plots = series
+        else:
+            plots = {}
+
+        self.results['golden_ratio'] = results
+        self.plots['golden_ratio'] = plots
+        return results, plots
+
+    def _plot_fibonacci(self, fib, ratios, phi_actual, error_n, error_log10):
+        """시각화 1: 피보나치 수열과 비율의 수렴, 비율 오차의 정확한 크기"""
+        fig = create_figure(figsize=(12, 14))
+        ax1, ax2, ax3 = fig.subplots(3, 1)
+
         # 피보나치 수열
         ax1.plot(range(len(fib)), fib, 'bo-', markersize=6, linewidth=2)
         ax1.set_xlabel('n')
@@ -43,7 +118,7 @@ class PhiVerification:
         ax1.set_title('Fibonacci Sequence F(n)')
         ax1.grid(True, alpha=0.3)
         ax1.set_yscale('log')
-        
+
         # 비율의 수렴
         ax2.plot(range(len(ratios)), ratios, 'ro-', markersize=4, linewidth=2, label='F(n+1)/F(n)')
         ax2.axhline(y=phi_actual, color='g', linestyle='--', linewidth=2, label=f'Golden Ratio φ = {phi_actual:.6f}')
@@ -53,27 +128,38 @@ class PhiVerification:
         ax2.legend()
         ax2.grid(True, alpha=0.3)
         ax2.set_ylim(1.5, 1.7)
-        
-        plt.tight_layout()
-        plot1_base64 = save_plot_to_base64(fig)
-        
-        # 2. 황금 사각형과 나선
-        fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(15, 7))
-        
+
+        # 비율 오차: 배정밀도(약 10^-16) 아래까지 닫힌 형태로 계산
+        ax3.plot(error_n, error_log10, 'm-', linewidth=2, label='log10 |F(n+1)/F(n) − φ|')
+        ax3.axhline(y=np.log10(np.finfo(float).eps), color='gray', linestyle=':', label='double precision')
+        ax3.set_xlabel('n')
+        ax3.set_ylabel('log10 error')
+        ax3.set_title('Exact Error of F(n+1)/F(n): (-1)^n √5 / (φ^2n - (-1)^n)')
+        ax3.legend()
+        ax3.grid(True, alpha=0.3)
+
+        fig.tight_layout()
+        return save_plot_to_png(fig)
+
+    def _plot_golden_rectangles(self, rectangles, spiral, phi_actual):
+        """시각화 2: 황금 사각형과 나선, φ² = φ + 1"""
+        fig = create_figure(figsize=(15, 7))
+        ax1, ax2 = fig.subplots(1, 2)
+
         # 황금 사각형과 나선
-        rectangles = self._draw_golden_rectangles(ax1, 8)
+        self._draw_golden_rectangles(ax1, rectangles, spiral)
         ax1.set_xlim(-0.5, 3)
         ax1.set_ylim(-0.5, 2)
         ax1.set_aspect('equal')
         ax1.set_title('Golden Rectangle and Spiral')
         ax1.grid(True, alpha=0.3)
-        
+
         # 황금비의 성질: φ² = φ + 1
         x = np.linspace(1, 2.5, 100)
         y1 = x      # y = x
         y2 = x + 1  # y = x + 1 (φ² = φ + 1)
         y3 = x**2   # y = x²
-        
+
         ax2.plot(x, y1, 'b-', linewidth=2, label='y = x')
         ax2.plot(x, y2, 'r-', linewidth=2, label='y = x + 1')
         ax2.plot(x, y3, 'g-', linewidth=2, label='y = x²')
@@ -85,51 +171,25 @@ class PhiVerification:
         ax2.grid(True, alpha=0.3)
         ax2.set_xlim(1, 2.5)
         ax2.set_ylim(1, 4)
-        
-        plt.tight_layout()
-        plot2_base64 = save_plot_to_base64(fig)
-        
-        print(f"\\n📊 황금비 검증 결과:")
-        print(f"실제 황금비: {phi_actual:.6f}")
-        print(f"피보나치 비율 (마지막): {ratios[-1]:.6f}")
-        print(f"수렴 오차: {abs(ratios[-1] - phi_actual):.6f}")
-        
-        # 결과 저장
-        self.results['golden_ratio'] = {
-            'phi_actual': phi_actual,
-            'fibonacci_sequence': fib[:15],
-            'ratios': ratios[:10],
-            'convergence_error': abs(ratios[-1] - phi_actual)
-        }
-        
-        self.plots['golden_ratio'] = {
-            'fibonacci_convergence': plot1_base64,
-            'golden_rectangles': plot2_base64
-        }
-        
-        return self.results['golden_ratio'], self.plots['golden_ratio']
-    
-    def _draw_golden_rectangles(self, ax, n_levels):
-        """황금 사각형과 나선 그리기"""
+
+        fig.tight_layout()
+        return save_plot_to_png(fig)
+
+    def _golden_rectangles(self, n_levels):
+        """황금 사각형 (x, y, 너비, 높이) 목록과 나선 점 좌표 계산"""
         phi = (1 + sqrt(5)) / 2
-        
+
         x, y = 0, 0
         width, height = 1, 1/phi
-        
-        colors = plt.cm.Set3(np.linspace(0, 1, n_levels))
-        spiral_x, spiral_y = [], []
-        
+
+        rectangles, spiral = [], []
+
         for i in range(n_levels):
-            # 사각형 그리기
-            rect = plt.Rectangle((x, y), width, height, 
-                               facecolor=colors[i], alpha=0.5, 
-                               edgecolor='black', linewidth=1)
-            ax.add_patch(rect)
-            
+            rectangles.append((x, y, width, height))
+
             # 나선 점 추가
-            spiral_x.append(x + width/2)
-            spiral_y.append(y + height/2)
-            
+            spiral.append((x + width/2, y + height/2))
+
             # 다음 사각형 계산
             if i % 4 == 0:  # 오른쪽
                 x += width
@@ -143,8 +203,20 @@ class PhiVerification:
             else:  # 위
                 y += height
                 width, height = height, width - height
-        
+
+        return np.array(rectangles), np.array(spiral)
+
+    def _draw_golden_rectangles(self, ax, rectangles, spiral):
+        """황금 사각형과 나선 그리기"""
+        colors = colormaps['Set3'](np.linspace(0, 1, len(rectangles)))
+
+        for (x, y, width, height), color in zip(rectangles, colors):
+            rect = Rectangle((x, y), width, height,
+                             facecolor=color, alpha=0.5,
+                             edgecolor='black', linewidth=1)
+            ax.add_patch(rect)
+
         # 나선 그리기
-        ax.plot(spiral_x, spiral_y, 'ro-', markersize=4, linewidth=2, alpha=0.7)
-        
+        ax.plot(spiral[:, 0], spiral[:, 1], 'ro-', markersize=4, linewidth=2, alpha=0.7)
+
         return len(colors)
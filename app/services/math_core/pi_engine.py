@@ -0,0 +1,158 @@
+"""
+π 계산 엔진
+
+NumPy로 벡터화한 부동소수점 급수(라이프니츠, 월리스, 마친)와 mpmath 정수 연산을
+이용한 추드노프스키(Chudnovsky) 이진 분할 고정밀 계산을 제공한다.
+각 방법의 소요 시간, 오차, 초당 자릿수를 측정해 "자릿수 vs 시간"을 비교할 수 있다.
+"""
+
+import math
+import time
+import numpy as np
+import mpmath
+from mpmath.libmp import MPZ, from_int, mpf_div, mpf_mul, mpf_pi, mpf_sqrt, mpf_sub, round_nearest
+
+# 추드노프스키 급수 한 항당 늘어나는 정확한 자릿수: log10(640320³ / (24·6·2·6))
+CHUDNOVSKY_DIGITS_PER_TERM = math.log10(151931373056000)
+_C3_OVER_24 = 640320**3 // 24
+
+# 배정밀도 부동소수점으로 얻을 수 있는 최대 자릿수
+FLOAT_DIGITS = -math.log10(np.finfo(float).eps)
+_LOG2_10 = math.log2(10)
+
+
+def leibniz(n_terms):
+    """라이프니츠 급수: π = 4 Σ (-1)^k / (2k+1)"""
+    k = np.arange(n_terms)
+    signs = 1 - 2 * (k & 1)
+    return 4 * float(np.sum(signs / (2 * k + 1)))
+
+
+def wallis(n_terms):
+    """월리스 곱: π = 2 Π 4i² / (4i² - 1)"""
+    i = np.arange(1, n_terms + 1, dtype=float)
+    four_i2 = 4 * i * i
+    return 2 * float(np.prod(four_i2 / (four_i2 - 1)))
+
+
+def _arctan_series(x, n_terms):
+    n = np.arange(n_terms)
+    signs = 1 - 2 * (n & 1)
+    return float(np.sum(signs * x ** (2 * n + 1) / (2 * n + 1)))
+
+
+def machin(n_terms):
+    """마친 공식: π = 4 (4 arctan(1/5) - arctan(1/239))"""
+    return 4 * (4 * _arctan_series(1/5, n_terms) - _arctan_series(1/239, n_terms))
+
+
+FLOAT_METHODS = {
+    'Leibniz Series': leibniz,
+    'Wallis Product': wallis,
+    'Machin-like Formula': machin,
+}
+
+
+def _binary_split(a, b):
+    """추드노프스키 급수 항 [a, b)의 (P, Q, T) 이진 분할"""
+    if b - a == 1:
+        if a == 0:
+            p = q = MPZ(1)
+        else:
+            p = MPZ((6*a - 5) * (2*a - 1) * (6*a - 1))
+            q = MPZ(a * a * a * _C3_OVER_24)
+        t = p * (13591409 + 545140134 * a)
+        return p, q, -t if a & 1 else t
+
+    m = (a + b) // 2
+    p1, q1, t1 = _binary_split(a, m)
+    p2, q2, t2 = _binary_split(m, b)
+    return p1 * p2, q1 * q2, q2 * t1 + p1 * t2
+
+
+def chudnovsky_terms(digits):
+    """digits 자리를 얻는 데 필요한 추드노프스키 급수 항 수"""
+    return int(digits / CHUDNOVSKY_DIGITS_PER_TERM) + 2
+
+
+def _precision_bits(digits):
+    return int((digits + 10) * _LOG2_10) + 1
+
+
+def chudnovsky(digits):
+    """추드노프스키 이진 분할로 π를 digits 자리까지 계산 (mpmath.mpf 반환)
+
+    정수 곱셈은 mpmath의 정수 백엔드(gmpy2가 있으면 gmpy2)를 사용한다.
+    mpmath의 전역 정밀도(mp.dps)는 스레드 간에 공유되므로 건드리지 않고
+    정밀도를 명시하는 libmp 함수로 계산한다. 결과 정밀도는 digits + 10 자리이다.
+    """
+    _, q, t = _binary_split(0, chudnovsky_terms(digits))
+    prec = _precision_bits(digits)
+    scale = mpf_mul(from_int(426880), mpf_sqrt(from_int(10005), prec), prec)
+    value = mpf_div(mpf_mul(scale, from_int(q), prec), from_int(t), prec, round_nearest)
+    return mpmath.mp.make_mpf(value)
+
+
+def correct_digits(value, digits=None):
+    """π와 일치하는 소수 자릿수 (float 또는 mpmath.mpf)
+
+    digits가 주어지면 mpmath의 π와 그 정밀도로 비교하고, 아니면 math.pi와 비교한다.
+    """
+    if digits is None:
+        error = abs(value - math.pi)
+        return FLOAT_DIGITS if error == 0 else min(FLOAT_DIGITS, -math.log10(error))
+
+    prec = _precision_bits(digits)
+    _, man, exp, bc = mpf_sub(value._mpf_, mpf_pi(prec), prec)
+    if not man:
+        return float(digits)
+    # |오차| < 2^(exp + bc)
+    return float(min(digits, -(exp + bc) / _LOG2_10))
+
+
+def _report(value, elapsed, digits, **fields):
+    return dict(fields, value=float(value), time=elapsed, digits=digits,
+                digits_per_second=digits / max(elapsed, 1e-9))
+
+
+def measure_float_method(name, n_terms):
+    """부동소수점 방법 한 번 실행: 값, 시간, 오차, 정확한 자릿수, 초당 자릿수"""
+    start = time.perf_counter()
+    value = FLOAT_METHODS[name](n_terms)
+    elapsed = time.perf_counter() - start
+    return _report(value, elapsed, correct_digits(value),
+                   terms=n_terms, error=abs(value - math.pi))
+
+
+def measure_chudnovsky(digits):
+    """추드노프스키 한 번 실행 (오차는 mpmath의 π와 비교, 10^-digits 수준)"""
+    start = time.perf_counter()
+    value = chudnovsky(digits)
+    elapsed = time.perf_counter() - start
+    correct = correct_digits(value, digits)
+    return _report(value, elapsed, correct, terms=chudnovsky_terms(digits),
+                   requested_digits=digits, error_log10=-correct)
+
+
+def _decades(start, stop):
+    levels = []
+    while start <= stop:
+        levels.append(start)
+        start *= 10
+    return levels
+
+
+def benchmark(max_digits=10000, max_terms=10**6):
+    """방법별 자릿수 vs 시간 측정
+
+    부동소수점 방법은 항 수를 10배씩 늘려 max_terms까지, 추드노프스키는
+    자릿수를 10배씩 늘려 max_digits까지 측정한다.
+    """
+    terms = _decades(10, max_terms)
+    digit_levels = _decades(100, max_digits)
+    if not digit_levels or digit_levels[-1] != max_digits:
+        digit_levels.append(max_digits)
+
+    methods = {name: [measure_float_method(name, n) for n in terms] for name in FLOAT_METHODS}
+    methods['Chudnovsky'] = [measure_chudnovsky(d) for d in digit_levels]
+    return methods
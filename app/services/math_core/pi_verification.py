@@ -2,45 +2,123 @@
 건(☰): 원주율 π 검증 및 시각화 모듈
 """
 
+import time
 import numpy as np
-import matplotlib.pyplot as plt
+import mpmath
 from math import pi, atan
+from . import pi_engine
+from .estimators import ESTIMATORS, convergence
+from .monte_carlo import parallel_estimate_pi
 from ..utils.config import MATH_CONSTANTS, PLOT_CONFIG
-from ..visualization.base64_encoder import save_plot_to_base64
+from ..utils.events import NullSink
+from ..visualization.base64_encoder import save_plot_to_png
+from ..visualization.convergence_plot import plot_estimator_convergence
+from ..visualization.figures import create_figure
 from ...services.utils.config import configure_matplotlib
 
 configure_matplotlib()
 
+
+def _quarter_disk(points):
+    """사분원 판정 × 4: [0, 1]² 위 적분값이 π"""
+    return 4.0 * (points[:, 0]**2 + points[:, 1]**2 <= 1)
+
+
 class PiVerification:
     """원주율 π 검증 클래스"""
-    
-    def __init__(self):
+
+    def __init__(self, sink=None, mapper=map):
+        self.sink = sink or NullSink()
+        self.mapper = mapper
         self.results = {}
         self.plots = {}
-    
-    def verify_pi_with_visualization(self, precision=1000):
-        """건(☰): 원주율 π 검증 및 시각화"""
-        print("=" * 50)
-        print("🔵 건(☰): 원주율 π 검증 및 시각화")
-        print("=" * 50)
-        
+
+    def verify_pi_with_visualization(self, precision=1000, seed=None, plot_mode='png', n_points=50000):
+        """건(☰): 원주율 π 검증 및 시각화
+
+        precision: 추드노프스키 이진 분할로 계산할 π의 소수 자릿수
+        n_points: 몬테카를로 표본 수 (청크 단위로 생성하므로 메모리는 일정)
+        seed가 주어지면 몬테카를로 시뮬레이션이 재현 가능해진다.
+        plot_mode: 'png'(그래프 PNG), 'data'(그래프의 원본 데이터), 'none'(그래프 없음)
+        """
+        start = time.perf_counter()
+
         # 1. 몬테카를로 시뮬레이션
-        n_points = 50000
-        x = np.random.uniform(-1, 1, n_points)
-        y = np.random.uniform(-1, 1, n_points)
-        distances = np.sqrt(x**2 + y**2)
-        inside_circle = distances <= 1
-        pi_estimate = 4 * np.sum(inside_circle) / n_points
-        
-        # 시각화 1: 몬테카를로 시뮬레이션
-        fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(15, 6))
-        
+        monte_carlo = parallel_estimate_pi(n_points, seed, mapper=self.mapper, sample_size=2000)
+        pi_estimate = monte_carlo['estimate']
+        sample_x, sample_y, sample_inside = monte_carlo['sample']
+
+        # 2. 다양한 π 계산 방법들 비교
+        methods = {
+            'NumPy': np.pi,
+            'Leibniz Series': pi_engine.leibniz(10000),
+            'Machin-like Formula': pi_engine.machin(100),
+            'Monte Carlo': pi_estimate,
+            'Wallis Product': pi_engine.wallis(10000)
+        }
+
+        # 3. 고정밀 π (추드노프스키)
+        pi_precise = pi_engine.chudnovsky(precision)
+
+        self.sink.emit('pi.computed', duration=time.perf_counter() - start,
+                       n_points=n_points, pi_estimate=pi_estimate, precision=precision,
+                       errors={method: abs(value - pi) for method, value in methods.items()})
+
+        series = {
+            'monte_carlo_simulation': {
+                'sample_x': sample_x,
+                'sample_y': sample_y,
+                'sample_inside': sample_inside,
+                'sample_sizes': monte_carlo['checkpoints'],
+                'pi_estimates': monte_carlo['checkpoint_estimates']
+            },
+            'methods_comparison': {
+                'methods': list(methods.keys()),
+                'values': np.array(list(methods.values())),
+                'errors': np.array([abs(v - pi) for v in methods.values()])
+            }
+        }
+
+        # 결과 저장
+        results = {
+            'monte_carlo': pi_estimate,
+            'monte_carlo_points': n_points,
+            'monte_carlo_standard_error': monte_carlo['standard_error'],
+            'monte_carlo_ci95': list(monte_carlo['confidence_interval']),
+            'leibniz': methods['Leibniz Series'],
+            'machin': methods['Machin-like Formula'],
+            'wallis': methods['Wallis Product'],
+            'numpy': np.pi,
+            'actual': pi,
+            'precision': precision,
+            'chudnovsky_digits': pi_engine.correct_digits(pi_precise, precision),
+            'chudnovsky_prefix': mpmath.nstr(pi_precise, min(precision, 50) + 1)
+        }
+
+        if plot_mode == 'png':
+            plots = {
+                'monte_carlo_simulation': self._plot_monte_carlo(pi_estimate, **series['monte_carlo_simulation']),
+                'methods_comparison': self._plot_methods(**series['methods_comparison'])
+            }
+        elif plot_mode == 'data':
+            plots = series
+        else:
+            plots = {}
+
+        # 동시 요청이 서로의 결과를 덮어쓰지 않도록 지역 변수를 반환
+        self.results['pi'] = results
+        self.plots['pi'] = plots
+        return results, plots
+
+    def _plot_monte_carlo(self, pi_estimate, sample_x, sample_y, sample_inside, sample_sizes, pi_estimates):
+        """시각화 1: 몬테카를로 시뮬레이션"""
+        fig = create_figure(figsize=(15, 6))
+        ax1, ax2 = fig.subplots(1, 2)
+
         # 점들 시각화 (샘플만)
-        sample_size = 2000
-        sample_idx = np.random.choice(n_points, sample_size, replace=False)
-        colors = ['red' if inside_circle[i] else 'blue' for i in sample_idx]
-        ax1.scatter(x[sample_idx], y[sample_idx], c=colors, alpha=0.6, s=1)
-        
+        colors = ['red' if inside else 'blue' for inside in sample_inside]
+        ax1.scatter(sample_x, sample_y, c=colors, alpha=0.6, s=1)
+
         # 단위원 그리기
         theta = np.linspace(0, 2*pi, 100)
         ax1.plot(np.cos(theta), np.sin(theta), 'black', linewidth=2)
@@ -49,105 +127,109 @@ class PiVerification:
         ax1.set_aspect('equal')
         ax1.set_title(f'Monte Carlo Simulation\nπ ~ {pi_estimate:.6f}', fontsize=12)
         ax1.grid(True, alpha=0.3)
-        
-        # 수렴성 시각화
-        sample_sizes = np.arange(1000, n_points, 1000)
-        pi_estimates = []
-        for size in sample_sizes:
-            pi_est = 4 * np.sum(inside_circle[:size]) / size
-            pi_estimates.append(pi_est)
-        
+
+        # 수렴성 시각화 (로그 간격 체크포인트, 95% 신뢰 대역)
+        band = 1.96 * 4 * np.sqrt((pi/4) * (1 - pi/4) / sample_sizes)
+        ax2.fill_between(sample_sizes, pi - band, pi + band, color='gray', alpha=0.2, label='95% Confidence Band')
         ax2.plot(sample_sizes, pi_estimates, 'b-', alpha=0.7, label='Monte Carlo Estimate')
         ax2.axhline(y=pi, color='red', linestyle='--', label=f'Actual π = {pi:.6f}')
+        ax2.set_xscale('log')
         ax2.set_xlabel('Sample Size')
         ax2.set_ylabel('π Estimate')
         ax2.set_title('Convergence of π Estimate')
         ax2.grid(True, alpha=0.3)
         ax2.legend()
-        
-        plt.tight_layout()
-        plot1_base64 = save_plot_to_base64(fig)
-        
-        # 2. 다양한 π 계산 방법들 비교
-        methods = {
-            'NumPy': np.pi,
-            'Leibniz Series': self._calculate_pi_leibniz(10000),
-            'Machin-like Formula': self._calculate_pi_machin(100),
-            'Monte Carlo': pi_estimate,
-            'Wallis Product': self._calculate_pi_wallis(10000)
-        }
-        
-        print("\\n🔢 다양한 π 계산 방법 비교:")
-        for method, value in methods.items():
-            error = abs(value - pi)
-            print(f"{method:12s}: {value:.6f} (오차: {error:.6f})")
-        
-        # 시각화 2: 방법별 비교
-        fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(15, 6))
-        
-        method_names = list(methods.keys())
-        values = list(methods.values())
-        errors = [abs(v - pi) for v in values]
-        
+
+        fig.tight_layout()
+        return save_plot_to_png(fig)
+
+    def _plot_methods(self, methods, values, errors):
+        """시각화 2: 방법별 비교"""
+        fig = create_figure(figsize=(15, 6))
+        ax1, ax2 = fig.subplots(1, 2)
+
         # 막대 그래프
-        bars = ax1.bar(method_names, values, alpha=0.7, color=['blue', 'green', 'orange', 'red', 'purple'])
+        bars = ax1.bar(methods, values, alpha=0.7, color=['blue', 'green', 'orange', 'red', 'purple'])
         ax1.axhline(y=pi, color='black', linestyle='--', label=f'Actual π = {pi:.6f}')
         ax1.set_ylabel('π Value')
         ax1.set_title('Results by π Calculation Method')
         ax1.tick_params(axis='x', rotation=45)
         ax1.legend()
         ax1.grid(True, alpha=0.3)
-        
+
         # 오차 그래프
-        ax2.bar(method_names, errors, alpha=0.7, color=['blue', 'green', 'orange', 'red', 'purple'])
+        ax2.bar(methods, errors, alpha=0.7, color=['blue', 'green', 'orange', 'red', 'purple'])
         ax2.set_ylabel('Absolute Error')
         ax2.set_title('Error by π Calculation Method')
         ax2.tick_params(axis='x', rotation=45)
         ax2.set_yscale('log')
         ax2.grid(True, alpha=0.3)
-        
-        plt.tight_layout()
-        plot2_base64 = save_plot_to_base64(fig)
-        
-        # 결과 저장
-        self.results['pi'] = {
-            'monte_carlo': pi_estimate,
-            'leibniz': methods['Leibniz Series'],
-            'machin': methods['Machin-like Formula'],
-            'wallis': methods['Wallis Product'],
-            'numpy': np.pi,
-            'actual': pi
-        }
-        
-        self.plots['pi'] = {
-            'monte_carlo_simulation': plot1_base64,
-            'methods_comparison': plot2_base64
+
+        fig.tight_layout()
+        return save_plot_to_png(fig)
+
+    def compare_estimators(self, methods=ESTIMATORS, seed=None, plot_mode='png'):
+        """π 원판 판정에 대한 추정기별 표본 수 대비 오차 (사분원 비율 × 4)
+
+        methods: 비교할 추정기 (pseudo, sobol, halton, antithetic, stratified)
+        plot_mode: 'png'(그래프 PNG), 'data'(그래프의 원본 데이터), 'none'(그래프 없음)
+        """
+        start = time.perf_counter()
+        report = convergence(_quarter_disk, (0, 0), (1, 1), pi, methods, seed=seed)
+        self.sink.emit('pi.estimators', duration=time.perf_counter() - start,
+                       rmse={method: runs['rmse'][-1] for method, runs in report.items()})
+
+        if plot_mode == 'png':
+            plots = {'estimator_convergence': plot_estimator_convergence(report, 'π Estimators: RMSE vs Number of Samples')}
+        elif plot_mode == 'data':
+            plots = {'estimator_convergence': {
+                method: {'samples': np.array(runs['samples']), 'rmse': np.array(runs['rmse'])}
+                for method, runs in report.items()
+            }}
+        else:
+            plots = {}
+        return report, plots
+
+    def benchmark_pi_engine(self, max_digits=10000, plot_mode='png'):
+        """π 계산 방법별 자릿수 vs 시간 보고서
+
+        부동소수점 급수는 항 수를, 추드노프스키는 자릿수를 10배씩 늘리며
+        시간, 오차, 초당 자릿수를 측정한다.
+        plot_mode: 'png'(그래프 PNG), 'data'(그래프의 원본 데이터), 'none'(그래프 없음)
+        """
+        start = time.perf_counter()
+        report = pi_engine.benchmark(max_digits)
+        self.sink.emit('pi.benchmarked', duration=time.perf_counter() - start, max_digits=max_digits,
+                       digits_per_second={method: runs[-1]['digits_per_second']
+                                          for method, runs in report.items()})
+
+        series = {
+            method: {
+                'time': np.array([run['time'] for run in runs]),
+                'digits': np.array([run['digits'] for run in runs])
+            }
+            for method, runs in report.items()
         }
-        
-        return self.results['pi'], self.plots['pi']
-    
-    def _calculate_pi_machin(self, n_terms):
-        """마친 공식으로 π 계산"""
-        def arctan_series(x, n_terms):
-            result = 0
-            for n in range(n_terms):
-                term = (-1)**n * (x**(2*n+1)) / (2*n+1)
-                result += term
-            return result
-        
-        pi_estimate = 4 * (4 * arctan_series(1/5, n_terms) - arctan_series(1/239, n_terms))
-        return pi_estimate
-    
-    def _calculate_pi_leibniz(self, n_terms):
-        """라이프니츠 급수로 π 계산"""
-        pi_estimate = 0
-        for i in range(n_terms):
-            pi_estimate += (-1)**i / (2*i + 1)
-        return 4 * pi_estimate
-    
-    def _calculate_pi_wallis(self, n_terms):
-        """월리스 곱으로 π 계산"""
-        product = 1
-        for i in range(1, n_terms + 1):
-            product *= (4 * i**2) / (4 * i**2 - 1)
-        return 2 * product
+        if plot_mode == 'png':
+            plots = {'digits_vs_time': self._plot_digits_vs_time(series)}
+        elif plot_mode == 'data':
+            plots = {'digits_vs_time': series}
+        else:
+            plots = {}
+        return report, plots
+
+    def _plot_digits_vs_time(self, series):
+        """시각화 3: 방법별 정확한 자릿수 vs 계산 시간"""
+        fig = create_figure(figsize=(10, 6))
+        ax = fig.subplots()
+
+        for method, points in series.items():
+            ax.loglog(points['time'], points['digits'], 'o-', linewidth=2, label=method)
+        ax.set_xlabel('Time (s)')
+        ax.set_ylabel('Correct Digits')
+        ax.set_title('Digits of π vs Computation Time')
+        ax.legend()
+        ax.grid(True, alpha=0.3)
+
+        fig.tight_layout()
+        return save_plot_to_png(fig)
@@ -0,0 +1,131 @@
+"""
+소수 판별 엔진
+
+밀러-라빈 판정법은 n < 3.3·10^24 (64비트 전체 포함)에서 처음 13개 소수(2 .. 41)를 밑으로
+쓰면 결정적이고, 더 큰 수에서는 무작위 밑 rounds개로 오판 확률을 4^-rounds 이하로
+낮춘다. 메르센 수 2^p − 1은 뤼카-레머 판정법으로 p − 2번의 제곱만에 판별하며,
+2^p ≡ 1 (mod 2^p − 1)을 이용해 나눗셈 없이 시프트와 마스크로 나머지를 구한다.
+mersenne_batch는 지수마다 작은 인수(q = 2kp + 1) 시행 나눗셈 후 뤼카-레머를
+mapper(예: 프로세스 풀의 map)로 나눠 실행한다.
+"""
+
+import random
+from . import sieve
+from .prime_table import prime_table
+from ..utils.events import check_cancelled
+
+SMALL_PRIMES = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41)
+
+# 밑 SMALL_PRIMES로 결정적인 밀러-라빈 상한 (Sorenson & Webster, 2015)
+DETERMINISTIC_LIMIT = 3317044064679887385961981
+
+# 기본 무작위 밑 개수 (오판 확률 4^-25 이하)
+DEFAULT_ROUNDS = 25
+
+# 메르센 지수의 작은 인수 시행 나눗셈 상한 (q = 2kp + 1 < 2^20)
+DEFAULT_FACTOR_BOUND = 2**20
+
+# 최대 지수가 이보다 작은 배치는 전부 합쳐 약 0.07초이므로 mapper 없이 현재 프로세스에서 검사
+IN_PROCESS_EXPONENT = 512
+
+
+def _strong_probable_prime(n, a, d, s):
+    """n − 1 = d·2^s 일 때 n이 밑 a에 대한 강한 확률적 소수인지"""
+    x = pow(a, d, n)
+    if x == 1 or x == n - 1:
+        return True
+    for _ in range(s - 1):
+        x = x * x % n
+        if x == n - 1:
+            return True
+    return False
+
+
+def is_prime(n, rounds=DEFAULT_ROUNDS, rng=None):
+    """밀러-라빈 소수 판별
+
+    n < DETERMINISTIC_LIMIT 이면 결정적이고, 그보다 크면 rng(random.Random, 기본값은
+    새 인스턴스)에서 뽑은 무작위 밑 rounds개를 쓰는 확률적 판정이다.
+    이미 매핑된 공유 소수 표 범위 안의 n은 비트 하나를 읽어 답한다.
+    """
+    n = int(n)
+    if n < 2:
+        return False
+    known = prime_table.is_prime(n)
+    if known is not None:
+        return known
+    for p in SMALL_PRIMES:
+        if n % p == 0:
+            return n == p
+    d, s = n - 1, 0
+    while d % 2 == 0:
+        d //= 2
+        s += 1
+    if n < DETERMINISTIC_LIMIT:
+        bases = SMALL_PRIMES
+    else:
+        rng = rng or random.Random()
+        bases = [rng.randrange(2, n - 1) for _ in range(rounds)]
+    return all(_strong_probable_prime(n, a, d, s) for a in bases)
+
+
+def lucas_lehmer(p):
+    """뤼카-레머 판정법: 소수 p에 대해 2^p − 1이 소수인지
+
+    s₀ = 4, s_{k+1} = s_k² − 2 (mod M_p) 에서 s_{p−2} ≡ 0 이면 소수다.
+    """
+    if p == 2:
+        return True
+    if not is_prime(p):
+        return False  # 합성수 지수의 메르센 수는 합성수
+    mersenne = (1 << p) - 1
+    s = 4
+    for _ in range(p - 2):
+        s = s * s - 2
+        s = (s & mersenne) + (s >> p)  # 2^p ≡ 1 이므로 상위 비트를 하위 비트에 더함
+        if s >= mersenne:
+            s -= mersenne
+    return s == 0
+
+
+def mersenne_factor(p, bound=DEFAULT_FACTOR_BOUND):
+    """2^p − 1의 bound 미만 소인수 (q = 2kp + 1, q ≡ ±1 mod 8 만 후보), 없으면 None"""
+    mersenne = (1 << p) - 1
+    for q in range(2 * p + 1, min(bound, mersenne), 2 * p):
+        if q % 8 in (1, 7) and pow(2, p, q) == 1:
+            return q
+    return None
+
+
+def check_mersenne(p, factor_bound=DEFAULT_FACTOR_BOUND):
+    """지수 p 하나 검사 → (p, 2^p − 1이 소수인지, 찾은 작은 인수 또는 None)
+
+    워커 프로세스에서 호출되므로 모듈 최상위 함수다.
+    """
+    if p > 2:
+        factor = mersenne_factor(p, factor_bound)
+        if factor is not None:
+            return p, False, factor
+    return p, lucas_lehmer(p), None
+
+
+def mersenne_batch(exponents, mapper=map):
+    """지수 목록을 mapper로 나눠 검사 (입력 순서대로 check_mersenne 결과 목록)
+
+    뤼카-레머 비용은 p²에 가깝게 늘어나므로 큰 지수부터 제출해 워커 부하를 고르게 한다.
+    """
+    order = sorted(exponents, reverse=True)
+    if not order or order[0] < IN_PROCESS_EXPONENT:
+        # 작은 배치는 프로세스 간 전송 비용이 검사 시간보다 크므로 직접 실행
+        mapper = map
+    results = {}
+    for p, result in zip(order, mapper(check_mersenne, order)):
+        check_cancelled()  # 현재 프로세스에서 검사할 때는 지수 하나마다 취소 여부 확인
+        results[p] = result
+    return [results[p] for p in exponents]
+
+
+def mersenne_exponents(max_exponent, mapper=map):
+    """max_exponent 이하에서 2^p − 1이 소수인 지수 p 목록"""
+    exponents = sieve.primes_up_to(max_exponent).tolist()
+    return [p for p, prime, _ in mersenne_batch(exponents, mapper) if prime]
@@ -0,0 +1,68 @@
+"""
+소수 계량 함수 π(x)
+
+Lucy_Hedgehog 알고리즘은 n // k 꼴의 값 약 2√n개에 대해서만 S(v) = (v 이하 소수 개수)를
+유지한다. S(v) = v − 1 에서 시작해 √n 이하 소수 p마다 v ≥ p² 인 v에 대해
+S(v) −= S(v // p) − π(p − 1) 을 적용하면 끝에 S(n) = π(n)이 남는다 (O(n^{3/4}) 연산).
+v // p의 위치는 큰 값(n // k, k ≤ √n)이면 인덱스 kp − 1, 작은 값 x이면 m − x 이므로
+한 소수의 갱신은 NumPy 슬라이스 세 개로 끝난다. 10^12에서 배열 원소는 약 2·10^6개다.
+"""
+
+from functools import lru_cache
+from math import isqrt
+import numpy as np
+import scipy.special
+from . import sieve
+from ..utils.config import PRIME_COUNTING_CONFIG
+
+
+def lucy_hedgehog(n):
+    """(V, S): V는 n // k 꼴의 모든 값(내림차순), S[i] = π(V[i])"""
+    r = isqrt(n)
+    V = np.concatenate([n // np.arange(1, r + 1, dtype=np.int64),
+                        np.arange(n // r - 1, 0, -1, dtype=np.int64)])
+    S = V - 1
+    m = len(V)
+    # 읽는 위치가 항상 같은 문장에서 쓰거나 아직 쓰지 않은 더 작은 값이므로
+    # 큰 값부터 차례로 갱신하는 원래 알고리즘과 같은 결과가 된다
+    for count, p in enumerate(sieve.primes_up_to(r).tolist()):
+        p2 = p * p
+        large = min(r, n // p2)       # 큰 값 중 V ≥ p² 인 개수
+        direct = min(large, r // p)   # V[j] // p 도 큰 값인 개수 (인덱스 (j + 1)p − 1)
+        S[:direct] -= S[p - 1:direct * p:p] - count
+        if large > direct:
+            S[direct:large] -= S[m - V[direct:large] // p] - count
+        if p2 < n // r:
+            # 작은 값 중 V ≥ p² 인 부분 (인덱스 r .. m − p²)
+            stop = m - p2 + 1
+            S[r:stop] -= S[m - V[r:stop] // p] - count
+    return V, S
+
+
+@lru_cache(maxsize=PRIME_COUNTING_CONFIG['memo_size'])
+def prime_count(n):
+    """π(n) (정확한 값, 메모이즈)"""
+    if n < 2:
+        return 0
+    return int(lucy_hedgehog(n)[1][0])
+
+
+def li(x):
+    """로그 적분 li(x) = Ei(ln x) (x는 스칼라 또는 배열)"""
+    return scipy.special.expi(np.log(np.asarray(x, dtype=float)))
+
+
+def compare(values):
+    """x마다 π(x)와 소수 정리 근사 x/ln x, li(x)의 상대 오차"""
+    x = np.asarray(values, dtype=np.int64)
+    pi = np.array([prime_count(int(v)) for v in x], dtype=np.int64)
+    x_over_log = x / np.log(x)
+    log_integral = li(x)
+    return {
+        'x': x,
+        'pi': pi,
+        'x_over_log': x_over_log,
+        'li': log_integral,
+        'x_over_log_error': (x_over_log - pi) / pi,
+        'li_error': (log_integral - pi) / pi
+    }
@@ -0,0 +1,160 @@
+"""
+스트리밍 소수 간격 통계
+
+구간 체의 블록마다 소수 배열에서 np.diff와 np.bincount로 부분 통계(간격 히스토그램,
+기록 간격, 간격별 첫 등장, 쌍둥이/사촌/섹시 소수 쌍 개수)를 만들고, 인접한 부분 통계를
+merge로 합친다. 부분 통계는 블록 경계의 간격과 쌍을 계산할 수 있도록 처음과 끝의 소수
+세 개만 기억하므로 전체 소수를 메모리에 두지 않고 10^10까지 간격 분포를 구할 수 있다.
+블록 통계는 워커 프로세스에서 계산하고 부모 프로세스는 순서대로 합치기만 한다.
+"""
+
+from functools import reduce
+import numpy as np
+from . import sieve
+
+# 쌍 이름 → 두 소수의 차 (p, p + k 가 모두 소수)
+PAIRS = {'twin': 2, 'cousin': 4, 'sexy': 6}
+
+# 차가 6 이하인 두 소수 사이에는 소수가 최대 두 개뿐이므로 경계에서는 양쪽 세 개씩만 보면 된다
+EDGE = 3
+
+# 간격별 첫 등장을 찾을 때 한 번에 훑는 간격 수
+CHUNK = 2**16
+
+
+def _count_pairs(primes):
+    """정렬된 소수 배열 안에서 차가 k인 쌍의 개수 (k = 2, 4, 6)"""
+    counts = dict.fromkeys(PAIRS, 0)
+    for step in range(1, EDGE + 1):
+        diffs = primes[step:] - primes[:-step]
+        for name, k in PAIRS.items():
+            counts[name] += int(np.count_nonzero(diffs == k))
+    return counts
+
+
+def _first_indices(gaps, size, distinct):
+    """간격 값마다 처음 나온 인덱스 (없으면 -1)
+
+    전체를 정렬하는 np.unique 대신 CHUNK개씩 훑으며 아직 못 본 값만 정렬한다.
+    간격 종류는 수백 개뿐이라 대부분 앞쪽 몇 조각에서 끝난다.
+    """
+    first = np.full(size, -1, dtype=np.int64)
+    found = 0
+    for start in range(0, len(gaps), CHUNK):
+        chunk = gaps[start:start + CHUNK]
+        fresh = np.flatnonzero(first[chunk] < 0)
+        if len(fresh):
+            values, index = np.unique(chunk[fresh], return_index=True)
+            first[values] = start + fresh[index]
+            found += len(values)
+            if found == distinct:
+                break
+    return first
+
+
+class GapStatistics:
+    """연속한 소수 구간 하나의 부분 통계 (merge로 인접 구간과 합칠 수 있음)"""
+
+    def __init__(self, count=0, head=(), tail=(), histogram=None, first_occurrence=None,
+                 records=(), pairs=None):
+        self.count = count
+        self.head = tuple(head)                     # 처음 소수 최대 EDGE개
+        self.tail = tuple(tail)                     # 마지막 소수 최대 EDGE개
+        self.histogram = np.zeros(1, dtype=np.int64) if histogram is None else histogram
+        self.first_occurrence = first_occurrence or {}   # 간격 → 그 간격이 처음 나온 소수 p
+        self.records = list(records)                # 기록 간격 [(간격, p)] (간격이 증가하는 순)
+        self.pairs = pairs or dict.fromkeys(PAIRS, 0)
+
+    @classmethod
+    def from_primes(cls, primes):
+        """정렬된 소수 배열 하나의 부분 통계 (벡터화)"""
+        primes = np.asarray(primes, dtype=np.int64)
+        if len(primes) == 0:
+            return cls()
+        gaps = np.diff(primes)
+        histogram = np.bincount(gaps) if len(gaps) else np.zeros(1, dtype=np.int64)
+
+        values = np.flatnonzero(histogram)
+        first_index = _first_indices(gaps, len(histogram), len(values))
+        first_occurrence = dict(zip(values.tolist(), primes[first_index[values]].tolist()))
+
+        # 기록 간격: 앞선 모든 간격보다 큰 간격 (누적 최댓값이 바뀌는 위치)
+        running = np.maximum.accumulate(gaps) if len(gaps) else gaps
+        is_record = np.ones(len(gaps), dtype=bool)
+        is_record[1:] = running[1:] > running[:-1]
+        records = list(zip(gaps[is_record].tolist(), primes[:-1][is_record].tolist()))
+
+        return cls(len(primes), primes[:EDGE].tolist(), primes[-EDGE:].tolist(), histogram,
+                   first_occurrence, records, _count_pairs(primes))
+
+    @property
+    def max_gap(self):
+        return self.records[-1][0] if self.records else 0
+
+    def merge(self, other):
+        """바로 뒤에 이어지는 구간(other)의 통계와 합친 새 통계"""
+        if not self.count:
+            return other
+        if not other.count:
+            return self
+
+        boundary = other.head[0] - self.tail[-1]
+        size = max(len(self.histogram), len(other.histogram), boundary + 1)
+        histogram = np.zeros(size, dtype=np.int64)
+        histogram[:len(self.histogram)] += self.histogram
+        histogram[:len(other.histogram)] += other.histogram
+        histogram[boundary] += 1
+
+        first_occurrence = dict(other.first_occurrence)
+        first_occurrence[boundary] = self.tail[-1]
+        first_occurrence.update(self.first_occurrence)
+
+        records = list(self.records)
+        for gap, p in [(boundary, self.tail[-1])] + other.records:
+            if gap > (records[-1][0] if records else 0):
+                records.append((gap, p))
+
+        # 경계를 넘는 쌍: 양쪽 끝 소수를 이어 센 쌍에서 각 쪽 안의 쌍을 뺌
+        edge = np.array(self.tail + other.head, dtype=np.int64)
+        joined = _count_pairs(edge)
+        left = _count_pairs(np.array(self.tail, dtype=np.int64))
+        right = _count_pairs(np.array(other.head, dtype=np.int64))
+        pairs = {name: self.pairs[name] + other.pairs[name] + joined[name] - left[name] - right[name]
+                 for name in PAIRS}
+
+        return GapStatistics(self.count + other.count, (self.head + other.head)[:EDGE],
+                             (self.tail + other.tail)[-EDGE:], histogram, first_occurrence, records, pairs)
+
+    def summary(self):
+        """JSON으로 보낼 수 있는 요약"""
+        gaps = np.flatnonzero(self.histogram)
+        return {
+            'prime_count': self.count,
+            'first_prime': self.head[0] if self.head else None,
+            'last_prime': self.tail[-1] if self.tail else None,
+            'gaps': gaps.tolist(),
+            'gap_counts': self.histogram[gaps].tolist(),
+            'most_common_gap': int(np.argmax(self.histogram)) if self.count > 1 else None,
+            'max_gap': self.max_gap,
+            'mean_gap': (self.tail[-1] - self.head[0]) / (self.count - 1) if self.count > 1 else None,
+            'maximal_gaps': [{'gap': gap, 'prime': p} for gap, p in self.records],
+            'first_occurrence': {str(gap): p for gap, p in sorted(self.first_occurrence.items())},
+            'pairs': dict(self.pairs)
+        }
+
+
+def _block_statistics(task):
+    """블록 하나를 체로 걸러 부분 통계 계산 (워커 프로세스에서 호출되므로 모듈 최상위 함수)"""
+    return GapStatistics.from_primes(sieve.block_primes(task))
+
+
+def gap_statistics(lo, hi, mapper=map, block_size=sieve.DEFAULT_BLOCK_SIZE,
+                   segment_size=sieve.DEFAULT_SEGMENT_SIZE, window=sieve.DEFAULT_WINDOW):
+    """lo ≤ p < hi 인 소수의 간격 통계 (블록별 부분 통계를 순서대로 합침)
+
+    mapper: map과 같은 형태의 함수 (예: 프로세스 풀의 map). 기본값은 현재 프로세스에서 실행.
+    """
+    start = GapStatistics.from_primes([2] if lo <= 2 < hi else [])
+    tasks = sieve.block_tasks(lo, hi, block_size, segment_size)
+    partials = (partial for _, partial in sieve.map_blocks(_block_statistics, tasks, mapper, window))
+    return reduce(GapStatistics.merge, partials, start)
@@ -0,0 +1,149 @@
+"""
+영구 소수 표 (메모리 맵 .npy)
+
+PrimeIndex의 홀수 비트셋(uint64 워드)과 누적 개수 표를 디렉터리(기본값은 instance/primes)에
+odd_bitset_<limit>.npy, pi_table_<limit>.npy로 저장하고 np.load(mmap_mode='r')로
+읽기 전용 매핑한다. 같은 파일을 매핑한 워커 프로세스들은 운영체제 페이지 캐시를 공유하므로
+요청마다 다시 체를 돌리지도, 프로세스마다 사본을 두지도 않는다.
+
+더 큰 limit이 필요하면 기존 비트와 누적 개수를 복사하고 새 구간만 체로 걸러 이어 붙인다.
+임시 파일에 쓴 뒤 이름을 바꾸므로(누적 표 먼저, 비트셋 나중) 비트셋 파일이 보이면 짝이 되는
+누적 표도 완성되어 있고, 이전 파일을 매핑 중인 프로세스는 삭제 뒤에도 그대로 읽을 수 있다.
+directory가 None이면 파일 없이 프로세스 메모리에만 둔다.
+"""
+
+import os
+import re
+import tempfile
+import threading
+import numpy as np
+from . import sieve
+
+# 표 크기 단위 (홀수 인덱스 수, 2^21개 수 = 비트셋 128KB)
+DEFAULT_GRANULE = 2**20
+
+FILE_PATTERN = re.compile(r'^odd_bitset_(\d+)\.npy$')
+
+
+class PrimeTable:
+    """limit까지 커지는 영구 소수 표 (PrimeIndex를 돌려줌)"""
+
+    def __init__(self, directory=None, granule=DEFAULT_GRANULE):
+        self._directory = directory
+        self.granule = granule
+        self._index = None
+        self._lock = threading.Lock()
+
+    @property
+    def directory(self):
+        return self._directory
+
+    @directory.setter
+    def directory(self, directory):
+        """디렉터리를 바꾸면 다음 조회에서 새 위치의 표를 연다"""
+        with self._lock:
+            self._directory = directory
+            self._index = None
+
+    @property
+    def limit(self):
+        """현재 매핑된 표의 상한 (없으면 0)"""
+        index = self._index
+        return index.limit if index is not None else 0
+
+    def _path(self, kind, limit):
+        return os.path.join(self.directory, f'{kind}_{limit}.npy')
+
+    def _stored_limits(self):
+        try:
+            names = os.listdir(self.directory)
+        except FileNotFoundError:
+            return []
+        return sorted(int(match.group(1)) for match in map(FILE_PATTERN.match, names) if match)
+
+    def _open(self, limit):
+        words = np.load(self._path('odd_bitset', limit), mmap_mode='r').view('<u8')
+        pi_table = np.load(self._path('pi_table', limit), mmap_mode='r')
+        return sieve.PrimeIndex(limit, words=words, pi_table=pi_table)
+
+    def _temp_path(self):
+        fd, path = tempfile.mkstemp(dir=self.directory, suffix='.npy.tmp')
+        os.close(fd)
+        return path
+
+    def _rounded(self, limit):
+        """limit 이상을 덮는 홀수 인덱스 수 (granule의 배수)"""
+        return -(-((limit + 1) // 2) // self.granule) * self.granule
+
+    def index(self, limit, mapper=map):
+        """limit 이하를 덮는 PrimeIndex (필요하면 디스크의 표를 다시 열거나 키움)"""
+        index = self._index
+        if index is not None and index.limit >= limit:
+            return index
+        with self._lock:
+            index = self._index
+            if index is None or index.limit < limit:
+                index = self._index = self._load(limit, mapper)
+            return index
+
+    def _load(self, limit, mapper):
+        if self.directory is None:
+            return sieve.PrimeIndex(2 * self._rounded(limit), mapper=mapper)
+        stored = self._stored_limits()
+        if stored and stored[-1] >= limit:
+            try:
+                return self._open(stored[-1])
+            except FileNotFoundError:
+                # 다른 프로세스가 표를 키우고 이전 파일을 지운 경우
+                return self._load(limit, mapper)
+        return self._grow(limit, self._open(stored[-1]) if stored else None, mapper)
+
+    def _grow(self, limit, old, mapper):
+        """기존 표(old)를 복사하고 새 구간만 체로 걸러 더 큰 표를 저장"""
+        k_new = self._rounded(limit)
+        k_old = old.limit // 2 if old is not None else 0
+        w_old = k_old // 64
+        new_limit = 2 * k_new
+        os.makedirs(self.directory, exist_ok=True)
+
+        # 비트셋: 이전 워드 + 새 블록 + 빈 워드 하나
+        bits_tmp = self._temp_path()
+        words = np.lib.format.open_memmap(bits_tmp, mode='w+', dtype='<u8', shape=(k_new // 64 + 1,))
+        words[:w_old] = old.words[:w_old] if old is not None else 0
+        as_bytes = words.view(np.uint8)
+        for start, _, bits in sieve.iter_bit_blocks(k_old, k_new, mapper):
+            as_bytes[start // 8:start // 8 + len(bits)] = bits
+        words[-1] = 0
+
+        # 누적 개수: 이전 표를 그대로 두고 새 워드만 누적
+        pi_tmp = self._temp_path()
+        pi_table = np.lib.format.open_memmap(pi_tmp, mode='w+', dtype=sieve.count_dtype(new_limit),
+                                             shape=(len(words),))
+        pi_table[:w_old + 1] = old.pi_table[:w_old + 1] if old is not None else 0
+        sieve.prefix_counts(words, pi_table, start=w_old)
+
+        words.flush()
+        pi_table.flush()
+        del words, as_bytes, pi_table
+        os.replace(pi_tmp, self._path('pi_table', new_limit))
+        os.replace(bits_tmp, self._path('odd_bitset', new_limit))
+
+        for stored in self._stored_limits():
+            if stored < new_limit:
+                for kind in ('odd_bitset', 'pi_table'):
+                    try:
+                        os.remove(self._path(kind, stored))
+                    except FileNotFoundError:
+                        pass
+        return self._open(new_limit)
+
+    def is_prime(self, n):
+        """매핑된 표 범위 안이면 비트 조회 결과, 범위 밖이면 None (표를 키우지 않음)"""
+        index = self._index
+        if index is None or not 0 <= n <= index.limit:
+            return None
+        return index.is_prime(n)
+
+
+# 앱 전체에서 공유하는 소수 표 (math_routes.configure_services와 렌더 워커 초기화에서 디렉터리 설정)
+prime_table = PrimeTable()
@@ -2,55 +2,190 @@
 간(☶): 소수 검증 및 시각화 모듈
 """
 
+import time
 import numpy as np
-import matplotlib.pyplot as plt
-from ...services.utils.config import configure_matplotlib
-from ...services.visualization.base64_encoder import save_plot_to_base64
+from . import prime_counting, prime_gaps, primality
+from .prime_table import prime_table
+from ...services.utils.config import (GAP_CONFIG, PRIMALITY_CONFIG, PRIME_COUNTING_CONFIG, SIEVE_CONFIG,
+                                      configure_matplotlib)
+from ...services.utils.events import NullSink
+from ...services.visualization.base64_encoder import save_plot_to_png
+from ...services.visualization.figures import create_figure
 
 configure_matplotlib()
 
 class PrimesVerification:
     """소수 관련 수학적 검증 클래스"""
     
+    def __init__(self, sink=None, mapper=map):
+        self.sink = sink or NullSink()
+        self.mapper = mapper
+
+    def prime_index(self, limit):
+        """limit 이상을 덮는 PrimeIndex (공유 소수 표를 읽기 전용으로 매핑, 부족하면 새 구간만 체로 추가)"""
+        return prime_table.index(max(limit, 1000), mapper=self.mapper)
+    
     def sieve_of_eratosthenes(self, limit):
-        """에라토스테네스의 체로 소수 찾기"""
-        is_prime = [True] * (limit + 1)
-        is_prime[0] = is_prime[1] = False
-        
-        for i in range(2, int(limit**0.5) + 1):
-            if is_prime[i]:
-                for j in range(i*i, limit + 1, i):
-                    is_prime[j] = False
-        
-        return [i for i in range(2, limit + 1) if is_prime[i]]
+        """에라토스테네스의 체로 소수 찾기 (공유 소수 표의 홀수 비트셋에서 읽음)"""
+        return self.prime_index(limit).primes(2, limit + 1).tolist()
     
     def is_prime(self, n):
-        """소수 판별 함수"""
-        if n < 2:
-            return False
-        if n == 2:
-            return True
-        if n % 2 == 0:
-            return False
-        for i in range(3, int(n**0.5) + 1, 2):
-            if n % i == 0:
-                return False
-        return True
+        """소수 판별 함수 (64비트 이하는 결정적, 그보다 크면 확률적 밀러-라빈)"""
+        return primality.is_prime(n)
     
-    def verify_primes_with_visualization(self):
-        """간(☶): 소수 검증 및 시각화"""
-        print("\n" + "=" * 50)
-        print("🔢 간(☶): 소수 검증 및 시각화")
-        print("=" * 50)
+    def verify_primes_with_visualization(self, plot_mode='png', limit=SIEVE_CONFIG['limit'],
+                                         mersenne=PRIMALITY_CONFIG['mersenne_exponent'], gaps=GAP_CONFIG['limit']):
+        """간(☶): 소수 검증 및 시각화
+
+        plot_mode: 'png'(그래프 PNG), 'data'(그래프의 원본 데이터), 'none'(그래프 없음)
+        limit: 체를 한 번 돌리는 상한 (π(limit)과 소수 정리 그래프의 범위, 색인은 요청 간에 재사용)
+        mersenne: 뤼카-레머 판정법으로 검사할 메르센 지수 p의 상한 (지수들은 mapper로 분산)
+        gaps: 소수 간격 통계의 상한 (블록별 부분 통계를 mapper로 계산해 합치므로 소수 목록을 두지 않음)
+        """
+        start = time.perf_counter()
+
+        # 0. limit까지 한 번만 체를 돌린 소수 색인 (π(x)는 누적 개수 표에서 바로 조회)
+        sieve_start = time.perf_counter()
+        index = self.prime_index(limit)
+        tail = index.primes(max(2, limit - 1000), limit + 1)
+        large_sieve = {
+            'limit': limit,
+            'prime_count': index.pi(limit),
+            'largest_prime': int(tail[-1]) if len(tail) else None,
+            'compute_time': time.perf_counter() - sieve_start
+        }
+        
+        # 1. 100까지의 소수 찾기
+        primes = index.primes(2, 101).tolist()
+        
+        # 2. 소수 분포 (Prime Number Theorem): 2 .. limit 로그 간격 점의 π(x)를 한 번에 조회
+        x_range = np.unique(np.geomspace(2, max(limit, 1000), 100).round().astype(np.int64))
+        actual_count = index.pi(x_range)
+        # 소수 정리: π(x) ~ x/ln(x)
+        theoretical_count = x_range / np.log(x_range)
         
-        # 1. 에라토스테네스의 체 시각화
-        fig, ((ax1, ax2), (ax3, ax4)) = plt.subplots(2, 2, figsize=(15, 12))
+        # 3. 메르센 소수 (2^p - 1 형태의 소수): mersenne 이하 모든 소수 지수를 작은 인수 시행 나눗셈과
+        #    뤼카-레머 판정법으로 검사
+        mersenne_start = time.perf_counter()
+        mersenne_primes = primality.mersenne_exponents(mersenne, mapper=self.mapper)
+        mersenne_time = time.perf_counter() - mersenne_start
+        
+        # 4. 소수 간격 분포: gaps 이하 소수의 간격 히스토그램, 기록 간격, 쌍둥이/사촌/섹시 소수 쌍
+        gap_start = time.perf_counter()
+        gap_stats = prime_gaps.gap_statistics(2, gaps + 1, mapper=self.mapper).summary()
+        gap_time = time.perf_counter() - gap_start
+        
+        # 검증 결과 계산
+        results = {
+            'prime_counts': {
+                '100 이하 소수 개수': len(primes),
+                '가장 큰 소수 (100 이하)': max(primes),
+                '소수 밀도 (100 이하)': len(primes) / 100
+            },
+            'prime_theorem': {
+                '실제 π(100)': index.pi(100),
+                '이론값 100/ln(100)': 100 / np.log(100),
+                '오차율': abs(index.pi(100) - 100/np.log(100)) / (100/np.log(100)) * 100
+            },
+            'mersenne_primes': {
+                '계산된 메르센 소수': len(mersenne_primes),
+                '첫 번째 메르센 소수': f"2^{mersenne_primes[0]} - 1 = {2**mersenne_primes[0] - 1}" if mersenne_primes else "없음",
+                '검사한 최대 지수': mersenne,
+                '메르센 소수 지수': mersenne_primes,
+                '검사 시간': mersenne_time
+            },
+            'prime_gaps': {
+                '가장 흔한 간격': gap_stats['most_common_gap'],
+                '최대 간격': gap_stats['max_gap'],
+                '평균 간격': gap_stats['mean_gap'],
+                '검사 상한': gaps,
+                '소수 개수': gap_stats['prime_count'],
+                '쌍둥이 소수 쌍 (p, p+2)': gap_stats['pairs']['twin'],
+                '사촌 소수 쌍 (p, p+4)': gap_stats['pairs']['cousin'],
+                '섹시 소수 쌍 (p, p+6)': gap_stats['pairs']['sexy'],
+                '기록 간격': gap_stats['maximal_gaps'],
+                '간격별 첫 등장': gap_stats['first_occurrence'],
+                '계산 시간': gap_time
+            },
+            'sieve': large_sieve
+        }
         
-        # 100까지의 소수 찾기
-        limit = 100
-        primes = self.sieve_of_eratosthenes(limit)
+        self.sink.emit('primes.computed', duration=time.perf_counter() - start,
+                       prime_count=len(primes), theorem_error_rate=results['prime_theorem']['오차율'],
+                       mersenne_count=len(mersenne_primes), sieve_limit=limit,
+                       sieve_time=large_sieve['compute_time'], gap_limit=gaps, gap_time=gap_time)
+
+        if plot_mode == 'png':
+            plots = {
+                'primes_analysis': self._plot_primes_analysis(
+                    primes, x_range, actual_count, theoretical_count, mersenne, mersenne_primes, gaps, gap_stats
+                )
+            }
+        elif plot_mode == 'data':
+            plots = {
+                'primes_analysis': {
+                    'primes': np.array(primes),
+                    'x': x_range,
+                    'prime_count': actual_count,
+                    'theoretical_count': theoretical_count,
+                    'mersenne_exponents': np.array(mersenne_primes),
+                    'gaps': np.array(gap_stats['gaps']),
+                    'gap_counts': np.array(gap_stats['gap_counts'])
+                }
+            }
+        else:
+            plots = {}
         
-        # 격자로 표시 (10x10)
+        return results, plots
+    
+    def prime_counting_table(self, max_exponent=PRIME_COUNTING_CONFIG['max_exponent'], plot_mode='png'):
+        """π(10^k) (k = 1 .. max_exponent)와 x/ln x, li(x)의 비교 (Lucy_Hedgehog, 값은 메모이즈)
+
+        plot_mode: 'png'(그래프 PNG), 'data'(그래프의 원본 데이터), 'none'(그래프 없음)
+        """
+        start = time.perf_counter()
+        table = prime_counting.compare([10**k for k in range(1, max_exponent + 1)])
+        self.sink.emit('primes.counting', duration=time.perf_counter() - start,
+                       max_exponent=max_exponent, pi=int(table['pi'][-1]))
+
+        report = {
+            'x': table['x'].tolist(),
+            'pi': table['pi'].tolist(),
+            'x_over_log': table['x_over_log'].tolist(),
+            'li': table['li'].tolist(),
+            'x_over_log_error': table['x_over_log_error'].tolist(),
+            'li_error': table['li_error'].tolist(),
+            'compute_time': time.perf_counter() - start
+        }
+        if plot_mode == 'png':
+            plots = {'prime_counting': self._plot_prime_counting(table)}
+        elif plot_mode == 'data':
+            plots = {'prime_counting': {key: table[key] for key in ('x', 'x_over_log_error', 'li_error')}}
+        else:
+            plots = {}
+        return report, plots
+
+    def _plot_prime_counting(self, table):
+        """π(x) 대비 x/ln x, li(x)의 상대 오차 (log-log)"""
+        fig = create_figure(figsize=(10, 6))
+        ax = fig.subplots()
+        ax.loglog(table['x'], np.abs(table['x_over_log_error']), 'ro-', label='|x/ln(x) − π(x)| / π(x)')
+        ax.loglog(table['x'], np.abs(table['li_error']), 'bo-', label='|li(x) − π(x)| / π(x)')
+        ax.set_xlabel('x')
+        ax.set_ylabel('Relative Error')
+        ax.set_title(f'Prime Number Theorem: Exact π(x) up to {table["x"][-1]:.0e}')
+        ax.legend()
+        ax.grid(True, alpha=0.3)
+        fig.tight_layout()
+        return save_plot_to_png(fig)
+
+    def _plot_primes_analysis(self, primes, x_range, actual_count, theoretical_count, mersenne, mersenne_primes,
+                              gap_limit, gap_stats):
+        """체, 소수 정리, 메르센 소수, 소수 간격 시각화"""
+        fig = create_figure(figsize=(15, 12))
+        ((ax1, ax2), (ax3, ax4)) = fig.subplots(2, 2)
+        
+        # 1. 에라토스테네스의 체 시각화 - 격자로 표시 (10x10)
         grid = np.zeros((10, 10))
         for i in range(1, 101):
             row, col = (i-1) // 10, (i-1) % 10
@@ -72,98 +207,38 @@ class PrimesVerification:
         ax1.set_yticks([])
         
         # 2. 소수 분포 (Prime Number Theorem)
-        x_range = np.arange(2, 1000, 10)
-        actual_count = []
-        theoretical_count = []
-        
-        for x in x_range:
-            primes_up_to_x = self.sieve_of_eratosthenes(x)
-            actual_count.append(len(primes_up_to_x))
-            # 소수 정리: π(x) ~ x/ln(x)
-            theoretical_count.append(x / np.log(x))
-        
         ax2.plot(x_range, actual_count, 'bo-', label='Actual Prime Count', markersize=3)
         ax2.plot(x_range, theoretical_count, 'r--', label='Prime Number Theorem π(x) ~ x/ln(x)', linewidth=2)
         ax2.set_xlabel('n')
         ax2.set_ylabel('π(n) (Number of Primes <= n)')
-        ax2.set_title('Prime Number Theorem Verification')
+        ax2.set_xscale('log')
+        ax2.set_yscale('log')
+        ax2.set_title(f'Prime Number Theorem Verification (n <= {x_range[-1]:,})')
         ax2.legend()
         ax2.grid(True, alpha=0.3)
         
-        # 3. 메르센 소수 (2^p - 1 형태의 소수)
-        mersenne_primes = []
-        mersenne_exponents = [2, 3, 5, 7, 13, 17, 19, 31]  # 알려진 메르센 소수의 지수들
-        
-        for p in mersenne_exponents:
-            if p <= 31:  # 계산 한계
-                mersenne_candidate = 2**p - 1
-                if self.is_prime(mersenne_candidate):
-                    mersenne_primes.append((p, mersenne_candidate))
-        
+        # 3. 메르센 소수
         if mersenne_primes:
-            exponents, values = zip(*mersenne_primes)
-            ax3.bar(range(len(exponents)), np.log10(values), 
+            # log₁₀(2ᵖ - 1) = p·log₁₀2 (2ᵖ - 1은 float 범위를 넘으므로 지수로 계산)
+            ax3.bar(range(len(mersenne_primes)), np.array(mersenne_primes) * np.log10(2),
                    color='green', alpha=0.7)
+            ax3.set_yscale('log')
             ax3.set_xlabel('Mersenne Prime Exponent p')
             ax3.set_ylabel('log₁₀(2ᵖ - 1)')
-            ax3.set_title('Mersenne Primes (2ᵖ - 1)')
-            ax3.set_xticks(range(len(exponents)))
-            ax3.set_xticklabels(exponents)
+            ax3.set_title(f'Mersenne Primes (2ᵖ - 1), p <= {mersenne:,}')
+            ax3.set_xticks(range(len(mersenne_primes)))
+            ax3.set_xticklabels(mersenne_primes, rotation=45)
             ax3.grid(True, alpha=0.3)
         
-        # 4. 소수 간격 분포
-        prime_gaps = []
-        for i in range(1, len(primes)):
-            gap = primes[i] - primes[i-1]
-            prime_gaps.append(gap)
-        
-        # 간격별 빈도
-        gap_counts = {}
-        for gap in prime_gaps:
-            gap_counts[gap] = gap_counts.get(gap, 0) + 1
-        
-        gaps = list(gap_counts.keys())
-        counts = list(gap_counts.values())
-        
-        ax4.bar(gaps, counts, color='purple', alpha=0.7)
+        # 4. 소수 간격 분포 (빈도가 여러 자릿수에 걸치므로 로그 축)
+        ax4.bar(gap_stats['gaps'], gap_stats['gap_counts'], width=1.5, color='purple', alpha=0.7)
+        ax4.set_yscale('log')
         ax4.set_xlabel('Prime Gap')
         ax4.set_ylabel('Frequency')
-        ax4.set_title('Prime Gap Distribution (<= 100)')
+        ax4.set_title(f"Prime Gap Distribution (p <= {gap_limit:,})\n"
+                      f"twin {gap_stats['pairs']['twin']:,}, cousin {gap_stats['pairs']['cousin']:,}, "
+                      f"sexy {gap_stats['pairs']['sexy']:,}, max gap {gap_stats['max_gap']}")
         ax4.grid(True, alpha=0.3)
         
-        plt.tight_layout()
-        plot1_base64 = save_plot_to_base64(fig)
-        
-        # 검증 결과 계산
-        results = {
-            'prime_counts': {
-                '100 이하 소수 개수': len(primes),
-                '가장 큰 소수 (100 이하)': max(primes),
-                '소수 밀도 (100 이하)': len(primes) / 100
-            },
-            'prime_theorem': {
-                '실제 π(100)': len(self.sieve_of_eratosthenes(100)),
-                '이론값 100/ln(100)': 100 / np.log(100),
-                '오차율': abs(len(self.sieve_of_eratosthenes(100)) - 100/np.log(100)) / (100/np.log(100)) * 100
-            },
-            'mersenne_primes': {
-                '계산된 메르센 소수': len(mersenne_primes),
-                '첫 번째 메르센 소수': f"2^{mersenne_primes[0][0]} - 1 = {mersenne_primes[0][1]}" if mersenne_primes else "없음"
-            },
-            'prime_gaps': {
-                '가장 흔한 간격': max(gap_counts, key=gap_counts.get),
-                '최대 간격': max(prime_gaps),
-                '평균 간격': np.mean(prime_gaps)
-            }
-        }
-        
-        plots = {
-            'primes_analysis': plot1_base64
-        }
-        
-        print(f"📊 소수 검증 완료:")
-        print(f"   100 이하 소수 개수: {results['prime_counts']['100 이하 소수 개수']}")
-        print(f"   소수 정리 오차율: {results['prime_theorem']['오차율']:.2f}%")
-        print(f"   메르센 소수 개수: {results['mersenne_primes']['계산된 메르센 소수']}")
-        
-        return results, plots
+        fig.tight_layout()
+        return save_plot_to_png(fig)
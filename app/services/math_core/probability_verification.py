@@ -2,96 +2,185 @@
 감(☵): 확률론 검증 및 시각화 모듈
 """
 
+import time
 import numpy as np
-import matplotlib.pyplot as plt
-import scipy.stats
-from math import sqrt
-from ..utils.config import MATH_CONSTANTS, PLOT_CONFIG
-from ..visualization.base64_encoder import save_plot_to_base64
+from ..utils.config import CLT_CONFIG, MATH_CONSTANTS, PLOT_CONFIG
+from ..utils.events import NullSink
+from ..visualization.base64_encoder import save_plot_to_png
+from ..visualization.bayes_heatmap import plot_posterior_heatmap
+from ..visualization.figures import create_figure
+from . import bayes
+from .clt import density, limit_distribution, simulate_sample_means
 from ...services.utils.config import configure_matplotlib
 
 configure_matplotlib()
 
 class ProbabilityVerification:
     """확률론 검증 클래스"""
-    
-    def __init__(self):
+
+    def __init__(self, sink=None):
+        self.sink = sink or NullSink()
         self.results = {}
         self.plots = {}
-    
-    def verify_probability_with_visualization(self):
-        """감(☵): 확률 검증 및 시각화"""
-        print("\\n" + "=" * 50)
-        print("🎲 감(☵): 확률 검증 및 시각화")
-        print("=" * 50)
-        
-        # 1. 중심극한정리
+
+    def verify_probability_with_visualization(self, seed=None, plot_mode='png', distribution='uniform',
+                                              n_samples=CLT_CONFIG['n_samples']):
+        """감(☵): 확률 검증 및 시각화
+
+        seed가 주어지면 표본 추출이 재현 가능해진다.
+        plot_mode: 'png'(그래프 PNG), 'data'(그래프의 원본 데이터), 'none'(그래프 없음)
+        distribution: 중심극한정리의 원본 분포 (uniform, exponential, bernoulli, cauchy)
+        n_samples: 표본 크기마다 만드는 표본평균 개수
+        """
+        start = time.perf_counter()
+
+        # 1. 중심극한정리 (표본 크기마다 독립된 SeedSequence 자식 스트림, 블록 단위 히스토그램)
         sample_sizes = [1, 5, 30, 100]
-        n_samples = 1000
-        
-        fig, axes = plt.subplots(2, 2, figsize=(15, 10))
-        axes = axes.flatten()
-        
-        for i, sample_size in enumerate(sample_sizes):
-            # 표본평균들 계산
-            sample_means = []
-            for _ in range(n_samples):
-                sample = np.random.uniform(0, 1, sample_size)
-                sample_means.append(np.mean(sample))
-            
-            # 히스토그램
-            axes[i].hist(sample_means, bins=50, density=True, alpha=0.7, color='skyblue')
-            
-            # 이론적 정규분포 오버레이
-            mu = 0.5  # 균등분포의 평균
-            sigma = 1/sqrt(12*sample_size)  # 표본평균의 표준편차
-            x = np.linspace(min(sample_means), max(sample_means), 100)
-            y = scipy.stats.norm.pdf(x, mu, sigma)
-            axes[i].plot(x, y, 'r-', linewidth=2, label=f'Theoretical N({mu}, {sigma:.3f}²)')
-            
-            axes[i].set_title(f'Sample Size: {sample_size}')
-            axes[i].set_xlabel('Sample Mean')
-            axes[i].set_ylabel('Density')
-            axes[i].legend()
-            axes[i].grid(True, alpha=0.3)
-        
-        plt.suptitle('Central Limit Theorem: Distribution of Sample Means by Sample Size', fontsize=14)
-        plt.tight_layout()
-        plot1_base64 = save_plot_to_base64(fig)
-        
+        streams = np.random.SeedSequence(seed).spawn(len(sample_sizes))
+        histograms = [
+            simulate_sample_means(distribution, sample_size, n_samples, np.random.default_rng(stream))
+            for sample_size, stream in zip(sample_sizes, streams)
+        ]
+
         # 2. 베이즈 정리
         prior = 0.01  # 질병 유병률 1%
         sensitivity = 0.99  # 민감도 99%
         specificity = 0.95  # 특이도 95%
-        
-        # P(양성|질병있음) × P(질병있음) + P(양성|질병없음) × P(질병없음)
-        prob_positive = sensitivity * prior + (1 - specificity) * (1 - prior)
-        
+
         # P(질병있음|양성) = P(양성|질병있음) × P(질병있음) / P(양성)
-        posterior = (sensitivity * prior) / prob_positive
-        
-        fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(15, 6))
-        
+        posterior = float(bayes.posterior(prior, sensitivity, specificity))
+
+        self.sink.emit('probability.computed', duration=time.perf_counter() - start,
+                       n_samples=n_samples, distribution=distribution,
+                       ks_distance=[h['ks_distance'] for h in histograms],
+                       prior=prior, posterior=posterior)
+
+        # 결과 저장
+        results = {
+            'prior': prior,
+            'posterior': posterior,
+            'sensitivity': sensitivity,
+            'specificity': specificity,
+            'likelihood_ratio': sensitivity / (1 - specificity),
+            'central_limit': {
+                'distribution': distribution,
+                'n_samples': n_samples,
+                'sample_sizes': sample_sizes,
+                'mean': [h['mean'] for h in histograms],
+                'std': [h['std'] for h in histograms],
+                'theoretical_std': [h['theoretical_std'] for h in histograms],
+                'ks_distance': [h['ks_distance'] for h in histograms]
+            }
+        }
+
+        if plot_mode == 'png':
+            plots = {
+                'central_limit_theorem': self._plot_central_limit(distribution, histograms),
+                'bayes_theorem': self._plot_bayes(prior, sensitivity, specificity, posterior)
+            }
+        elif plot_mode == 'data':
+            plots = {
+                'central_limit_theorem': {
+                    'sample_sizes': np.array(sample_sizes),
+                    'bin_edges': np.array([h['bin_edges'] for h in histograms]),
+                    'density': np.array([density(h) for h in histograms]),
+                    # 코시 분포는 평균과 분산이 없으므로 nan
+                    'theoretical_mean': np.nan if histograms[0]['theoretical_mean'] is None
+                                        else histograms[0]['theoretical_mean'],
+                    'theoretical_std': np.array([np.nan if h['theoretical_std'] is None else h['theoretical_std']
+                                                 for h in histograms]),
+                    'ks_distance': np.array([h['ks_distance'] for h in histograms])
+                },
+                'bayes_theorem': {
+                    'labels': ['prior', 'likelihood_ratio', 'posterior'],
+                    'values': np.array([prior, sensitivity/specificity, posterior])
+                }
+            }
+        else:
+            plots = {}
+
+        self.results['probability'] = results
+        self.plots['probability'] = plots
+        return results, plots
+
+    def bayes_grid(self, priors, sensitivities, specificities, plot_mode='none'):
+        """유병률 × 민감도 × 특이도 격자 전체의 사후확률 텐서 (한 번의 벡터 연산)
+
+        plot_mode: 'png'(히트맵 PNG), 그 외에는 그래프 없음 (텐서 자체가 원본 데이터)
+        """
+        start = time.perf_counter()
+        tensor = bayes.posterior_grid(priors, sensitivities, specificities)
+        self.sink.emit('probability.bayes_grid', duration=time.perf_counter() - start,
+                       shape=tensor.shape)
+
+        report = {
+            'prior': priors,
+            'sensitivity': sensitivities,
+            'specificity': specificities,
+            'posterior': tensor
+        }
+        if plot_mode == 'png':
+            plots = {'posterior_heatmap': plot_posterior_heatmap(priors, sensitivities, specificities, tensor)}
+        else:
+            plots = {}
+        return report, plots
+
+    def _plot_central_limit(self, distribution, histograms):
+        """시각화 1: 중심극한정리"""
+        fig = create_figure(figsize=(15, 10))
+        axes = fig.subplots(2, 2)
+        axes = axes.flatten()
+
+        for ax, histogram in zip(axes, histograms):
+            sample_size = histogram['sample_size']
+            edges = histogram['bin_edges']
+
+            # 히스토그램 (누적된 구간 개수에서 밀도 계산)
+            ax.stairs(density(histogram), edges, fill=True, alpha=0.7, color='skyblue')
+
+            # 극한 분포 오버레이: N(μ, σ²/n), 코시 분포는 표준 코시 분포
+            x = np.linspace(edges[0], edges[-1], 200)
+            y = limit_distribution(distribution, sample_size).pdf(x)
+            if histogram['theoretical_mean'] is None:
+                label = 'Standard Cauchy (no CLT)'
+            else:
+                mu, sigma = histogram['theoretical_mean'], histogram['theoretical_std']
+                label = f'Theoretical N({mu:g}, {sigma:.3f}²)'
+            ax.plot(x, y, 'r-', linewidth=2, label=label)
+
+            ax.set_title(f'Sample Size: {sample_size} (KS distance {histogram["ks_distance"]:.4f})')
+            ax.set_xlabel('Sample Mean')
+            ax.set_ylabel('Density')
+            ax.legend()
+            ax.grid(True, alpha=0.3)
+
+        n_samples = histograms[0]['n_samples']
+        fig.suptitle(f'Central Limit Theorem: {n_samples:,} Sample Means of {distribution.capitalize()} '
+                     'by Sample Size', fontsize=14)
+        fig.tight_layout()
+        return save_plot_to_png(fig)
+
+    def _plot_bayes(self, prior, sensitivity, specificity, posterior):
+        """시각화 2: 베이즈 정리"""
+        fig = create_figure(figsize=(15, 6))
+        ax1, ax2 = fig.subplots(1, 2)
+
         # 베이즈 정리 시각화
         categories = ['Prior Probability\\n(Prior)', 'Likelihood Ratio\\n(Likelihood)', 'Posterior Probability\\n(Posterior)']
         values = [prior, sensitivity/specificity, posterior]
-        
+
         bars = ax1.bar(categories, values, color=['blue', 'green', 'red'], alpha=0.7)
         ax1.set_ylabel('Probability')
         ax1.set_title('Bayes\' Theorem: Medical Diagnosis Example')
         ax1.grid(True, alpha=0.3)
-        
+
         # 값 표시
         for bar, value in zip(bars, values):
             height = bar.get_height()
             ax1.text(bar.get_x() + bar.get_width()/2., height + 0.01,
                     f'{value:.3f}', ha='center', va='bottom')
-        
+
         # 확률 분포 비교
-        x = np.linspace(0, 0.1, 1000)
-        prior_dist = np.full_like(x, prior)
-        posterior_dist = np.full_like(x, posterior)
-        
         ax2.axvline(x=prior, color='blue', linestyle='--', linewidth=2, label=f'Prior Probability = {prior:.3f}')
         ax2.axvline(x=posterior, color='red', linestyle='-', linewidth=2, label=f'Posterior Probability = {posterior:.3f}')
         ax2.set_xlabel('Probability')
@@ -100,27 +189,6 @@ class ProbabilityVerification:
         ax2.legend()
         ax2.grid(True, alpha=0.3)
         ax2.set_xlim(0, 0.5)
-        
-        plt.tight_layout()
-        plot2_base64 = save_plot_to_base64(fig)
-        
-        print(f"\\n📊 확률 검증 결과:")
-        print(f"베이즈 정리 - 사전확률: {prior:.3f}")
-        print(f"베이즈 정리 - 사후확률: {posterior:.3f}")
-        print(f"민감도: {sensitivity:.3f}, 특이도: {specificity:.3f}")
-        
-        # 결과 저장
-        self.results['probability'] = {
-            'prior': prior,
-            'posterior': posterior,
-            'sensitivity': sensitivity,
-            'specificity': specificity,
-            'likelihood_ratio': sensitivity / (1 - specificity)
-        }
-        
-        self.plots['probability'] = {
-            'central_limit_theorem': plot1_base64,
-            'bayes_theorem': plot2_base64
-        }
-        
-        return self.results['probability'], self.plots['probability']
+
+        fig.tight_layout()
+        return save_plot_to_png(fig)
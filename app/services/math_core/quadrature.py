@@ -0,0 +1,180 @@
+"""
+수치 적분(구적법) 엔진
+
+리만 합, 중점, 사다리꼴, 심프슨, 가우스-르장드르 복합 규칙과 롬베르크 외삽,
+적응형 심프슨을 제공한다. 적분 함수는 배열을 받아 배열을 돌려주는 벡터화
+함수(예: expressions.compile_expression의 결과)이면 된다.
+표본점은 chunk 크기 단위로 생성해 합하므로 n = 10^7 분할도 파이썬 반복 없이
+일정한 메모리로 계산한다. 각 규칙은 (추정값, 함수 평가 횟수)를 돌려준다.
+"""
+
+import math
+import time
+import numpy as np
+
+# 한 번에 평가하는 최대 점 수
+DEFAULT_CHUNK_SIZE = 2**20
+
+GAUSS_ORDER = 5
+
+
+def _strided_sum(func, start, step, count, offset=0.0, chunk_size=DEFAULT_CHUNK_SIZE):
+    """Σ_{i<count} f(start + (i + offset)·step) 를 청크 단위로 계산"""
+    total = 0.0
+    for first in range(0, count, chunk_size):
+        i = np.arange(first, min(first + chunk_size, count), dtype=float)
+        total += float(np.sum(func(start + (i + offset) * step)))
+    return total
+
+
+def left_riemann(func, a, b, n, chunk_size=DEFAULT_CHUNK_SIZE):
+    """왼쪽 끝점 리만 합 (1차)"""
+    h = (b - a) / n
+    return h * _strided_sum(func, a, h, n, 0.0, chunk_size), n
+
+
+def midpoint(func, a, b, n, chunk_size=DEFAULT_CHUNK_SIZE):
+    """중점 규칙 (2차)"""
+    h = (b - a) / n
+    return h * _strided_sum(func, a, h, n, 0.5, chunk_size), n
+
+
+def trapezoid(func, a, b, n, chunk_size=DEFAULT_CHUNK_SIZE):
+    """사다리꼴 규칙 (2차)"""
+    h = (b - a) / n
+    ends = float(func(np.array([a, b], dtype=float)).sum())
+    return h * (_strided_sum(func, a, h, n + 1, 0.0, chunk_size) - ends / 2), n + 1
+
+
+def simpson(func, a, b, n, chunk_size=DEFAULT_CHUNK_SIZE):
+    """심프슨 규칙 (4차, n은 짝수로 올림)"""
+    n += n % 2
+    h = (b - a) / n
+    ends = float(func(np.array([a, b], dtype=float)).sum())
+    odd = _strided_sum(func, a, 2 * h, n // 2, 0.5, chunk_size)
+    even = _strided_sum(func, a + 2 * h, 2 * h, n // 2 - 1, 0.0, chunk_size)
+    return h / 3 * (ends + 4 * odd + 2 * even), n + 1
+
+
+def gauss_legendre(func, a, b, n, order=GAUSS_ORDER, chunk_size=DEFAULT_CHUNK_SIZE):
+    """구간 n개에 각각 order점 가우스-르장드르 (2·order차)"""
+    h = (b - a) / n
+    nodes, weights = np.polynomial.legendre.leggauss(order)
+    total = sum(weight * _strided_sum(func, a, h, n, 0.5 + node / 2, chunk_size)
+                for node, weight in zip(nodes, weights))
+    return h / 2 * total, n * order
+
+
+def romberg(func, a, b, n, chunk_size=DEFAULT_CHUNK_SIZE):
+    """롬베르크 외삽: 사다리꼴 2^k 분할(k ≤ log₂ n)에 리처드슨 외삽을 반복
+
+    각 단계는 이전 단계의 점을 재사용하고 새 중점만 평가한다.
+    """
+    levels = max(0, int(math.log2(n)))
+    h = b - a
+    row = [h / 2 * float(func(np.array([a, b], dtype=float)).sum())]
+    for k in range(1, levels + 1):
+        # 새 중점 2^(k-1)개만 평가
+        midpoints = _strided_sum(func, a, h, 2**(k - 1), 0.5, chunk_size)
+        h /= 2
+        new_row = [row[0] / 2 + h * midpoints]
+        for j in range(1, k + 1):
+            new_row.append(new_row[j - 1] + (new_row[j - 1] - row[j - 1]) / (4**j - 1))
+        row = new_row
+    return row[-1], 2**levels + 1
+
+
+def adaptive_simpson(func, a, b, tol=1e-8, max_intervals=2**20):
+    """적응형 심프슨 (단계마다 모든 미수렴 구간을 한 번에 벡터화해 분할)
+
+    구간 [l, r]에서 S(l, r)과 두 반쪽의 합 S₂를 비교해 |S₂ − S| < 15·tol·(r − l)/(b − a)
+    이면 S₂ + (S₂ − S)/15 를 받아들이고, 아니면 두 반쪽으로 나눠 다음 단계로 넘긴다.
+    반환: (추정값, 함수 평가 횟수)
+    """
+    left = np.array([a], dtype=float)
+    right = np.array([b], dtype=float)
+    f_left, f_right = func(left), func(right)
+    mid = (left + right) / 2
+    f_mid = func(mid)
+    whole = (right - left) / 6 * (f_left + 4 * f_mid + f_right)
+    evaluations = 3
+
+    total = 0.0
+    while len(left):
+        quarter_left, quarter_right = (left + mid) / 2, (mid + right) / 2
+        f_ql, f_qr = func(quarter_left), func(quarter_right)
+        evaluations += 2 * len(left)
+        half = (mid - left) / 6
+        left_half = half * (f_left + 4 * f_ql + f_mid)
+        right_half = half * (f_mid + 4 * f_qr + f_right)
+        delta = left_half + right_half - whole
+
+        done = np.abs(delta) < 15 * tol * (right - left) / (b - a)
+        if 2 * np.count_nonzero(~done) > max_intervals:
+            # 분할 한도 초과: 남은 구간은 현재 값으로 확정
+            done[:] = True
+        total += float(np.sum((left_half + right_half + delta / 15)[done]))
+
+        keep = ~done
+        left, mid, right = (np.concatenate([left[keep], mid[keep]]),
+                            np.concatenate([quarter_left[keep], quarter_right[keep]]),
+                            np.concatenate([mid[keep], right[keep]]))
+        f_left, f_mid, f_right = (np.concatenate([f_left[keep], f_mid[keep]]),
+                                  np.concatenate([f_ql[keep], f_qr[keep]]),
+                                  np.concatenate([f_mid[keep], f_right[keep]]))
+        whole = np.concatenate([left_half[keep], right_half[keep]])
+    return total, evaluations
+
+
+RULES = {
+    'left_riemann': left_riemann,
+    'midpoint': midpoint,
+    'trapezoid': trapezoid,
+    'simpson': simpson,
+    'gauss_legendre': gauss_legendre,
+    'romberg': romberg,
+}
+
+
+def convergence_order(evaluations, errors, floor=1e-13):
+    """log 오차 ~ log 평가 횟수 기울기 (반올림 오차 바닥 위의 점만 사용, 부족하면 None)"""
+    evaluations, errors = np.asarray(evaluations, dtype=float), np.asarray(errors, dtype=float)
+    usable = errors > floor
+    if usable.sum() < 2:
+        return None
+    return float(-np.polyfit(np.log(evaluations[usable]), np.log(errors[usable]), 1)[0])
+
+
+def _measure(rule, *args):
+    start = time.perf_counter()
+    estimate, evaluations = rule(*args)
+    return estimate, evaluations, time.perf_counter() - start
+
+
+def benchmark(func, a, b, exact, rules=tuple(RULES), subdivisions=None, tolerances=None):
+    """규칙별 분할 수에 따른 오차, 함수 평가 횟수, 소요 시간과 수렴 차수
+
+    subdivisions: 고정 규칙의 분할 수 목록 (기본 2^1 .. 2^16)
+    tolerances: 적응형 심프슨의 허용 오차 목록 (기본 10^-2 .. 10^-12)
+    """
+    if subdivisions is None:
+        subdivisions = [2**k for k in range(1, 17)]
+    if tolerances is None:
+        tolerances = [10.0**-k for k in range(2, 13, 2)]
+    floor = 1e-13 * max(1.0, abs(exact))
+
+    report = {}
+    runs = {name: [(RULES[name], func, a, b, n) for n in subdivisions] for name in rules}
+    runs['adaptive_simpson'] = [(adaptive_simpson, func, a, b, tol) for tol in tolerances]
+    for name, calls in runs.items():
+        measured = [_measure(*call) for call in calls]
+        evaluations = [evals for _, evals, _ in measured]
+        errors = [abs(estimate - exact) for estimate, _, _ in measured]
+        report[name] = {
+            'evaluations': evaluations,
+            'estimates': [estimate for estimate, _, _ in measured],
+            'errors': errors,
+            'times': [elapsed for _, _, elapsed in measured],
+            'convergence_order': convergence_order(evaluations, errors, floor)
+        }
+    return report
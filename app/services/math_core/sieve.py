@@ -0,0 +1,250 @@
+"""
+구간 분할 에라토스테네스의 체
+
+홀수만 저장한다: 인덱스 k는 수 2k + 1을 나타낸다 (2는 따로 처리).
+체는 블록 단위로 나눠 실행하고, 블록 안에서는 캐시에 들어가는 크기의 구간마다
+bool 배열 하나를 재사용해 √hi 이하 기저 소수의 배수를 NumPy 슬라이스로 지운 뒤
+비트로 압축(np.packbits, little 비트 순서)해 모은다. 블록은 서로 독립이므로
+mapper(예: 프로세스 풀의 map)로 여러 프로세스에 나눠 실행할 수 있고,
+블록 결과를 window개씩만 받아 처리하므로 10^9까지도 메모리 사용량이 일정하다.
+
+PrimeIndex는 한 번 만든 비트셋 위에 64비트 워드 단위 누적 개수(pi_table)를 두어
+임의의 x 배열에 대한 π(x)를 체를 다시 돌리지 않고 한 번의 인덱싱으로 계산한다.
+"""
+
+from itertools import chain
+from math import isqrt
+import numpy as np
+from ..utils.events import check_cancelled
+
+# 한 번에 지우는 구간의 홀수 개수 (bool 1MB, 캐시에 머무는 크기)
+DEFAULT_SEGMENT_SIZE = 2**20
+
+# 프로세스 하나가 맡는 블록의 홀수 개수 (비트 압축 시 2MB, 2^25개 수)
+DEFAULT_BLOCK_SIZE = 2**24
+
+# mapper에 한 번에 넘기는 블록 수 (스트리밍 시 동시에 보관하는 블록 결과 수)
+DEFAULT_WINDOW = 8
+
+
+def _odd_base_primes(limit):
+    """limit 이하의 홀수 소수 (기저 소수, 작은 홀수 전용 체)"""
+    if limit < 3:
+        return np.empty(0, dtype=np.int64)
+    size = (limit - 1) // 2  # 3, 5, ..., limit 이하 홀수
+    is_prime = np.ones(size, dtype=bool)
+    for i in range((isqrt(limit) - 1) // 2):
+        if is_prime[i]:
+            p = 2 * i + 3
+            is_prime[(p * p - 3) // 2::p] = False
+    return 2 * np.flatnonzero(is_prime).astype(np.int64) + 3
+
+
+def _sieve_segment(k0, k1, base_primes, segment):
+    """segment[:k1 - k0] ← 수 2k + 1 (k0 ≤ k < k1)이 소수인지"""
+    view = segment[:k1 - k0]
+    view[:] = True
+    low, high = 2 * k0 + 1, 2 * k1 - 1
+    primes = base_primes[base_primes * base_primes <= high]
+    # 구간 안 첫 홀수 배수 (p²보다 작은 배수는 더 작은 소수가 이미 지움)
+    first = -(-low // primes)
+    first += first % 2 == 0
+    starts = (np.maximum(first * primes, primes * primes) - 1) // 2 - k0
+    for p, start in zip(primes.tolist(), starts.tolist()):
+        view[start::p] = False
+    if k0 == 0:
+        view[0] = False  # 1은 소수가 아님
+    return view
+
+
+def _sieve_block(task):
+    """블록 하나를 체로 걸러 비트로 압축 (워커 프로세스에서 호출되므로 모듈 최상위 함수)
+
+    task: (k0, k1, segment_size), 반환: 홀수 인덱스 [k0, k1)의 소수 비트 (uint8)
+    """
+    k0, k1, segment_size = task
+    base_primes = _odd_base_primes(isqrt(2 * k1 - 1))
+    segment_size -= segment_size % 8
+    bits = np.empty((k1 - k0 + 7) // 8, dtype=np.uint8)
+    segment = np.empty(segment_size, dtype=bool)
+    for start in range(k0, k1, segment_size):
+        stop = min(start + segment_size, k1)
+        offset = (start - k0) // 8
+        packed = np.packbits(_sieve_segment(start, stop, base_primes, segment), bitorder='little')
+        bits[offset:offset + len(packed)] = packed
+    return bits
+
+
+def _bits_to_primes(bits, k0, k1):
+    """압축 비트 → 소수 배열 (홀수 인덱스 k0부터)"""
+    flags = np.unpackbits(bits, count=k1 - k0, bitorder='little')
+    return 2 * (np.flatnonzero(flags) + k0) + 1
+
+
+def _blocks(k0, k1, block_size, segment_size):
+    return [(start, min(start + block_size, k1), segment_size) for start in range(k0, k1, block_size)]
+
+
+def map_blocks(func, tasks, mapper=map, window=DEFAULT_WINDOW):
+    """블록 작업마다 func(task)를 window개씩 mapper로 실행해 (작업, 결과)를 순서대로 생성
+
+    func는 워커에서 import할 수 있는 모듈 최상위 함수여야 한다.
+    창 사이마다 취소 여부를 확인한다 (cancel_scope 안에서 실행 중이면 CancelledError).
+    """
+    if len(tasks) == 1:
+        # 블록이 하나면 프로세스 간 전송 비용만 생기므로 직접 실행
+        mapper = map
+    for first in range(0, len(tasks), window):
+        check_cancelled()
+        group = tasks[first:first + window]
+        yield from zip(group, mapper(func, group))
+
+
+def iter_bit_blocks(k0, k1, mapper=map, block_size=DEFAULT_BLOCK_SIZE, segment_size=DEFAULT_SEGMENT_SIZE,
+                    window=DEFAULT_WINDOW):
+    """홀수 인덱스 [k0, k1)의 (블록 시작 인덱스, 끝 인덱스, 압축 비트)를 순서대로 생성
+
+    블록은 window개씩 mapper로 계산한다. k0와 block_size가 8의 배수이면 블록 비트를
+    바이트 단위로 그대로 이어 붙일 수 있다.
+    """
+    tasks = _blocks(k0, k1, block_size, segment_size)
+    for (start, stop, _), bits in map_blocks(_sieve_block, tasks, mapper, window):
+        yield start, stop, bits
+
+
+def block_tasks(lo, hi, block_size=DEFAULT_BLOCK_SIZE, segment_size=DEFAULT_SEGMENT_SIZE):
+    """lo ≤ n < hi 인 홀수를 덮는 블록 작업 목록 (block_primes의 인자, 소수 2는 포함하지 않음)"""
+    return _blocks(max(lo, 0) // 2, hi // 2, block_size, segment_size)
+
+
+def block_primes(task):
+    """블록 작업 하나의 홀수 소수 배열 (워커 프로세스에서 호출되므로 모듈 최상위 함수)"""
+    k0, k1, _ = task
+    return _bits_to_primes(_sieve_block(task), k0, k1)
+
+
+def iter_prime_segments(lo, hi, mapper=map, block_size=DEFAULT_BLOCK_SIZE,
+                        segment_size=DEFAULT_SEGMENT_SIZE, window=DEFAULT_WINDOW):
+    """lo ≤ p < hi 인 소수를 블록별 int64 배열로 순서대로 생성
+
+    mapper: map과 같은 형태의 함수 (예: 프로세스 풀의 map). 기본값은 현재 프로세스에서 실행.
+    """
+    lo = max(lo, 2)
+    if hi <= lo:
+        return
+    if lo == 2:
+        yield np.array([2], dtype=np.int64)
+    # 홀수 인덱스 범위: 2k + 1 ≥ lo, 2k + 1 < hi
+    k0, k1 = lo // 2, hi // 2
+    for start, stop, bits in iter_bit_blocks(k0, k1, mapper, block_size, segment_size, window):
+        yield _bits_to_primes(bits, start, stop)
+
+
+def iter_primes(lo, hi, mapper=map, **options):
+    """lo ≤ p < hi 인 소수를 하나씩 생성 (블록 단위 체 위의 스트리밍)"""
+    return chain.from_iterable(segment.tolist() for segment in iter_prime_segments(lo, hi, mapper, **options))
+
+
+def primes_up_to(n, mapper=map, **options):
+    """n 이하의 모든 소수 (int64 배열)"""
+    segments = list(iter_prime_segments(2, n + 1, mapper, **options))
+    return np.concatenate(segments) if segments else np.empty(0, dtype=np.int64)
+
+
+def odd_bitset(n, mapper=map, block_size=DEFAULT_BLOCK_SIZE, segment_size=DEFAULT_SEGMENT_SIZE,
+               window=DEFAULT_WINDOW):
+    """n 이하 홀수 소수의 압축 비트셋 (비트 k ↔ 2k + 1, little 비트 순서, n/16 바이트)
+
+    block_size는 8의 배수여야 블록 비트를 이어 붙일 수 있다.
+    """
+    k1 = (n + 1) // 2
+    bits = np.zeros((k1 + 7) // 8, dtype=np.uint8)
+    for start, _, block_bits in iter_bit_blocks(0, k1, mapper, block_size, segment_size, window):
+        bits[start // 8:start // 8 + len(block_bits)] = block_bits
+    return bits
+
+
+def count_primes(n, mapper=map, block_size=DEFAULT_BLOCK_SIZE, segment_size=DEFAULT_SEGMENT_SIZE,
+                 window=DEFAULT_WINDOW):
+    """π(n): 소수를 배열로 모으지 않고 블록별 비트 수만 합산"""
+    if n < 2:
+        return 0
+    blocks = iter_bit_blocks(0, (n + 1) // 2, mapper, block_size, segment_size, window)
+    return 1 + sum(int(np.bitwise_count(bits).sum()) for _, _, bits in blocks)
+
+
+def count_dtype(limit):
+    """limit 이하 소수 개수를 담는 정수형"""
+    return np.uint32 if limit < 2**32 else np.uint64
+
+
+def prefix_counts(words, pi_table, start=0):
+    """pi_table[w] = words[:w]의 소수 비트 수 (pi_table[:start + 1]은 이미 채워져 있어야 함)"""
+    np.cumsum(np.bitwise_count(words[start:-1]), out=pi_table[start + 1:], dtype=pi_table.dtype)
+    pi_table[start + 1:] += pi_table[start]
+
+
+class PrimeIndex:
+    """limit 이하 소수의 비트셋과 워드 단위 누적 개수 표
+
+    words[w]는 홀수 인덱스 64w .. 64w + 63의 소수 비트(little-endian uint64)이고,
+    pi_table[w]는 그 앞 워드들의 홀수 소수 개수(누적합)다. π(x)는
+    pi_table[w] + popcount(words[w]의 하위 r비트) + 1(소수 2)로 벡터화해 계산한다.
+    메모리: 10^8까지 비트셋 6.25MB + 표 6.25MB.
+    """
+
+    def __init__(self, limit, words=None, pi_table=None, mapper=map, **options):
+        """words와 pi_table을 주면(예: prime_table의 읽기 전용 메모리 맵) 체를 돌리지 않고 그대로 쓴다.
+
+        words는 limit // 2 번째 비트를 포함하는 워드 다음에 빈 워드가 하나 더 있어야 한다.
+        """
+        self.limit = limit
+        if words is None:
+            bits = odd_bitset(limit, mapper=mapper, **options)
+            padded = np.zeros(-(-len(bits) // 8) * 8 + 8, dtype=np.uint8)  # 마지막 워드 다음 빈 워드
+            padded[:len(bits)] = bits
+            words = padded.view('<u8')
+        if pi_table is None:
+            pi_table = np.zeros(len(words), dtype=count_dtype(limit))
+            prefix_counts(words, pi_table)
+        self.words = words
+        self.pi_table = pi_table
+
+    def __repr__(self):
+        return f'PrimeIndex(limit={self.limit})'
+
+    def _check(self, x):
+        x = np.asarray(x, dtype=np.int64)
+        if x.size and x.max() > self.limit:
+            raise ValueError(f'x exceeds the index limit {self.limit}')
+        return x
+
+    def pi(self, x):
+        """π(x) (x는 정수 또는 배열, limit 이하)"""
+        x = self._check(x)
+        count = np.maximum(x + 1, 0) // 2  # x 이하 홀수 1, 3, ... 의 개수
+        word, rem = count // 64, (count % 64).astype(np.uint64)
+        mask = (np.uint64(1) << rem) - np.uint64(1)
+        result = (self.pi_table[word].astype(np.int64)
+                  + np.bitwise_count(self.words[word] & mask).astype(np.int64)
+                  + (x >= 2))
+        return int(result) if result.ndim == 0 else result
+
+    def is_prime(self, x):
+        """x가 소수인지 (x는 정수 또는 배열, limit 이하)"""
+        x = self._check(x)
+        k = np.maximum(x, 0) // 2
+        odd = ((self.words[k // 64] >> (k % 64).astype(np.uint64)) & np.uint64(1)).astype(bool)
+        result = (x == 2) | ((x % 2 == 1) & odd)
+        return bool(result) if result.ndim == 0 else result
+
+    def primes(self, lo, hi):
+        """lo ≤ p < hi 인 소수 배열 (hi − 1은 limit 이하)"""
+        lo, hi = max(lo, 2), min(hi, self.limit + 1)
+        if hi <= lo:
+            return np.empty(0, dtype=np.int64)
+        k0, k1 = lo // 2, hi // 2
+        flags = np.unpackbits(self.words.view(np.uint8)[k0 // 8:(k1 + 7) // 8],
+                              count=k1 - k0 // 8 * 8, bitorder='little')[k0 % 8:]
+        odd_primes = 2 * (np.flatnonzero(flags) + k0) + 1
+        return np.concatenate([[2], odd_primes]) if lo == 2 else odd_primes
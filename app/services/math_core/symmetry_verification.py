@@ -2,17 +2,22 @@
 태(☱): Symmetry Verification and Visualization Module
 """
 
+import time
 import numpy as np
-import matplotlib.pyplot as plt
 from ...services.utils.config import configure_matplotlib
+from ...services.utils.events import NullSink
 
 configure_matplotlib()
 
-from ..visualization.base64_encoder import save_plot_to_base64
+from ..visualization.base64_encoder import save_plot_to_png
+from ..visualization.figures import create_figure
 
 class SymmetryVerification:
     """Mathematical verification class for symmetry"""
     
+    def __init__(self, sink=None):
+        self.sink = sink or NullSink()
+    
     def create_rotation_matrix(self, angle):
         """Create a rotation transformation matrix"""
         cos_a, sin_a = np.cos(angle), np.sin(angle)
@@ -29,25 +34,92 @@ class SymmetryVerification:
         else:
             return np.eye(2)
     
-    def verify_symmetry_with_visualization(self):
-        """Tae (☱): Symmetry verification and visualization"""
-        print("\n" + "=" * 50)
-        print("⚖️ Tae (☱): Symmetry Verification & Visualization")
-        print("=" * 50)
-        
-        # 1. Geometric Symmetry Transformations
-        fig, ((ax1, ax2), (ax3, ax4)) = plt.subplots(2, 2, figsize=(15, 12))
+    def verify_symmetry_with_visualization(self, plot_mode='png'):
+        """Tae (☱): Symmetry verification and visualization
+
+        plot_mode: 'png'(그래프 PNG), 'data'(그래프의 원본 데이터), 'none'(그래프 없음)
+        """
+        start = time.perf_counter()
         
-        # Original shape (triangle)
+        # 1. Rotations of the original shape (triangle)
         triangle = np.array([[0, 1, 0.5, 0], [0, 0, 0.8, 0]])
+        angles = [0, np.pi/4, np.pi/2, 3*np.pi/4, np.pi]
+        rotations = [self.create_rotation_matrix(angle) @ triangle for angle in angles]
+        
+        # 2. Reflections across various axes
+        reflection_axes = ['x', 'y', 'xy']
+        reflections = [self.create_reflection_matrix(axis) @ triangle for axis in reflection_axes]
+        
+        # 3. D4 group operations on a square: 4 rotations + diagonal reflection
+        square = np.array([[-1, 1, 1, -1, -1], [-1, -1, 1, 1, -1]])
+        operations = []
+        for i in range(4):
+            R = self.create_rotation_matrix(i * np.pi/2)
+            operations.append(('rotation', i*90, R @ square))
+        diag_reflection = np.array([[0, 1], [1, 0]])
+        operations.append(('reflection', 'diagonal', diag_reflection @ square))
+        
+        # Calculate verification results
+        results = {
+            'rotation_symmetry': {
+                'Rotational Symmetries of n-gon': 'n',
+                'Rotational Symmetries of Circle': 'Infinite',
+                'Square Rotation Angles': [0, 90, 180, 270]
+            },
+            'reflection_symmetry': {
+                'Square Reflection Axes': 4,
+                'Isosceles Triangle Reflection Axes': 1,
+                'Circle Reflection Axes': 'Infinite'
+            },
+            'point_groups': {
+                'H2O Point Group': 'C₂ᵥ',
+                'CH4 Point Group': 'Tₐ',
+                'Square Point Group': 'D₄'
+            },
+            'transformation_matrices': {
+                'Determinant of 90-deg Rotation Matrix': np.linalg.det(self.create_rotation_matrix(np.pi/2)),
+                'Determinant of x-axis Reflection Matrix': np.linalg.det(self.create_reflection_matrix('x')),
+                'Transformation Invariance': 'Preserves distance and angles'
+            }
+        }
+        
+        self.sink.emit('symmetry.computed', duration=time.perf_counter() - start,
+                       rotation_det=results['transformation_matrices']['Determinant of 90-deg Rotation Matrix'],
+                       reflection_det=results['transformation_matrices']['Determinant of x-axis Reflection Matrix'])
+
+        if plot_mode == 'png':
+            plots = {
+                'symmetry_analysis': self._plot_symmetry_analysis(
+                    triangle, angles, rotations, reflections, operations
+                )
+            }
+        elif plot_mode == 'data':
+            plots = {
+                'symmetry_analysis': {
+                    'triangle': triangle,
+                    'rotation_angles': np.degrees(angles),
+                    'rotations': np.array(rotations),
+                    'reflection_axes': reflection_axes,
+                    'reflections': np.array(reflections),
+                    'd4_operations': [f'{op_type} {angle}' for op_type, angle, _ in operations],
+                    'd4_squares': np.array([transformed for _, _, transformed in operations])
+                }
+            }
+        else:
+            plots = {}
+        
+        return results, plots
+    
+    def _plot_symmetry_analysis(self, triangle, angles, rotations, reflections, operations):
+        """Plot rotation, reflection, molecular and D4 group symmetry"""
+        # 1. Geometric Symmetry Transformations
+        fig = create_figure(figsize=(15, 12))
+        ((ax1, ax2), (ax3, ax4)) = fig.subplots(2, 2)
         
         # Rotation transformations
         colors = ['red', 'blue', 'green', 'orange', 'purple']
-        angles = [0, np.pi/4, np.pi/2, 3*np.pi/4, np.pi]
         
-        for i, angle in enumerate(angles):
-            R = self.create_rotation_matrix(angle)
-            rotated = R @ triangle
+        for i, (angle, rotated) in enumerate(zip(angles, rotations)):
             ax1.plot(rotated[0], rotated[1], 'o-', color=colors[i], 
                     label=f'{angle*180/np.pi:.0f}°', linewidth=2, markersize=4)
         
@@ -58,20 +130,14 @@ class SymmetryVerification:
         ax1.legend()
         ax1.set_title('Rotational Symmetry (Triangle)')
         
-        # 2. Reflection Symmetry
-        original = np.array([[0, 1, 0.5, 0], [0, 0, 0.8, 0]])
-        
-        # Reflections across various axes
-        reflections = ['x', 'y', 'xy']
+        # 2. Reflection Symmetry (across various axes)
         reflection_names = ['x-axis reflection', 'y-axis reflection', 'y=x reflection']
         colors_ref = ['red', 'blue', 'green', 'purple']
         
-        ax2.plot(original[0], original[1], 'o-', color='black', 
+        ax2.plot(triangle[0], triangle[1], 'o-', color='black', 
                 linewidth=3, markersize=6, label='Original')
         
-        for i, axis in enumerate(reflections):
-            R = self.create_reflection_matrix(axis)
-            reflected = R @ original
+        for i, reflected in enumerate(reflections):
             ax2.plot(reflected[0], reflected[1], 'o--', color=colors_ref[i+1], 
                     linewidth=2, markersize=4, label=reflection_names[i])
         
@@ -117,21 +183,6 @@ class SymmetryVerification:
         ax3.set_title('Molecular Symmetry (H₂O, C₂ᵥ Point Group)')
         
         # 4. Group Theory Symmetry (D4 Group)
-        # Symmetry operations of a square
-        square = np.array([[-1, 1, 1, -1, -1], [-1, -1, 1, 1, -1]])
-        
-        # 8 elements of D4 group: {e, r, r², r³, s, sr, sr², sr³}
-        operations = []
-        
-        # Rotations (by 90 degrees)
-        for i in range(4):
-            R = self.create_rotation_matrix(i * np.pi/2)
-            operations.append(('rotation', i*90, R @ square))
-        
-        # Reflection (diagonal)
-        diag_reflection = np.array([[0, 1], [1, 0]])
-        operations.append(('reflection', 'diagonal', diag_reflection @ square))
-        
         # Display results of several symmetry operations
         for i, (op_type, angle, transformed) in enumerate(operations[:5]):
             alpha = 1.0 - i * 0.15
@@ -151,40 +202,5 @@ class SymmetryVerification:
         ax4.legend()
         ax4.set_title('D₄ Point Group Symmetry of a Square')
         
-        plt.tight_layout()
-        plot1_base64 = save_plot_to_base64(fig)
-        
-        # Calculate verification results
-        results = {
-            'rotation_symmetry': {
-                'Rotational Symmetries of n-gon': 'n',
-                'Rotational Symmetries of Circle': 'Infinite',
-                'Square Rotation Angles': [0, 90, 180, 270]
-            },
-            'reflection_symmetry': {
-                'Square Reflection Axes': 4,
-                'Isosceles Triangle Reflection Axes': 1,
-                'Circle Reflection Axes': 'Infinite'
-            },
-            'point_groups': {
-                'H2O Point Group': 'C₂ᵥ',
-                'CH4 Point Group': 'Tₐ',
-                'Square Point Group': 'D₄'
-            },
-            'transformation_matrices': {
-                'Determinant of 90-deg Rotation Matrix': np.linalg.det(self.create_rotation_matrix(np.pi/2)),
-                'Determinant of x-axis Reflection Matrix': np.linalg.det(self.create_reflection_matrix('x')),
-                'Transformation Invariance': 'Preserves distance and angles'
-            }
-        }
-        
-        plots = {
-            'symmetry_analysis': plot1_base64
-        }
-        
-        print(f"📊 Symmetry verification complete:")
-        print(f"   Determinant of rotation matrix: {results['transformation_matrices']['Determinant of 90-deg Rotation Matrix']:.0f}")
-        print(f"   Determinant of reflection matrix: {results['transformation_matrices']['Determinant of x-axis Reflection Matrix']:.0f}")
-        print(f"   H₂O Point Group: {results['point_groups']['H2O Point Group']}")
-        
-        return results, plots
+        fig.tight_layout()
+        return save_plot_to_png(fig)
@@ -3,25 +3,31 @@
 각 괘의 수학적 개념을 실제 파이썬 코드로 검증
 """
 
+import logging
+import time
 import numpy as np
 import sympy as sp
-import matplotlib.pyplot as plt
-import pandas as pd
 from math import pi, e, sqrt, log
-import random
 from collections import Counter
+from .math_core import bayes, continued_fraction, prime_counting, primality
+from .math_core.expressions import compile_expression
+from .symbolic_worker import symbolic_pool
+from .math_core.fibonacci import fibonacci_float, phi_ratio_error
+from .math_core.monte_carlo import parallel_estimate_pi
+from .utils.config import PRIME_COUNTING_CONFIG
+from .utils.events import LoggingSink, NullSink
 
 class MathematicalVerification:
     """8괘 수학적 개념 검증 클래스"""
     
-    def __init__(self):
+    def __init__(self, sink=None, mapper=map):
+        self.sink = sink or NullSink()
+        self.mapper = mapper
         self.results = {}
     
-    def verify_pi(self, precision=1000):
-        """건(☰): 원주율 π 검증"""
-        print("=" * 50)
-        print("🔵 건(☰): 원주율 π 검증")
-        print("=" * 50)
+    def verify_pi(self, precision=1000, seed=None):
+        """건(☰): 원주율 π 검증 (seed가 같으면 몬테카를로 결과가 같다)"""
+        start = time.perf_counter()
         
         # 1. 기본 정의: 원의 둘레/지름
         radius = 1
@@ -29,31 +35,18 @@ class MathematicalVerification:
         diameter = 2 * radius
         pi_calculated = circumference / diameter
         
-        print(f"원의 정의에서: π = 둘레/지름 = {pi_calculated:.10f}")
-        print(f"NumPy π 값: {np.pi:.10f}")
-        
         # 2. 몬테카를로 방법으로 π 추정
         n_points = 100000
-        inside_circle = 0
-        
-        for _ in range(n_points):
-            x, y = random.uniform(-1, 1), random.uniform(-1, 1)
-            if x*x + y*y <= 1:
-                inside_circle += 1
-        
-        pi_monte_carlo = 4 * inside_circle / n_points
-        print(f"몬테카를로 추정: π ≈ {pi_monte_carlo:.6f}")
+        pi_monte_carlo = parallel_estimate_pi(n_points, seed, mapper=self.mapper)['estimate']
         
         # 3. 급수를 이용한 π 계산 (라이프니츠 공식)
         pi_series = 0
         for i in range(100000):
             pi_series += (-1)**i / (2*i + 1)
         pi_leibniz = 4 * pi_series
-        print(f"라이프니츠 급수: π ≈ {pi_leibniz:.6f}")
         
         # 4. SymPy를 이용한 정확한 π
         pi_sympy = float(sp.pi.evalf(precision))
-        print(f"SymPy 고정밀: π = {pi_sympy:.10f}")
         
         self.results['pi'] = {
             'definition': pi_calculated,
@@ -62,14 +55,15 @@ class MathematicalVerification:
             'sympy': pi_sympy,
             'numpy': np.pi
         }
+        self.sink.emit('pi.verified', duration=time.perf_counter() - start,
+                       monte_carlo_error=abs(pi_monte_carlo - pi),
+                       leibniz_error=abs(pi_leibniz - pi))
         
         return self.results['pi']
     
     def verify_binary(self):
         """곤(☷): 이진법 검증"""
-        print("\n" + "=" * 50)
-        print("🔵 곤(☷): 이진법 검증")
-        print("=" * 50)
+        start = time.perf_counter()
         
         # 1. 이진법 변환
         numbers = [1, 7, 15, 64, 255]
@@ -83,14 +77,10 @@ class MathematicalVerification:
                 'back_to_decimal': decimal_back,
                 'correct': num == decimal_back
             }
-            print(f"{num} → {binary} → {decimal_back} ✓")
         
         # 2. 이진 연산
         a, b = 12, 7  # 1100, 0111
-        print(f"\n이진 연산 예시: {a}({bin(a)[2:]}) & {b}({bin(b)[2:]})")
-        print(f"AND: {a & b} ({bin(a & b)[2:]})")
-        print(f"OR:  {a | b} ({bin(a | b)[2:]})")
-        print(f"XOR: {a ^ b} ({bin(a ^ b)[2:]})")
+        operations = {'AND': a & b, 'OR': a | b, 'XOR': a ^ b}
         
         # 3. 8괘를 이진법으로 표현
         trigrams = {
@@ -98,120 +88,84 @@ class MathematicalVerification:
             '손': '011', '감': '010', '간': '001', '곤': '000'
         }
         
-        print(f"\n8괘의 이진 표현:")
-        for name, binary in trigrams.items():
-            decimal = int(binary, 2)
-            print(f"{name}: {binary} ({decimal})")
-        
         self.results['binary'] = {
             'conversions': binary_conversions,
             'trigrams': trigrams
         }
+        self.sink.emit('binary.verified', duration=time.perf_counter() - start,
+                       conversions_correct=all(c['correct'] for c in binary_conversions.values()),
+                       operations=operations)
         
         return self.results['binary']
     
     def verify_golden_ratio(self):
         """리(☲): 황금비 φ 검증"""
-        print("\n" + "=" * 50)
-        print("🔵 리(☲): 황금비 φ 검증")
-        print("=" * 50)
+        start = time.perf_counter()
         
         # 1. 정의에서 계산
         phi_definition = (1 + sqrt(5)) / 2
-        print(f"정의에서: φ = (1+√5)/2 = {phi_definition:.10f}")
-        
-        # 2. 피보나치 수열에서 극한
-        fib = [1, 1]
-        ratios = []
-        
-        for i in range(20):
-            fib.append(fib[-1] + fib[-2])
-            if len(fib) > 2:
-                ratio = fib[-1] / fib[-2]
-                ratios.append(ratio)
-                if i < 10:  # 처음 10개만 출력
-                    print(f"F{i+3}/F{i+2} = {fib[-1]}/{fib[-2]} = {ratio:.8f}")
         
+        # 2. 피보나치 수열에서 극한 (F(1)..F(22), 벡터화)
+        fib = fibonacci_float(np.arange(1, 23))
+        ratios = (fib[2:] / fib[1:-1]).tolist()
         phi_fibonacci = ratios[-1]
-        print(f"피보나치 극한: φ ≈ {phi_fibonacci:.10f}")
-        
-        # 3. 연분수 표현
-        def continued_fraction_phi(n_terms):
-            result = 0
-            for _ in range(n_terms):
-                result = 1 / (1 + result)
-            return 1 + result
         
-        phi_continued = continued_fraction_phi(20)
-        print(f"연분수 [1;1,1,1,...]: φ ≈ {phi_continued:.10f}")
+        # 3. 연분수 표현: [1; 1, 1, ...]의 20번째 수렴값 (= F(22)/F(21))
+        p, q = continued_fraction.constant('golden_ratio').convergents(21)[-1]
+        phi_continued = p / q
+        continued_error = phi_ratio_error(21)
         
         # 4. SymPy 정확한 값
         phi_sympy = float(((1 + sp.sqrt(5)) / 2).evalf(20))
-        print(f"SymPy 정확한 값: φ = {phi_sympy:.10f}")
-        
-        # 5. 황금비의 성질 검증
-        print(f"\n황금비 성질 검증:")
-        print(f"φ² = φ + 1: {phi_definition**2:.6f} = {phi_definition + 1:.6f} ✓")
-        print(f"1/φ = φ - 1: {1/phi_definition:.6f} = {phi_definition - 1:.6f} ✓")
         
         self.results['golden_ratio'] = {
             'definition': phi_definition,
             'fibonacci': phi_fibonacci,
             'continued_fraction': phi_continued,
             'sympy': phi_sympy,
-            'fibonacci_sequence': fib[:15],
+            'continued_fraction_error': continued_error['error'],
+            'fibonacci_sequence': [int(value) for value in fib[:15]],
             'ratios': ratios[:10]
         }
+        # 5. 황금비의 성질: φ² = φ + 1, 1/φ = φ - 1
+        self.sink.emit('golden_ratio.verified', duration=time.perf_counter() - start,
+                       fibonacci_error=abs(phi_fibonacci - phi_definition),
+                       continued_fraction_error=abs(phi_continued - phi_definition),
+                       square_identity_error=abs(phi_definition**2 - (phi_definition + 1)),
+                       reciprocal_identity_error=abs(1/phi_definition - (phi_definition - 1)))
         
         return self.results['golden_ratio']
     
-    def verify_probability(self):
-        """감(☵): 확률 검증"""
-        print("\n" + "=" * 50)
-        print("🔵 감(☵): 확률 검증")
-        print("=" * 50)
+    def verify_probability(self, seed=None):
+        """감(☵): 확률 검증 (seed가 같으면 결과가 같다)"""
+        start = time.perf_counter()
+        coin_rng, dice_rng, normal_rng = [
+            np.random.default_rng(stream) for stream in np.random.SeedSequence(seed).spawn(3)
+        ]
         
         # 1. 동전 던지기 시뮬레이션
         n_trials = 10000
-        heads = sum(1 for _ in range(n_trials) if random.random() < 0.5)
+        heads = int(np.count_nonzero(coin_rng.random(n_trials) < 0.5))
         prob_heads = heads / n_trials
         
-        print(f"동전 {n_trials}번 던지기:")
-        print(f"앞면: {heads}번 ({prob_heads:.4f})")
-        print(f"이론값: 0.5000")
-        
         # 2. 주사위 시뮬레이션
-        dice_rolls = [random.randint(1, 6) for _ in range(10000)]
-        dice_counts = Counter(dice_rolls)
-        
-        print(f"\n주사위 {len(dice_rolls)}번 던지기:")
-        for i in range(1, 7):
-            count = dice_counts[i]
-            prob = count / len(dice_rolls)
-            print(f"{i}: {count}번 ({prob:.4f}, 이론값: {1/6:.4f})")
+        dice_rolls = dice_rng.integers(1, 7, 10000)
+        dice_counts = Counter(dice_rolls.tolist())
         
         # 3. 정규분포 샘플링
-        normal_samples = np.random.normal(0, 1, 10000)
+        normal_samples = normal_rng.normal(0, 1, 10000)
         mean_sample = np.mean(normal_samples)
         std_sample = np.std(normal_samples)
         
-        print(f"\n정규분포 N(0,1) 샘플링:")
-        print(f"표본 평균: {mean_sample:.4f} (이론값: 0)")
-        print(f"표본 표준편차: {std_sample:.4f} (이론값: 1)")
-        
         # 4. 베이즈 정리 예시
         # P(병|양성) = P(양성|병) * P(병) / P(양성)
         p_disease = 0.01  # 질병 발생률 1%
         p_positive_given_disease = 0.99  # 민감도 99%
         p_positive_given_healthy = 0.05  # 위양성률 5%
         
-        p_positive = (p_positive_given_disease * p_disease + 
-                     p_positive_given_healthy * (1 - p_disease))
-        p_disease_given_positive = (p_positive_given_disease * p_disease) / p_positive
-        
-        print(f"\n베이즈 정리 (의료 검사):")
-        print(f"P(병|양성) = {p_disease_given_positive:.4f}")
-        print(f"양성이어도 실제 병일 확률은 {p_disease_given_positive*100:.1f}%")
+        p_disease_given_positive = float(bayes.posterior(
+            p_disease, p_positive_given_disease, 1 - p_positive_given_healthy
+        ))
         
         self.results['probability'] = {
             'coin_flip': prob_heads,
@@ -219,89 +173,69 @@ class MathematicalVerification:
             'normal_stats': {'mean': mean_sample, 'std': std_sample},
             'bayes_example': p_disease_given_positive
         }
+        self.sink.emit('probability.verified', duration=time.perf_counter() - start,
+                       coin_flip_error=abs(prob_heads - 0.5),
+                       dice_max_error=max(abs(dice_counts[i] / len(dice_rolls) - 1/6) for i in range(1, 7)),
+                       normal_mean=mean_sample, normal_std=std_sample,
+                       bayes_posterior=p_disease_given_positive)
         
         return self.results['probability']
     
     def verify_calculus(self):
         """진(☳): 미분, 손(☴): 적분 검증"""
-        print("\n" + "=" * 50)
-        print("🔵 진(☳): 미분 & 손(☴): 적분 검증")
-        print("=" * 50)
+        start = time.perf_counter()
         
-        # 1. 기호 미분
-        x = sp.Symbol('x')
+        # 1. 기호 미분 (식 캐시: 파싱, 미분, 적분, 컴파일을 한 번만)
         functions = [
-            ('x²', x**2, 2*x),
-            ('sin(x)', sp.sin(x), sp.cos(x)),
-            ('eˣ', sp.exp(x), sp.exp(x)),
-            ('ln(x)', sp.log(x), 1/x)
+            ('x²', compile_expression('x**2')),
+            ('sin(x)', compile_expression('sin(x)')),
+            ('eˣ', compile_expression('exp(x)')),
+            ('ln(x)', compile_expression('log(x)'))
         ]
         
-        print("기호 미분:")
-        for name, func, expected in functions:
-            derivative = sp.diff(func, x)
-            print(f"d/dx[{name}] = {derivative} ✓")
-        
-        # 2. 수치 미분
-        def numerical_derivative(f, x, h=1e-8):
-            return (f(x + h) - f(x - h)) / (2 * h)
-        
+        # 2. 수치 미분 (컴파일된 NumPy 함수의 중심 차분)
         test_point = 2
-        print(f"\n수치 미분 (x = {test_point}):")
-        for name, func, expected in functions:
-            if name != 'ln(x)':  # ln(x)는 람다로 따로 처리
-                numerical = numerical_derivative(
-                    lambda val: float(func.subs(x, val)), test_point
-                )
-                analytical = float(expected.subs(x, test_point))
-                print(f"{name}: 수치={numerical:.6f}, 해석적={analytical:.6f}")
+        derivative_errors = {
+            name: abs(float(func.central_difference(test_point, 1e-8) - func.derivative_function(test_point)))
+            for name, func in functions
+        }
         
         # 3. 기호 적분
         integrals = [
-            ('x²', x**2, x**3/3),
-            ('sin(x)', sp.sin(x), -sp.cos(x)),
-            ('eˣ', sp.exp(x), sp.exp(x)),
-            ('1/x', 1/x, sp.log(x))
+            ('x²', compile_expression('x**2')),
+            ('sin(x)', compile_expression('sin(x)')),
+            ('eˣ', compile_expression('exp(x)')),
+            ('1/x', compile_expression('1/x'))
         ]
         
-        print("\n기호 적분:")
-        for name, func, expected in integrals:
-            integral = sp.integrate(func, x)
-            print(f"∫{name}dx = {integral} + C")
-        
         # 4. 정적분 (미적분학의 기본정리)
-        print(f"\n미적분학의 기본정리 검증:")
-        func = x**2
+        func = compile_expression('x**2')
         a, b = 0, 3
         
         # 정적분 계산
-        definite_integral = sp.integrate(func, (x, a, b))
+        definite_integral = symbolic_pool.run('integrate', func.expr, (func.symbol, a, b))
         
-        # 기본정리: F(b) - F(a)
-        antiderivative = sp.integrate(func, x)
-        fundamental_theorem = antiderivative.subs(x, b) - antiderivative.subs(x, a)
-        
-        print(f"∫₀³ x² dx = {definite_integral}")
-        print(f"F(3) - F(0) = {fundamental_theorem}")
-        print(f"기본정리 성립: {definite_integral == fundamental_theorem} ✓")
+        # 기본정리: F(b) - F(a) (캐시된 부정적분)
+        fundamental_theorem = func.definite_integral(a, b)
         
         self.results['calculus'] = {
-            'derivatives': {name: str(sp.diff(func, x)) for name, func, _ in functions},
-            'integrals': {name: str(sp.integrate(func, x)) for name, func, _ in integrals},
+            'derivatives': {name: str(func.derivative) for name, func in functions},
+            'integrals': {name: str(func.antiderivative) for name, func in integrals},
             'fundamental_theorem': {
                 'definite_integral': float(definite_integral),
                 'fundamental_result': float(fundamental_theorem),
                 'equal': definite_integral == fundamental_theorem
             }
         }
+        self.sink.emit('calculus.verified', duration=time.perf_counter() - start,
+                       derivative_errors=derivative_errors,
+                       fundamental_theorem=definite_integral == fundamental_theorem)
         
         return self.results['calculus']
     
     def verify_primes(self):
         """간(☶): 소수 검증"""
-        print("\n" + "=" * 50)
-        print("🔵 간(☶): 소수 검증")
-        print("=" * 50)
+        start = time.perf_counter()
         
         # 1. 에라토스테네스의 체
         def sieve_of_eratosthenes(n):
@@ -316,74 +250,49 @@ class MathematicalVerification:
             return [i for i in range(2, n + 1) if primes[i]]
         
         first_50_primes = sieve_of_eratosthenes(230)[:50]
-        print(f"처음 50개 소수:")
-        for i in range(0, 50, 10):
-            print(f"{first_50_primes[i:i+10]}")
-        
-        # 2. 소수 판별 함수
-        def is_prime(n):
-            if n < 2:
-                return False
-            for i in range(2, int(n**0.5) + 1):
-                if n % i == 0:
-                    return False
-            return True
-        
-        # 3. 소수 정리 근사
-        def prime_counting_function(n):
-            return sum(1 for i in range(2, n+1) if is_prime(i))
         
+        # 2. 소수 정리 근사 (π(x)는 Lucy_Hedgehog로 정확히 계산하고 메모이즈)
         def prime_number_theorem_approximation(n):
             return n / log(n) if n > 1 else 0
         
-        test_values = [100, 1000, 10000]
-        print(f"\n소수 정리 검증:")
-        print(f"{'n':>6} {'π(n)':>8} {'n/ln(n)':>10} {'오차율':>8}")
-        
+        test_values = [10**k for k in range(2, PRIME_COUNTING_CONFIG['max_exponent'] + 1)]
+        prime_counts = {n: prime_counting.prime_count(n) for n in test_values}
+        error_rates = {}
         for n in test_values:
-            actual = prime_counting_function(n)
+            actual = prime_counts[n]
             approx = prime_number_theorem_approximation(n)
-            error_rate = abs(actual - approx) / actual * 100
-            print(f"{n:>6} {actual:>8} {approx:>10.1f} {error_rate:>7.1f}%")
+            error_rates[n] = abs(actual - approx) / actual * 100
         
-        # 4. 메르센 소수 확인
+        # 3. 메르센 소수 확인
         mersenne_exponents = [2, 3, 5, 7, 13, 17, 19, 31]
-        print(f"\n메르센 소수 (2ᵖ - 1):")
-        
-        for p in mersenne_exponents:
-            mersenne = 2**p - 1
-            prime_check = is_prime(mersenne)
-            print(f"2^{p} - 1 = {mersenne} {'✓' if prime_check else '✗'}")
+        mersenne_checks = {p: primality.lucas_lehmer(p) for p in mersenne_exponents}
         
         self.results['primes'] = {
             'first_50_primes': first_50_primes,
-            'prime_counting': {n: prime_counting_function(n) for n in test_values},
+            'prime_counting': prime_counts,
             'prime_theorem_approx': {n: prime_number_theorem_approximation(n) for n in test_values},
+            'li_approx': {n: float(prime_counting.li(n)) for n in test_values},
             'mersenne_primes': {p: 2**p - 1 for p in mersenne_exponents}
         }
+        self.sink.emit('primes.verified', duration=time.perf_counter() - start,
+                       theorem_error_rates=error_rates,
+                       mersenne_all_prime=all(mersenne_checks.values()))
         
         return self.results['primes']
     
     def verify_symmetry(self):
         """태(☱): 대칭성 검증"""
-        print("\n" + "=" * 50)
-        print("🔵 태(☱): 대칭성 검증")
-        print("=" * 50)
+        start = time.perf_counter()
         
         # 1. 기하학적 대칭
-        print("기하학적 대칭:")
         
         # 정다각형의 회전 대칭
         def rotation_symmetries(n_sides):
             return [360 / n_sides * i for i in range(n_sides)]
         
         shapes = [3, 4, 5, 6, 8]
-        for n in shapes:
-            symmetries = rotation_symmetries(n)
-            print(f"정{n}각형: {len(symmetries)}개 회전 대칭 (각도: {symmetries[:3]}...)")
         
         # 2. 함수의 대칭성
-        print(f"\n함수의 대칭성:")
         
         # 우함수 (even function): f(-x) = f(x)
         def test_even_function(func, test_points):
@@ -401,19 +310,14 @@ class MathematicalVerification:
             ('sin(x)', lambda x: np.sin(x), 'odd'),
         ]
         
+        symmetry_checks = {}
         for name, func, expected_symmetry in functions_to_test:
-            is_even = test_even_function(func, test_points)
-            is_odd = test_odd_function(func, test_points)
-            
-            if expected_symmetry == 'even' and is_even:
-                print(f"{name}: 우함수 ✓")
-            elif expected_symmetry == 'odd' and is_odd:
-                print(f"{name}: 기함수 ✓")
+            if expected_symmetry == 'even':
+                symmetry_checks[name] = test_even_function(func, test_points)
             else:
-                print(f"{name}: 대칭성 확인 실패")
+                symmetry_checks[name] = test_odd_function(func, test_points)
         
-        # 3. 군론적 대칭 (간단한 예)
-        print(f"\n군론적 대칭 (정사각형의 대칭군 D₄):")
+        # 3. 군론적 대칭 (정사각형의 대칭군 D₄)
         
         # 정사각형의 8개 대칭: 4개 회전 + 4개 반사
         square_symmetries = {
@@ -427,11 +331,6 @@ class MathematicalVerification:
             'd2': '대각선2 반사'
         }
         
-        for sym, desc in square_symmetries.items():
-            print(f"{sym}: {desc}")
-        
-        print(f"총 8개 대칭 = 2⁴ (D₄ 군)")
-        
         # 4. 분자의 대칭성 (점군)
         molecules = {
             'H₂O': 'C₂ᵥ (2개 회전축, 2개 반사면)',
@@ -440,24 +339,21 @@ class MathematicalVerification:
             'C₆H₆': 'D₆ₕ (벤젠의 높은 대칭성)'
         }
         
-        print(f"\n분자의 점군 대칭:")
-        for molecule, symmetry in molecules.items():
-            print(f"{molecule}: {symmetry}")
-        
         self.results['symmetry'] = {
             'rotation_symmetries': {n: rotation_symmetries(n) for n in shapes},
             'function_symmetries': {name: expected_symmetry for name, _, expected_symmetry in functions_to_test},
             'square_group': square_symmetries,
             'molecular_symmetries': molecules
         }
+        self.sink.emit('symmetry.verified', duration=time.perf_counter() - start,
+                       function_symmetries=symmetry_checks,
+                       square_group_order=len(square_symmetries))
         
         return self.results['symmetry']
     
     def run_all_verifications(self):
         """모든 8괘 수학적 검증 실행"""
-        print("🔵" * 20)
-        print("주역 8괘 수학적 검증 시스템")
-        print("🔵" * 20)
+        start = time.perf_counter()
         
         verifications = [
             self.verify_pi,
@@ -473,17 +369,17 @@ class MathematicalVerification:
             try:
                 verification()
             except Exception as e:
-                print(f"오류 발생: {e}")
+                self.sink.emit('verification.failed', verification=verification.__name__, error=str(e))
         
-        print("\n" + "🔵" * 20)
-        print("모든 검증 완료!")
-        print("🔵" * 20)
+        self.sink.emit('all.verified', duration=time.perf_counter() - start,
+                       completed=len(self.results), total=len(verifications))
         
         return self.results
 
 # 실행 예시
 if __name__ == "__main__":
-    verifier = MathematicalVerification()
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
+    verifier = MathematicalVerification(sink=LoggingSink())
     results = verifier.run_all_verifications()
     
     # 결과 요약
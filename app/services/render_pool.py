@@ -0,0 +1,187 @@
+"""
+무거운 검증 작업을 위한 프로세스 풀
+
+소수/e/확률 검증처럼 CPU를 많이 쓰는 그래프 생성은 요청 스레드에서 GIL을 잡고 있어
+워커 전체를 직렬화한다. 이 모듈은 numpy, matplotlib, scipy, sympy를 미리 import하고
+math_core 검증 클래스를 미리 생성해 둔 워커 프로세스들에 검증을 보내 여러 코어를 사용한다.
+
+cancel_scope 안에서 제출한 검증은 공유 메모리 취소 플래그 한 칸을 받는다. 부모가 취소하면
+플래그를 세우고, 워커의 검증기는 다음 emit 지점에서 이를 보고 CancelledError로 멈춘다.
+"""
+
+import atexit
+import multiprocessing
+import threading
+import time
+from concurrent.futures import CancelledError, ProcessPoolExecutor, TimeoutError as FutureTimeoutError
+from .utils.events import CancellableSink, NullSink, cancel_scope, check_cancelled, current_cancel_event
+
+# 검증 이름 → (math_core 클래스 이름, 메서드 이름)
+VERIFIER_METHODS = {
+    'pi': ('PiVerification', 'verify_pi_with_visualization'),
+    'golden-ratio': ('PhiVerification', 'verify_golden_ratio_with_visualization'),
+    'probability': ('ProbabilityVerification', 'verify_probability_with_visualization'),
+    'calculus': ('CalculusVerification', 'verify_calculus_with_visualization'),
+    'binary': ('BinaryVerification', 'verify_binary_with_visualization'),
+    'primes': ('PrimesVerification', 'verify_primes_with_visualization'),
+    'symmetry': ('SymmetryVerification', 'verify_symmetry_with_visualization'),
+    'e': ('EVerification', 'verify_e_with_visualization'),
+    'pi-engine': ('PiVerification', 'benchmark_pi_engine'),
+    'pi-estimators': ('PiVerification', 'compare_estimators'),
+    'calculus-estimators': ('CalculusVerification', 'compare_estimators'),
+    'primes-counting': ('PrimesVerification', 'prime_counting_table'),
+}
+
+# 동시에 취소할 수 있는 풀 작업 수 (공유 취소 플래그 칸 수)
+CANCEL_SLOTS = 64
+
+# 취소 요청을 확인하는 간격 (초)
+CANCEL_POLL_INTERVAL = 0.05
+
+# 워커 프로세스 안에서만 채워지는 검증기 인스턴스와 공유 취소 플래그
+_worker_verifiers = {}
+_cancel_flags = None
+
+
+class _SharedFlag:
+    """공유 취소 플래그 배열의 한 칸 (threading.Event처럼 is_set()으로 확인)"""
+
+    def __init__(self, flags, slot):
+        self.flags = flags
+        self.slot = slot
+
+    def is_set(self):
+        return bool(self.flags[self.slot])
+
+
+def _warm_worker(settings, cancel_flags=None):
+    """워커 초기화: 무거운 모듈 import, 공유 저장소 위치 설정 및 검증기 인스턴스 생성
+
+    settings: 부모 프로세스의 configure_services가 정한 경로 (prime_table_dir, symbolic_memo_path)
+    cancel_flags: 부모와 공유하는 취소 플래그 배열 (작업마다 한 칸)
+    """
+    global _cancel_flags
+    _cancel_flags = cancel_flags
+    import numpy  # noqa: F401
+    import scipy.stats  # noqa: F401
+    import sympy  # noqa: F401
+    import matplotlib
+    matplotlib.use('Agg')
+
+    from . import math_core
+    from .math_core.prime_table import prime_table
+    from .symbolic_worker import symbolic_pool
+    prime_table.directory = settings.get('prime_table_dir')
+    symbolic_pool.memo.path = settings.get('symbolic_memo_path')
+    for name, (class_name, _) in VERIFIER_METHODS.items():
+        _worker_verifiers[name] = getattr(math_core, class_name)(sink=CancellableSink(NullSink()))
+
+
+def _run_verification(name, params, slot=None):
+    """워커에서 검증 실행 (slot이 주어지면 그 칸의 취소 플래그를 emit 지점마다 확인)"""
+    _, method_name = VERIFIER_METHODS[name]
+    flag = _SharedFlag(_cancel_flags, slot) if slot is not None and _cancel_flags is not None else None
+    with cancel_scope(flag):
+        return getattr(_worker_verifiers[name], method_name)(**params)
+
+
+class RenderPool:
+    """검증 작업을 프로세스 풀로 보내는 실행기
+
+    max_workers가 0이면 비활성화되어 모든 검증을 호출한 스레드에서 실행한다.
+    풀은 처음 사용할 때 생성된다.
+    """
+
+    def __init__(self, max_workers=0, verifiers=(), timeout=None, worker_settings=None):
+        self.max_workers = max_workers
+        self.verifiers = set(verifiers)
+        self.timeout = timeout
+        self.worker_settings = worker_settings or {}
+        self._executor = None
+        self._flags = None
+        self._free_slots = []
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self):
+        return self.max_workers is None or self.max_workers > 0
+
+    def _get_executor(self):
+        with self._lock:
+            if self._executor is None:
+                # 스레드가 있는 웹 서버에서 fork는 안전하지 않으므로 spawn 사용
+                context = multiprocessing.get_context('spawn')
+                self._flags = context.Array('b', CANCEL_SLOTS, lock=False)
+                self._free_slots = list(range(CANCEL_SLOTS))
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.max_workers,
+                    mp_context=context,
+                    initializer=_warm_worker,
+                    initargs=(dict(self.worker_settings), self._flags)
+                )
+                atexit.register(self.shutdown)
+            return self._executor
+
+    def submit(self, name, **params):
+        """검증을 풀에 제출하고 Future 반환"""
+        return self._get_executor().submit(_run_verification, name, params)
+
+    def run(self, name, local_func, **params):
+        """풀 대상 검증이면 워커에서 실행해 결과를 기다리고, 아니면 local_func를 직접 호출
+
+        cancel_scope 안에서 호출되면 기다리는 동안 취소 이벤트를 확인해, 설정되면
+        워커의 작업에 취소 플래그를 세우고 CancelledError를 낸다.
+        """
+        if not (self.enabled and name in self.verifiers):
+            return local_func(**params)
+        cancel = current_cancel_event()
+        if cancel is None:
+            return self.submit(name, **params).result(timeout=self.timeout)
+
+        check_cancelled()
+        executor = self._get_executor()
+        with self._lock:
+            flags = self._flags
+            slot = self._free_slots.pop() if self._free_slots else None
+        future = executor.submit(_run_verification, name, params, slot)
+        if slot is not None:
+            future.add_done_callback(lambda _: self._release_slot(flags, slot))
+
+        deadline = None if self.timeout is None else time.monotonic() + self.timeout
+        while True:
+            try:
+                return future.result(timeout=CANCEL_POLL_INTERVAL)
+            except FutureTimeoutError:
+                pass
+            if cancel.is_set():
+                if slot is not None:
+                    flags[slot] = 1
+                future.cancel()
+                raise CancelledError(f'{name} was cancelled')
+            if deadline is not None and time.monotonic() > deadline:
+                raise FutureTimeoutError(f'{name} did not finish within {self.timeout} seconds')
+
+    def _release_slot(self, flags, slot):
+        """끝난 작업의 취소 플래그 칸을 비우고 반환 (풀이 바뀌었으면 버림)"""
+        with self._lock:
+            if flags is self._flags:
+                flags[slot] = 0
+                self._free_slots.append(slot)
+
+    def map(self, func, *iterables):
+        """func를 워커들에 나눠 실행하고 결과를 입력 순서대로 반환
+
+        func는 워커에서 import할 수 있는 모듈 최상위 함수여야 한다.
+        풀이 비활성화되어 있으면 현재 스레드에서 실행한다.
+        """
+        check_cancelled()
+        if not self.enabled:
+            return list(map(func, *iterables))
+        return list(self._get_executor().map(func, *iterables, timeout=self.timeout))
+
+    def shutdown(self, wait=True):
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=wait, cancel_futures=True)
+                self._executor = None
+                self._flags = None
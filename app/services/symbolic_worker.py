@@ -0,0 +1,381 @@
+"""
+시간 제한이 있는 기호 계산 워커 풀
+
+sp.integrate, sp.diff 같은 기호 계산은 식에 따라 끝나지 않을 수 있다. 이 모듈은
+기호 연산을 별도의 워커 프로세스에서 실행하고, 제한 시간 안에 답이 없으면
+워커를 강제로 종료(kill)한 뒤 새 워커로 교체한다. 스레드와 달리 프로세스는
+중간에 멈출 수 있으므로 하나의 병적인 적분이 요청 스레드를 붙잡지 않는다.
+워커는 주소 공간(RLIMIT_AS)과 연산별 CPU 시간(RLIMIT_CPU) 상한 안에서 실행되므로
+메모리를 폭주시키는 연산은 제한 시간 전에 워커만 종료시키고 호스트에는 영향을 주지 않는다.
+
+결과는 (연산, 인자의 srepr)을 키로 결과의 srepr을 저장하는 SQLite 메모에 보관하므로
+같은 계산은 서버를 다시 시작한 뒤에도 워커를 거치지 않고 바로 돌려준다. 저장된 srepr은
+eval(sympify) 대신 sympy 클래스 호출만 허용하는 AST 해석기(decode_srepr)로 복원한다.
+"""
+
+import ast
+import atexit
+import multiprocessing
+import os
+import sqlite3
+import threading
+import time
+from concurrent.futures import CancelledError
+import sympy as sp
+
+try:
+    import resource
+except ImportError:  # Windows: 자원 상한 없이 제한 시간만 적용
+    resource = None
+from .utils.config import SYMBOLIC_CONFIG
+from .utils.events import current_cancel_event
+
+# 워커에서 실행할 수 있는 기호 연산
+OPERATIONS = {
+    'diff': sp.diff,
+    'integrate': sp.integrate,
+    'simplify': sp.simplify,
+}
+
+
+# 워커 시작(프로세스 생성과 sympy import) 제한 시간 (초, 작업 제한 시간과 별도)
+STARTUP_TIMEOUT = 60
+
+# cancel 이벤트를 확인하는 간격 (초)
+CANCEL_POLL_INTERVAL = 0.05
+
+
+class SymbolicTimeoutError(TimeoutError):
+    """기호 연산이 제한 시간 안에 끝나지 않아 워커를 종료함"""
+
+
+def _set_soft_limit(kind, value):
+    """자원 kind의 soft 상한을 value로 (hard 상한은 그대로 두고 넘지 않게)"""
+    _, hard = resource.getrlimit(kind)
+    resource.setrlimit(kind, (value if hard == resource.RLIM_INFINITY else min(value, hard), hard))
+
+
+def _serve(conn, memory_limit=None, cpu_limit=None):
+    """워커 프로세스: (연산, 인자)를 받아 (성공 여부, 결과 또는 오류 메시지)를 돌려줌
+
+    sympy를 불러오고 자원 상한을 건 뒤 준비 신호를 보내므로 부모는 작업 제한 시간을 그 다음부터 잰다.
+    RLIMIT_CPU는 프로세스 누적값이므로 연산마다 지금까지 쓴 CPU 시간 + cpu_limit으로 다시 건다.
+    메모리 상한에 걸리면(MemoryError) 상태를 믿을 수 없으므로 워커를 끝내고, 부모는 RuntimeError를 낸다.
+    """
+    if resource is not None and memory_limit:
+        _set_soft_limit(resource.RLIMIT_AS, memory_limit)
+    conn.send('ready')
+    while True:
+        try:
+            op, args = conn.recv()
+        except EOFError:
+            return
+        if resource is not None and cpu_limit:
+            usage = resource.getrusage(resource.RUSAGE_SELF)
+            _set_soft_limit(resource.RLIMIT_CPU, int(usage.ru_utime + usage.ru_stime) + 1 + cpu_limit)
+        try:
+            conn.send((True, OPERATIONS[op](*args)))
+        except MemoryError:
+            os._exit(1)
+        except Exception as e:
+            conn.send((False, f'{type(e).__name__}: {e}'))
+
+
+class _Worker:
+    """파이프로 연결된 워커 프로세스 하나 (생성자는 워커가 sympy를 불러올 때까지 기다림)"""
+
+    def __init__(self, context, memory_limit=None, cpu_limit=None, startup_timeout=STARTUP_TIMEOUT):
+        self.conn, child = context.Pipe()
+        self.process = context.Process(target=_serve, args=(child, memory_limit, cpu_limit), daemon=True)
+        self.process.start()
+        child.close()
+        try:
+            ready = self.conn.poll(startup_timeout) and self.conn.recv() == 'ready'
+        except (EOFError, OSError):
+            ready = False
+        if not ready:
+            self.kill()
+            raise RuntimeError('symbolic worker failed to start')
+        self.cancelled = False
+
+    def kill(self):
+        self.process.kill()
+        self.process.join()
+        self.conn.close()
+
+
+def _srepr_names():
+    """srepr에 나올 수 있는 이름: 모든 Basic 하위 클래스(ExprCondPair처럼 최상위에 없는 것 포함)와
+    sympy 최상위의 Basic 클래스와 상수(pi, oo, true 등)"""
+    names = {}
+    pending = [sp.Basic]
+    while pending:
+        cls = pending.pop()
+        names.setdefault(cls.__name__, cls)
+        pending.extend(cls.__subclasses__())
+    names.update((name, value) for name, value in vars(sp).items()
+                 if not name.startswith('_') and (isinstance(value, sp.Basic) or
+                                                  (isinstance(value, type) and issubclass(value, sp.Basic))))
+    return names
+
+
+def decode_srepr(text):
+    """srepr 문자열을 식으로 복원 (eval 없이 AST를 직접 해석)
+
+    호출은 sympy Basic 클래스(또는 그 호출 결과, 예: Function('f')(x))만,
+    인자는 숫자, 문자열, 튜플, 리스트, 키워드만 허용하고 그 밖의 구문은 ValueError.
+    """
+    names = _srepr_names()
+
+    def build(node):
+        if isinstance(node, ast.Constant) and isinstance(node.value, (int, float, str, bool, type(None))):
+            return node.value
+        if isinstance(node, ast.UnaryOp) and isinstance(node.op, ast.USub):
+            value = build(node.operand)
+            if isinstance(value, (int, float)) and not isinstance(value, bool):
+                return -value
+        if isinstance(node, ast.Name) and node.id in names:
+            return names[node.id]
+        if isinstance(node, (ast.Tuple, ast.List)):
+            items = [build(item) for item in node.elts]
+            return tuple(items) if isinstance(node, ast.Tuple) else items
+        if isinstance(node, ast.Call):
+            func = build(node.func)
+            if isinstance(func, type):
+                return func(*(build(arg) for arg in node.args),
+                            **{keyword.arg: build(keyword.value) for keyword in node.keywords if keyword.arg})
+        raise ValueError(f'unsupported srepr syntax: {ast.dump(node)[:80]}')
+
+    return build(ast.parse(text, mode='eval').body)
+
+
+class SymbolicMemo:
+    """기호 연산 결과의 영구 키-값 저장소 (SQLite, 키와 값은 srepr 문자열)
+
+    path가 None이면 프로세스 메모리에만 보관한다.
+    """
+
+    def __init__(self, path=None):
+        self._path = path
+        self._memory = {}
+        self._lock = threading.Lock()
+        self._ready = False
+
+    @property
+    def path(self):
+        return self._path
+
+    @path.setter
+    def path(self, path):
+        with self._lock:
+            self._path = path
+            self._ready = False
+
+    def _connect(self):
+        conn = sqlite3.connect(self._path, timeout=30)
+        if not self._ready:
+            conn.execute('CREATE TABLE IF NOT EXISTS memo (key TEXT PRIMARY KEY, result TEXT NOT NULL)')
+            conn.commit()
+            self._ready = True
+        return conn
+
+    def get(self, key):
+        """저장된 결과의 srepr, 없으면 None"""
+        with self._lock:
+            if self._path is None:
+                return self._memory.get(key)
+            with self._connect() as conn:
+                row = conn.execute('SELECT result FROM memo WHERE key = ?', (key,)).fetchone()
+            conn.close()
+            return row and row[0]
+
+    def set(self, key, value):
+        with self._lock:
+            if self._path is None:
+                self._memory[key] = value
+                return
+            with self._connect() as conn:
+                conn.execute('INSERT OR REPLACE INTO memo (key, result) VALUES (?, ?)', (key, value))
+            conn.close()
+
+    def __len__(self):
+        with self._lock:
+            if self._path is None:
+                return len(self._memory)
+            with self._connect() as conn:
+                count = conn.execute('SELECT COUNT(*) FROM memo').fetchone()[0]
+            conn.close()
+            return count
+
+
+class SymbolicWorkerPool:
+    """기호 연산을 시간 제한이 있는 워커 프로세스에서 실행하고 결과를 메모하는 실행기
+
+    max_workers가 0이면 워커 없이 호출한 스레드에서 실행한다 (시간 제한 없음, 메모는 사용).
+    워커는 처음 필요할 때 생성되고 작업 사이에 재사용된다.
+    """
+
+    def __init__(self, max_workers=2, timeout=10, memo_path=None, memory_limit=None, cpu_limit=None):
+        self.max_workers = max_workers
+        self.timeout = timeout
+        self.memory_limit = memory_limit
+        self.cpu_limit = cpu_limit
+        self.memo = SymbolicMemo(memo_path)
+        self._context = multiprocessing.get_context('spawn')
+        self._idle = []
+        self._busy = set()
+        self._slots = None
+        self._lock = threading.Lock()
+        self._registered = False
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def enabled(self):
+        return self.max_workers > 0
+
+    @staticmethod
+    def make_key(op, args):
+        """정규화된 메모 키: 연산 이름과 인자의 srepr"""
+        return f"{op}({', '.join(sp.srepr(arg) for arg in args)})"
+
+    def _acquire(self):
+        with self._lock:
+            if self._slots is None:
+                self._slots = threading.BoundedSemaphore(self.max_workers)
+                if not self._registered:
+                    atexit.register(self.shutdown)
+                    self._registered = True
+            slots = self._slots
+        slots.acquire()
+        with self._lock:
+            worker = self._idle.pop() if self._idle else None
+        if worker is None:
+            try:
+                worker = _Worker(self._context, self.memory_limit, self.cpu_limit)
+            except Exception:
+                slots.release()
+                raise
+        with self._lock:
+            self._busy.add(worker)
+        return worker, slots
+
+    def _release(self, worker, slots, alive=True):
+        with self._lock:
+            self._busy.discard(worker)
+            if alive and self._slots is slots:
+                self._idle.append(worker)
+                worker = None
+        if worker is not None:
+            worker.kill()
+        slots.release()
+
+    def _execute(self, op, args, timeout, cancel=None):
+        """워커 하나에서 연산을 실행
+
+        제한 시간은 준비된 워커에 작업을 보낸 순간부터 잰다. 시간 초과면 이 작업의 워커만
+        종료하고 SymbolicTimeoutError, cancel(threading.Event)이 설정되면 CancelledError.
+        """
+        worker, slots = self._acquire()
+        deadline = time.monotonic() + timeout
+        status = 'timeout'
+        try:
+            worker.conn.send((op, args))
+            remaining = timeout
+            while remaining > 0:
+                wait = remaining if cancel is None else min(remaining, CANCEL_POLL_INTERVAL)
+                if worker.conn.poll(wait):
+                    ok, value = worker.conn.recv()
+                    status = 'finished'
+                    break
+                if cancel is not None and cancel.is_set():
+                    status = 'cancelled'
+                    break
+                remaining = deadline - time.monotonic()
+        except (EOFError, OSError):
+            # shutdown()으로 종료되었거나 워커가 비정상 종료됨 (메모리 또는 CPU 시간 상한 초과)
+            self._release(worker, slots, alive=False)
+            if worker.cancelled:
+                raise CancelledError(f'{op} was cancelled') from None
+            raise RuntimeError(f'symbolic worker exited while running {op} '
+                               f'(e.g. memory or CPU limit exceeded)') from None
+        if status != 'finished':
+            self._release(worker, slots, alive=False)
+            if status == 'cancelled':
+                raise CancelledError(f'{op} was cancelled')
+            raise SymbolicTimeoutError(f'{op} did not finish within {timeout} seconds')
+        self._release(worker, slots)
+        if not ok:
+            raise ValueError(value)
+        return value
+
+    def run(self, op, *args, timeout=None, cancel=None):
+        """기호 연산 실행 (메모에 있으면 바로 반환)
+
+        op: OPERATIONS의 이름 ('diff', 'integrate', 'simplify')
+        timeout: 제한 시간 (초, None이면 풀의 기본값)
+        cancel: 설정되면 이 작업의 워커만 종료하고 CancelledError를 내는 threading.Event
+                (None이면 cancel_scope로 정한 현재 스레드의 취소 이벤트)
+        """
+        if op not in OPERATIONS:
+            raise ValueError(f'unknown symbolic operation: {op}')
+        args = tuple(sp.sympify(arg) for arg in args)
+        key = self.make_key(op, args)
+        stored = self.memo.get(key)
+        if stored is not None:
+            try:
+                result = decode_srepr(stored)
+            except (ValueError, TypeError, SyntaxError, RecursionError):
+                result = None  # 해석할 수 없는 항목은 다시 계산해 덮어씀
+            if result is not None:
+                self.hits += 1
+                return result
+
+        self.misses += 1
+        if cancel is None:
+            cancel = current_cancel_event()
+        if self.enabled:
+            result = self._execute(op, args, self.timeout if timeout is None else timeout, cancel)
+        else:
+            result = OPERATIONS[op](*args)
+        self.memo.set(key, sp.srepr(result))
+        return result
+
+    def _kill_busy(self):
+        """실행 중인 모든 워커 종료 (기다리던 호출은 CancelledError)"""
+        with self._lock:
+            busy = list(self._busy)
+        for worker in busy:
+            worker.cancelled = True
+            worker.process.kill()
+
+    def stats(self):
+        """풀 통계 (워커 수, 제한 시간, 메모 크기, 적중/실패 수)"""
+        return {
+            'workers': self.max_workers,
+            'timeout': self.timeout,
+            'memory_limit': self.memory_limit,
+            'cpu_limit': self.cpu_limit,
+            'memo_path': self.memo.path,
+            'memo_size': len(self.memo),
+            'hits': self.hits,
+            'misses': self.misses
+        }
+
+    def shutdown(self):
+        """모든 워커 종료 (이후 호출은 새 워커를 만든다)"""
+        self._kill_busy()
+        with self._lock:
+            idle, self._idle = self._idle, []
+            self._slots = None
+        for worker in idle:
+            worker.kill()
+
+
+# 앱 전체에서 공유하는 기호 계산 풀 (math_routes.configure_services에서 메모 경로 설정)
+symbolic_pool = SymbolicWorkerPool(
+    max_workers=SYMBOLIC_CONFIG['workers'],
+    timeout=SYMBOLIC_CONFIG['timeout'],
+    memory_limit=SYMBOLIC_CONFIG['memory_limit'],
+    cpu_limit=SYMBOLIC_CONFIG['cpu_limit']
+)
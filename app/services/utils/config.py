@@ -5,15 +5,14 @@
 import matplotlib
 matplotlib.use('Agg')  # 웹 환경에서 사용
 
-import matplotlib.pyplot as plt
 import numpy as np
 from math import pi, e, sqrt, log
 
 def configure_matplotlib():
     # 기본 폰트를 DejaVu Sans로 설정하여 한글 깨짐 및 폰트 없음 오류 방지
-    plt.rcParams['font.family'] = 'DejaVu Sans'
+    matplotlib.rcParams['font.family'] = 'DejaVu Sans'
     # 마이너스 부호 깨짐 방지
-    plt.rcParams['axes.unicode_minus'] = False
+    matplotlib.rcParams['axes.unicode_minus'] = False
 
 # 수학 상수
 MATH_CONSTANTS = {
@@ -29,3 +28,146 @@ PLOT_CONFIG = {
     'dpi': 100,
     'style': 'seaborn-v0_8-whitegrid'
 }
+
+# 검증 결과 캐시 설정
+CACHE_CONFIG = {
+    'max_size': 32,   # 최대 항목 수
+    'ttl': 3600       # 초 단위 만료 시간
+}
+
+# 컴파일된 식 캐시 설정 (기호 미분/적분과 lambdify 결과)
+EXPRESSION_CONFIG = {
+    'max_size': 128,        # 최대 식 개수 (LRU)
+    'ttl': float('inf')     # 식은 바뀌지 않으므로 만료 없음
+}
+
+# 기호 계산 워커 설정 (sp.diff, sp.integrate를 시간 제한이 있는 프로세스에서 실행)
+SYMBOLIC_CONFIG = {
+    'workers': 2,                        # 워커 프로세스 수 (0이면 요청 스레드에서 직접 실행)
+    'timeout': 10,                       # 연산 하나의 제한 시간 (초, 넘으면 워커 종료)
+    'memory_limit': 2**30,               # 워커 주소 공간 상한 (바이트, RLIMIT_AS, None이면 제한 없음)
+    'cpu_limit': 15,                     # 연산 하나의 CPU 시간 상한 (초, RLIMIT_CPU, None이면 제한 없음)
+    'memo_file': 'symbolic_memo.sqlite3' # instance 폴더 안의 영구 메모 파일
+}
+
+# 수치 적분 설정
+QUADRATURE_CONFIG = {
+    'riemann_subdivisions': [10, 50, 100, 500, 10**7],  # ∫₀³ x² dx 리만 합 분할 수
+    'integrand': 'exp',                                # 구적법 비교 기본 적분
+    'integrands': {                                    # 이름 → (식, 하한, 상한)
+        'exp': ('exp(x)', 0, 3),
+        'x2': ('x**2', 0, 3),
+        'sin': ('sin(x)', 0, pi),
+        'sqrt': ('sqrt(x)', 0, 1),      # 0에서 도함수가 발산해 수렴 차수가 1.5로 떨어짐
+        'runge': ('1/(1 + 25*x**2)', -1, 1)
+    }
+}
+
+# 그래프 저장소 설정
+PLOT_STORE_CONFIG = {
+    'memory_items': 256,            # 메모리에 보관할 최대 그래프 수
+    'max_disk_bytes': 256 * 2**20,  # 디스크 그래프 디렉터리 상한 (넘으면 오래된 파일부터 삭제)
+    'max_age': 31536000             # 그래프 URL 캐시 유효 기간 (초, 1년)
+}
+
+# 검증 프로세스 풀 설정
+RENDER_POOL_CONFIG = {
+    'workers': None,                                             # None이면 CPU 수, 0이면 비활성화
+    'verifiers': ('primes', 'e', 'probability', 'pi-engine',     # 풀에서 실행할 무거운 검증
+                  'pi-estimators', 'calculus-estimators', 'primes-counting'),
+    'timeout': 120                                               # 결과 대기 시간 (초)
+}
+
+# 전체 검증 스트리밍(SSE) 설정
+STREAM_CONFIG = {
+    'workers': 4,       # 동시에 실행할 검증 수
+    'heartbeat': 15     # 연결 유지 주석을 보내는 간격 (초)
+}
+
+# 검증 이벤트 수집기 설정
+EVENTS_CONFIG = {
+    'max_events': 1000   # 메모리에 보관할 최근 이벤트 수
+}
+
+# 검증 대시보드 설정
+DASHBOARD_CONFIG = {
+    'refresh_interval': 10,   # 백그라운드 스냅샷 갱신 주기 (초)
+    'seed': 0                 # 요청 이력이 없는 무작위 검증을 미리 계산할 때 쓰는 시드
+}
+
+# π 계산 엔진 설정
+# 추드노프스키 10^6 자리는 gmpy2 없이 수십 초가 걸리므로 요청 상한은 10^5 자리로 둔다
+PI_ENGINE_CONFIG = {
+    'max_digits': 100000,        # 요청에서 허용하는 최대 자릿수
+    'benchmark_digits': 10000    # 자릿수 vs 시간 보고서의 기본 최대 자릿수
+}
+
+# 몬테카를로 설정
+MONTE_CARLO_CONFIG = {
+    'max_points': 10**9,   # 요청에서 허용하는 최대 표본 수 (청크 단위라 메모리는 일정)
+    'workers': None        # 블록을 나눠 실행할 프로세스 수 (None이면 CPU 수, 0이면 비활성화)
+}
+
+# 피보나치/황금비 엔진 설정
+FIBONACCI_CONFIG = {
+    'n': 10**6,            # 빠른 배가로 정확히 계산하는 기본 항 F(n) (약 0.1초)
+    'max_n': 3 * 10**6,    # 요청에서 허용하는 최대 n (요청 스레드에서 동기 실행, 약 2초)
+    'modulus': 10,         # 피사노 주기 기본 법
+    'max_modulus': 10**12, # 시행 나눗셈 소인수분해가 빠른 범위
+    'plot_terms': 30,      # 수열/비율 그래프 항 수
+    'error_terms': 200     # 비율 오차 그래프 항 수
+}
+
+# 중심극한정리 시뮬레이션 설정
+CLT_CONFIG = {
+    'n_samples': 10**5,      # 표본 크기마다 만드는 기본 표본평균 개수
+    'max_samples': 10**6     # 요청에서 허용하는 최대 개수 (블록 단위라 메모리는 일정)
+}
+
+# 베이즈 사후확률 격자 설정
+BAYES_CONFIG = {
+    'max_axis_points': 1000,   # 축 하나의 최대 점 수
+    'max_cells': 10**6,        # 텐서 최대 원소 수 (float64 8MB)
+    'defaults': {              # 축을 주지 않았을 때 ('start:stop:num' 또는 'a,b,c')
+        'prior': '0.001:0.1:50',
+        'sensitivity': '0.8,0.9,0.95,0.99',
+        'specificity': '0.8:0.99:20'
+    }
+}
+
+# 연분수 전개 설정
+CONTINUED_FRACTION_CONFIG = {
+    'terms': 20,               # 기본 부분 몫 개수
+    'max_terms': 5000,         # 요청에서 허용하는 최대 항 수 (π 5000항 약 0.2초)
+    'max_denominator': 10**30, # 최선 유리 근사의 최대 분모 한도
+    'max_value_length': 1000   # ?value= 유리수 문자열 최대 길이
+}
+
+# 소수 구간 체 설정
+SIEVE_CONFIG = {
+    'limit': 10**7,       # 소수 검증에서 π(limit)을 세는 기본 상한 (약 0.02초)
+    'max_limit': 10**9,   # 요청에서 허용하는 최대 상한 (단일 코어 약 2초, 메모리는 블록 크기로 일정)
+    'workers': None       # 블록을 나눠 실행할 프로세스 수 (None이면 CPU 수, 0이면 비활성화)
+}
+
+# 소수 판별 설정
+PRIMALITY_CONFIG = {
+    'mersenne_exponent': 2000,      # 메르센 패널에서 검사하는 기본 최대 지수 (단일 코어 약 0.5초)
+    'max_mersenne_exponent': 5000   # 요청에서 허용하는 최대 지수 (뤼카-레머 비용 ~p², 단일 코어 약 15초)
+}
+
+# 소수 계량 함수 π(x) 설정 (Lucy_Hedgehog, O(n^{3/4}))
+PRIME_COUNTING_CONFIG = {
+    'max_exponent': 10,       # π(10^k) 표의 기본 최대 지수 (10^10 약 0.2초)
+    'max_max_exponent': 12,   # 요청에서 허용하는 최대 지수 (10^12 약 3초)
+    'memo_size': 256          # 메모이즈할 π(x) 값 개수
+}
+
+# 소수 간격 통계 설정 (블록별 부분 통계를 합치므로 메모리는 블록 크기로 일정)
+GAP_CONFIG = {
+    'limit': 10**7,        # 소수 간격 패널의 기본 상한 (약 0.06초)
+    'max_limit': 10**9     # 요청에서 허용하는 최대 상한 (단일 코어 약 6초)
+}
+
+# 그래프 출력 모드: png(그래프 이미지), data(그래프 원본 데이터), none(그래프 없음)
+PLOT_MODES = ('png', 'data', 'none')
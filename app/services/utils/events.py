@@ -0,0 +1,144 @@
+"""
+검증 이벤트 수집기 (NullSink, LoggingSink, MemorySink, CancellableSink)
+
+검증기는 print() 대신 sink.emit(이름, **필드)로 소요 시간과 핵심 지표를 보낸다.
+기본값인 NullSink는 아무 일도 하지 않으므로 요청 처리 경로에 표준 출력 I/O가 없다.
+
+emit 지점은 검증의 진행 지점이기도 하다. cancel_scope(event) 안에서 실행되는 검증은
+CancellableSink.emit, RenderPool, 기호 계산 풀에서 event를 확인해 설정되어 있으면
+CancelledError로 멈춘다 (예: 연결이 끊긴 스트리밍 요청).
+"""
+
+import logging
+import threading
+import time
+from collections import deque
+from concurrent.futures import CancelledError
+from contextlib import contextmanager
+
+# 스레드별 현재 취소 이벤트
+_scope = threading.local()
+
+
+@contextmanager
+def cancel_scope(event):
+    """블록 안에서 이 스레드의 취소 이벤트를 event(is_set()이 있는 객체, None이면 해제)로 설정"""
+    previous = getattr(_scope, 'event', None)
+    _scope.event = event
+    try:
+        yield event
+    finally:
+        _scope.event = previous
+
+
+def current_cancel_event():
+    """이 스레드의 취소 이벤트, 없으면 None"""
+    return getattr(_scope, 'event', None)
+
+
+def check_cancelled():
+    """이 스레드의 취소 이벤트가 설정되어 있으면 CancelledError"""
+    event = current_cancel_event()
+    if event is not None and event.is_set():
+        raise CancelledError('verification was cancelled')
+
+
+class EventSink:
+    """이벤트 수집기 기본 클래스"""
+
+    def emit(self, name, **fields):
+        raise NotImplementedError
+
+    @contextmanager
+    def timer(self, name, **fields):
+        """블록 실행 시간을 duration(초) 필드로 기록
+
+        yield 된 dict에 지표를 추가하면 같은 이벤트로 함께 보낸다.
+        예외가 발생하면 error 필드를 채워 보낸 뒤 다시 던진다.
+        """
+        start = time.perf_counter()
+        try:
+            yield fields
+        except Exception as e:
+            fields['error'] = str(e)
+            raise
+        finally:
+            self.emit(name, duration=time.perf_counter() - start, **fields)
+
+
+class NullSink(EventSink):
+    """모든 이벤트를 버리는 수집기 (기본값)"""
+
+    def emit(self, name, **fields):
+        pass
+
+    @contextmanager
+    def timer(self, name, **fields):
+        yield fields
+
+
+class LoggingSink(EventSink):
+    """이벤트를 logging 모듈로 보내는 수집기"""
+
+    def __init__(self, logger=None, level=logging.INFO):
+        self.logger = logger or logging.getLogger('app.verification')
+        self.level = level
+
+    def emit(self, name, **fields):
+        if self.logger.isEnabledFor(self.level):
+            self.logger.log(self.level, "%s %s", name,
+                            ' '.join(f'{key}={value}' for key, value in fields.items()))
+
+
+class MemorySink(EventSink):
+    """최근 이벤트를 메모리에 보관하는 수집기 (대시보드용)
+
+    max_events개까지 최근 이벤트를 보관하고, 이벤트 이름별 마지막 값을
+    latest()로 바로 조회할 수 있다.
+    """
+
+    def __init__(self, max_events=1000):
+        self._events = deque(maxlen=max_events)
+        self._latest = {}
+        self._lock = threading.Lock()
+
+    def emit(self, name, **fields):
+        event = dict(fields, name=name, timestamp=time.time())
+        with self._lock:
+            self._events.append(event)
+            self._latest[name] = event
+
+    def events(self, name=None):
+        """보관 중인 이벤트 목록 (name이 주어지면 해당 이벤트만)"""
+        with self._lock:
+            events = list(self._events)
+        if name is None:
+            return events
+        return [event for event in events if event['name'] == name]
+
+    def latest(self, name):
+        """이름별 마지막 이벤트, 없으면 None"""
+        with self._lock:
+            return self._latest.get(name)
+
+    def clear(self):
+        with self._lock:
+            self._events.clear()
+            self._latest.clear()
+
+
+class CancellableSink(EventSink):
+    """다른 수집기를 감싸 emit마다 현재 스레드의 취소 이벤트를 확인하는 수집기
+
+    timer는 감싼 수집기에 그대로 맡기므로 취소된 작업의 소요 시간 기록은 남는다.
+    """
+
+    def __init__(self, sink):
+        self.sink = sink
+
+    def emit(self, name, **fields):
+        check_cancelled()
+        self.sink.emit(name, **fields)
+
+    def timer(self, name, **fields):
+        return self.sink.timer(name, **fields)
@@ -0,0 +1,78 @@
+"""
+검증 결과 LRU 캐시 (크기 및 TTL 제한)
+"""
+
+import threading
+import time
+from collections import OrderedDict
+
+
+class ResultCache:
+    """(검증기, 파라미터, 시드)를 키로 하는 프로세스 내 LRU 결과 캐시"""
+
+    def __init__(self, max_size=32, ttl=3600):
+        self.max_size = max_size
+        self.ttl = ttl
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def make_key(name, params=None, seed=None):
+        """캐시 키 생성 (파라미터 순서와 무관)"""
+        return (name, tuple(sorted((params or {}).items())), seed)
+
+    def get(self, key):
+        """키에 해당하는 값 조회, 없거나 만료되었으면 None"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            expires_at, value = entry
+            if expires_at < time.monotonic():
+                del self._entries[key]
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key, value):
+        """값 저장, 크기 초과 시 가장 오래 사용되지 않은 항목 제거"""
+        if self.max_size <= 0:
+            return
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def get_or_compute(self, key, compute):
+        """캐시에 있으면 반환, 없으면 compute() 결과를 저장 후 반환 (값, 적중 여부)"""
+        value = self.get(key)
+        if value is not None:
+            return value, True
+        value = compute()
+        self.set(key, value)
+        return value, False
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self):
+        """캐시 통계 (크기, 적중/실패 수, 적중률)"""
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                'size': len(self._entries),
+                'max_size': self.max_size,
+                'ttl': self.ttl,
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': self.hits / total if total else 0.0
+            }
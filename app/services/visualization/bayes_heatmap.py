@@ -0,0 +1,28 @@
+"""
+베이즈 사후확률 격자 히트맵
+"""
+
+import numpy as np
+from .base64_encoder import save_plot_to_png
+from .figures import create_figure
+
+
+def plot_posterior_heatmap(priors, sensitivities, specificities, tensor, max_panels=4):
+    """민감도 몇 개를 골라 유병률 × 특이도 사후확률 히트맵 PNG로 변환"""
+    indices = np.unique(np.linspace(0, len(sensitivities) - 1, min(max_panels, len(sensitivities))).round().astype(int))
+    fig = create_figure(figsize=(5 * len(indices) + 1, 5))
+    axes = np.atleast_1d(fig.subplots(1, len(indices), sharey=True))
+
+    for ax, index in zip(axes, indices):
+        mesh = ax.pcolormesh(priors, specificities, tensor[:, index, :].T,
+                             shading='nearest', cmap='viridis', vmin=0, vmax=1)
+        # 유병률이 여러 자릿수에 걸치면 로그 축
+        if priors.min() > 0 and priors.max() / priors.min() >= 100:
+            ax.set_xscale('log')
+        ax.set_xlabel('Prior (Prevalence)')
+        ax.set_title(f'Sensitivity = {sensitivities[index]:.3f}')
+    axes[0].set_ylabel('Specificity')
+
+    fig.colorbar(mesh, ax=list(axes), label='P(Disease | Positive)')
+    fig.suptitle("Bayes' Theorem: Posterior Probability Grid", fontsize=14)
+    return save_plot_to_png(fig)
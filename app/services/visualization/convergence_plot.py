@@ -0,0 +1,33 @@
+"""
+추정기 수렴 그래프: 표본 수 대비 RMSE (log-log)
+"""
+
+import numpy as np
+from .base64_encoder import save_plot_to_png
+from .figures import create_figure
+
+
+def plot_estimator_convergence(report, title):
+    """estimators.convergence 보고서를 log-log 그래프 PNG로 변환"""
+    fig = create_figure(figsize=(10, 6))
+    ax = fig.subplots()
+
+    for method, runs in report.items():
+        order = runs['convergence_order']
+        label = f'{method} (order {order:.2f})' if order is not None else method
+        ax.loglog(runs['samples'], runs['rmse'], 'o-', linewidth=2, markersize=5, label=label)
+
+    # 기준 기울기: n^(-1/2) (몬테카를로), n^(-1) (준몬테카를로)
+    samples = np.array(next(iter(report.values()))['samples'], dtype=float)
+    reference = max(runs['rmse'][0] for runs in report.values())
+    ax.loglog(samples, reference * (samples / samples[0])**-0.5, 'k--', alpha=0.5, label='O(n^-1/2)')
+    ax.loglog(samples, reference * (samples / samples[0])**-1.0, 'k:', alpha=0.5, label='O(n^-1)')
+
+    ax.set_xlabel('Number of Samples')
+    ax.set_ylabel('RMSE')
+    ax.set_title(title)
+    ax.legend()
+    ax.grid(True, alpha=0.3)
+
+    fig.tight_layout()
+    return save_plot_to_png(fig)
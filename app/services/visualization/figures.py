@@ -0,0 +1,36 @@
+"""
+pyplot 전역 상태 없이 그래프 생성
+
+plt.subplots()는 프로세스 전역의 figure 관리자를 사용하므로 여러 스레드에서
+동시에 그리면 서로의 figure를 건드릴 수 있다. 여기서는 Figure 객체를 직접 만들고
+Agg 캔버스를 붙여 요청마다 독립적으로 렌더링한다.
+
+단, matplotlib의 mathtext 파서(pyparsing)는 프로세스 전역 캐시를 공유하므로
+텍스트 배치(tight_layout)와 래스터화(savefig)만 하나의 잠금으로 직렬화한다.
+"""
+
+import threading
+
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+
+_render_lock = threading.RLock()
+
+
+class AggFigure(Figure):
+    """텍스트 배치와 래스터화를 잠금 안에서 수행하는 Figure"""
+
+    def tight_layout(self, *args, **kwargs):
+        with _render_lock:
+            return super().tight_layout(*args, **kwargs)
+
+    def savefig(self, *args, **kwargs):
+        with _render_lock:
+            return super().savefig(*args, **kwargs)
+
+
+def create_figure(figsize=None, **kwargs):
+    """Agg 캔버스가 연결된 독립 Figure 생성"""
+    fig = AggFigure(figsize=figsize, **kwargs)
+    FigureCanvasAgg(fig)
+    return fig
@@ -0,0 +1,135 @@
+"""
+내용 주소 기반(content-addressed) 그래프 저장소
+
+PNG 바이트를 SHA-256 해시로 저장하고 메모리(LRU)와 디스크 디렉터리에 보관한다.
+같은 그래프는 항상 같은 해시를 가지므로 URL을 영구 캐시할 수 있다.
+
+시드 없는 무작위 검증은 요청마다 새 그래프를 만들므로 디스크 사용량에 상한(max_disk_bytes)을
+둔다. 상한을 넘으면 수정 시각(mtime)이 오래된 파일부터 지워 상한의 PRUNE_RATIO까지 줄이며,
+조회할 때 mtime을 갱신하므로 최근에 쓰인 그래프가 남는다.
+"""
+
+import hashlib
+import os
+import re
+import tempfile
+import threading
+from collections import OrderedDict
+
+DIGEST_PATTERN = re.compile(r'^[0-9a-f]{64}$')
+
+# 상한을 넘었을 때 줄이는 목표 비율 (쓸 때마다 정리하지 않도록 여유를 둠)
+PRUNE_RATIO = 0.8
+
+
+class PlotStore:
+    """해시 → PNG 바이트 저장소 (메모리 + 디스크, 디스크는 max_disk_bytes 상한)"""
+
+    def __init__(self, directory=None, memory_items=256, max_disk_bytes=None):
+        self._directory = directory
+        self.memory_items = memory_items
+        self.max_disk_bytes = max_disk_bytes
+        self._memory = OrderedDict()
+        self._disk_bytes = None   # 디렉터리의 그래프 파일 크기 합 (처음 쓸 때 계산)
+        self._lock = threading.Lock()
+
+    @property
+    def directory(self):
+        return self._directory
+
+    @directory.setter
+    def directory(self, directory):
+        with self._lock:
+            self._directory = directory
+            self._disk_bytes = None
+
+    def _path(self, digest):
+        return os.path.join(self.directory, f'{digest}.png')
+
+    def put(self, png_bytes):
+        """PNG 바이트 저장 후 해시 반환"""
+        digest = hashlib.sha256(png_bytes).hexdigest()
+        with self._lock:
+            if digest in self._memory:
+                self._memory.move_to_end(digest)
+                return digest
+            self._remember(digest, png_bytes)
+
+        if self.directory and not os.path.exists(self._path(digest)):
+            os.makedirs(self.directory, exist_ok=True)
+            # 원자적 쓰기: 임시 파일에 쓴 뒤 이름 변경
+            fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+            with os.fdopen(fd, 'wb') as f:
+                f.write(png_bytes)
+            os.replace(tmp_path, self._path(digest))
+            self._account(len(png_bytes))
+        return digest
+
+    def _stored_files(self):
+        """디스크의 그래프 파일 [(mtime, 경로, 크기)]"""
+        files = []
+        try:
+            entries = os.scandir(self.directory)
+        except FileNotFoundError:
+            return files
+        with entries:
+            for entry in entries:
+                if entry.name.endswith('.png') and DIGEST_PATTERN.match(entry.name[:-4]):
+                    try:
+                        stat = entry.stat()
+                    except FileNotFoundError:
+                        continue
+                    files.append((stat.st_mtime, entry.path, stat.st_size))
+        return files
+
+    def _account(self, size):
+        """새 파일 크기를 더하고 상한을 넘으면 오래된 파일부터 삭제"""
+        if self.max_disk_bytes is None:
+            return
+        with self._lock:
+            if self._disk_bytes is None:
+                self._disk_bytes = sum(size for _, _, size in self._stored_files())
+            else:
+                self._disk_bytes += size
+            if self._disk_bytes <= self.max_disk_bytes:
+                return
+            files = sorted(self._stored_files())
+            total = sum(size for _, _, size in files)
+            target = self.max_disk_bytes * PRUNE_RATIO
+            for _, path, size in files:
+                if total <= target:
+                    break
+                try:
+                    os.remove(path)
+                except FileNotFoundError:
+                    pass
+                total -= size
+            self._disk_bytes = total
+
+    def get(self, digest):
+        """해시로 PNG 바이트 조회, 없으면 None"""
+        if not DIGEST_PATTERN.match(digest):
+            return None
+        with self._lock:
+            png_bytes = self._memory.get(digest)
+            if png_bytes is not None:
+                self._memory.move_to_end(digest)
+                return png_bytes
+
+        if not self.directory:
+            return None
+        path = self._path(digest)
+        try:
+            with open(path, 'rb') as f:
+                png_bytes = f.read()
+            os.utime(path)  # 최근 사용 표시 (정리할 때 늦게 지워짐)
+        except OSError:
+            return None
+        with self._lock:
+            self._remember(digest, png_bytes)
+        return png_bytes
+
+    def _remember(self, digest, png_bytes):
+        self._memory[digest] = png_bytes
+        while len(self._memory) > self.memory_items:
+            self._memory.popitem(last=False)
@@ -0,0 +1,41 @@
+"""
+그래프 원본 데이터(시리즈) 직렬화 유틸리티
+
+plots=data 모드에서 검증기가 돌려주는 numpy 배열 묶음을
+JSON 호환 구조나 NumPy .npz 바이너리로 변환한다.
+"""
+
+import math
+from io import BytesIO
+import numpy as np
+
+def series_to_json(obj):
+    """numpy 배열/스칼라를 포함한 중첩 구조를 JSON 호환 구조로 변환 (nan, inf는 null)"""
+    if isinstance(obj, dict):
+        return {str(key): series_to_json(value) for key, value in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return [series_to_json(value) for value in obj]
+    if isinstance(obj, np.ndarray):
+        if obj.dtype.kind == 'f' and not np.isfinite(obj).all():
+            return series_to_json(obj.tolist())
+        return obj.tolist()
+    if isinstance(obj, np.generic):
+        obj = obj.item()
+    if isinstance(obj, float) and not math.isfinite(obj):
+        return None
+    return obj
+
+def _flatten(obj, prefix=''):
+    """중첩 dict를 'plot/series' 형태의 키로 평탄화"""
+    for key, value in obj.items():
+        name = f'{prefix}{key}'
+        if isinstance(value, dict):
+            yield from _flatten(value, f'{name}/')
+        else:
+            yield name, np.asarray(value)
+
+def series_to_npz(series):
+    """시리즈 묶음을 NumPy .npz 바이트로 변환 (키: '<그래프>/<시리즈>')"""
+    buffer = BytesIO()
+    np.savez_compressed(buffer, **dict(_flatten(series)))
+    return buffer.getvalue()
@@ -8,11 +8,14 @@ class VerificationApp {
         this.updateDashboardStatus();
     }
 
-    async updateDashboardStatus() {
+    async updateDashboardStatus(data) {
         // 기본 상태 표시
-        document.getElementById('verificationCount').textContent = '0';
-        document.getElementById('plotCount').textContent = '0';
-        document.getElementById('accuracyRate').textContent = '0%';
+        document.getElementById('verificationCount').textContent = data ? data.verification_count : '0';
+        document.getElementById('plotCount').textContent = data ? data.plot_count : '0';
+        document.getElementById('accuracyRate').textContent =
+            data ? `${(data.accuracy * 100).toFixed(0)}%` : '0%';
+        document.getElementById('cacheHitRate').textContent =
+            data && data.cache ? `${(data.cache.hit_rate * 100).toFixed(0)}%` : '0%';
     }
 
     showLoading(containerId) {
@@ -56,6 +59,10 @@ class VerificationApp {
             if (data.success) {
                 this.renderDashboardResults(data);
                 this.updateDashboardStatus(data);
+                // 서버의 첫 집계가 끝나지 않았으면 잠시 후 다시 조회
+                if (!data.ready) {
+                    setTimeout(() => this.loadDashboard(), 2000);
+                }
             } else {
                 this.showError('dashboardResults', data.error);
             }
@@ -263,31 +270,40 @@ class VerificationApp {
                 const resultsContainer = document.getElementById('dashboardResults');
                 resultsContainer.innerHTML = '<pre id="log-container" style="white-space: pre-wrap; word-wrap: break-word; background: #f4f4f4; border: 1px solid #ddd; padding: 15px; border-radius: 5px;"></pre>';
                 const logContainer = document.getElementById('log-container');
+                const results = {};
 
                 const eventSource = new EventSource('/math/api/verification/all');
 
                 logContainer.textContent = '서버에 연결 중...';
 
-                eventSource.onmessage = function(event) {
+                eventSource.onmessage = (event) => {
                     if (event.data === '[DONE]') {
                         eventSource.close();
-                        logContainer.textContent += '\n\n스트림 연결이 종료되었습니다.';
+                        this.renderAllResults({ results });
                         return;
                     }
 
                     const data = JSON.parse(event.data);
 
-                    if (logContainer.textContent === '서버에 연결 중...') {
-                        logContainer.textContent = ''; // 첫 메시지 수신 시 초기화
+                    switch (data.event) {
+                        case 'begin':
+                            logContainer.textContent = `${data.total}개 검증 시작\n`;
+                            break;
+                        case 'started':
+                            logContainer.textContent += `▶ ${data.concept} 실행 중\n`;
+                            break;
+                        case 'finished':
+                            results[data.name] = data;
+                            logContainer.textContent += `✔ ${data.concept} 완료 (${data.duration.toFixed(2)}초)\n`;
+                            break;
+                        case 'error':
+                            logContainer.textContent += `[오류] ${data.concept}: ${data.error}\n`;
+                            break;
+                        case 'progress':
+                            logContainer.textContent += `진행률 ${data.percent.toFixed(0)}% (${data.completed}/${data.total})\n`;
+                            break;
                     }
 
-                    if (data.log) {
-                        logContainer.textContent += data.log + '\n';
-                    } else if (data.error) {
-                        logContainer.textContent += `[오류] ${data.error}\n`;
-                        logContainer.style.color = 'red';
-                    }
-                    
                     // 자동 스크롤
                     resultsContainer.scrollTop = resultsContainer.scrollHeight;
                 };
@@ -316,7 +332,7 @@ class VerificationApp {
                 html += `
                     <div class="plot-container">
                         <div class="plot-title">${plotTitle}</div>
-                        <img src="data:image/png;base64,${plotData}" 
+                        <img src="${this.getPlotSrc(plotData)}" 
                              alt="${plotTitle}" class="plot-image">
                     </div>
                 `;
@@ -369,7 +385,7 @@ class VerificationApp {
                     html += `
                         <div class="plot-container">
                             <div class="plot-title">${plotTitle}</div>
-                            <img src="data:image/png;base64,${plotData}" 
+                            <img src="${this.getPlotSrc(plotData)}" 
                                  alt="${plotTitle}" class="plot-image">
                         </div>
                     `;
@@ -394,6 +410,11 @@ class VerificationApp {
         container.innerHTML = html;
     }
 
+    getPlotSrc(plotData) {
+        // 그래프는 URL(/math/plots/<hash>.png)로 오며, 레거시 base64 문자열도 지원
+        return plotData.startsWith('/') ? plotData : `data:image/png;base64,${plotData}`;
+    }
+
     getPlotTitle(plotName) {
         const titles = {
             'pi_monte_carlo': 'π 검증: 몬테카를로 시뮬레이션',
@@ -7,12 +7,20 @@ sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')
 import pytest
 from app import create_app
 
+@pytest.fixture(scope="session")
+def storage_dir(tmp_path_factory):
+    """Session-wide temp dir for on-disk state, so nothing leaks in from (or into) instance/."""
+    return tmp_path_factory.mktemp("instance")
+
+
 @pytest.fixture
-def app():
+def app(storage_dir):
     """Create and configure a new app instance for each test."""
-    app = create_app()
-    app.config.update({
+    app = create_app({
         "TESTING": True,
+        "PLOT_STORE_DIR": str(storage_dir / "plots"),
+        "PRIME_TABLE_DIR": str(storage_dir / "primes"),
+        "SYMBOLIC_MEMO_PATH": str(storage_dir / "symbolic_memo.sqlite3"),
     })
     yield app
 
@@ -1,10 +1,256 @@
+import io
 import json
+import time
+
+import numpy as np
 
 def test_pi_verification_api(client):
-    """Test the /math/api/verification/pi endpoint."""
-    response = client.get("/math/api/verification/pi")
+    """Test the /math/api/verification/pi endpoint in legacy base64 mode."""
+    response = client.get("/math/api/verification/pi?plot_format=base64")
     assert response.status_code == 200
     data = json.loads(response.data)
     assert 'plots' in data
     assert isinstance(data['plots'], dict)
     assert data['plots']['methods_comparison'].startswith('iVBORw0KGgo') # Check for PNG header in base64
+
+def test_seeded_verification_is_cached(client):
+    """Seeded runs of a random verifier are replayable and served from the cache."""
+    first = json.loads(client.get("/math/api/verification/probability?seed=7").data)
+    second = json.loads(client.get("/math/api/verification/probability?seed=7").data)
+    assert first['success'] and second['success']
+    assert first['seed'] == second['seed'] == 7
+    assert second['cached'] is True
+    assert first['result'] == second['result']
+
+def test_plots_are_served_by_url(client):
+    """Plots are returned as content-addressed URLs with immutable caching."""
+    data = json.loads(client.get("/math/api/verification/symmetry").data)
+    url = data['plots']['symmetry_analysis']
+    assert url.startswith('/math/plots/') and url.endswith('.png')
+
+    response = client.get(url)
+    assert response.status_code == 200
+    assert response.mimetype == 'image/png'
+    assert response.data.startswith(b'\x89PNG')
+    assert 'immutable' in response.headers['Cache-Control']
+    assert client.get('/math/plots/' + '0' * 64 + '.png').status_code == 404
+
+def test_data_only_verification(client):
+    """plots=data returns the raw series as JSON (or .npz) without rendering PNGs."""
+    data = json.loads(client.get("/math/api/verification/calculus?plots=data").data)
+    assert data['success']
+    series = data['plots']['integration_convergence']
+    assert series['subdivisions'] == [10, 50, 100, 500, 10**7]
+    assert len(series['riemann_sums']) == 5
+    assert abs(series['riemann_sums'][-1] - 9) < 2e-6
+
+    response = client.get("/math/api/verification/pi?plots=data&format=npz&seed=3")
+    assert response.mimetype == 'application/octet-stream'
+    assert response.data.startswith(b'PK')  # .npz is a zip archive
+
+    empty = json.loads(client.get("/math/api/verification/e?plots=none").data)
+    assert empty['plots'] == {}
+    assert client.get("/math/api/verification/e?plots=svg").status_code == 400
+
+def test_stream_all_verifications(client):
+    """The SSE endpoint streams structured events for all verifiers and ends with [DONE]."""
+    response = client.get("/math/api/verification/all?plots=none&seed=1")
+    assert response.mimetype == 'text/event-stream'
+
+    messages = [line[len('data: '):] for line in response.get_data(as_text=True).split('\n\n')
+                if line.startswith('data: ')]
+    assert messages[-1] == '[DONE]'
+    events = [json.loads(message) for message in messages[:-1]]
+
+    finished = [event for event in events if event['event'] == 'finished']
+    assert {event['name'] for event in finished} == {
+        'pi', 'golden-ratio', 'probability', 'calculus',
+        'binary', 'primes', 'symmetry', 'e'
+    }
+    assert all(event['duration'] >= 0 for event in finished)
+    assert [event['percent'] for event in events if event['event'] == 'progress'][-1] == 100
+    assert events[-1]['event'] == 'complete'
+
+def test_stream_disconnect_stops_running_verifications(client, monkeypatch):
+    """Closing the SSE stream cancels running verifiers at their next emit; none of them finish."""
+    from app.routes import math_routes
+    finished = []
+
+    def slow(plot_mode='png'):
+        for step in range(500):
+            math_routes.verifier_sink.emit('slow.progress', step=step)
+            time.sleep(0.01)
+        finished.append('slow')
+        return {}, {}
+
+    slow_names = [f'slow-{i}' for i in range(4)]
+    monkeypatch.setattr(math_routes, 'VERIFICATIONS', dict(
+        {'fast': ('fast', '', lambda plot_mode='png': ({'ok': True}, {}), False)},
+        **{name: (name, '', slow, False) for name in slow_names}
+    ))
+    math_routes.event_sink.clear()
+    math_routes.result_cache.clear()
+
+    response = client.get("/math/api/verification/all?plots=none", buffered=False)
+    received = []
+    for chunk in response.response:
+        received += [json.loads(line[len('data: '):]) for line in chunk.decode().split('\n\n')
+                     if line.startswith('data: ')]
+        started = {event['name'] for event in received if event['event'] == 'started'} & set(slow_names)
+        if any(event['event'] == 'finished' for event in received) and len(started) == 3:
+            break
+    closed = time.perf_counter()
+    response.close()
+
+    def cancelled_events():
+        return [event for event in math_routes.event_sink.events('verification')
+                if event['verification'] in slow_names]
+    while len(cancelled_events()) < len(started) and time.perf_counter() - closed < 4:
+        time.sleep(0.05)
+    assert time.perf_counter() - closed < 4
+    assert all('cancelled' in event['error'] for event in cancelled_events())
+    assert finished == [] and not set(slow_names) & set(math_routes.latest_results)
+    assert [event['name'] for event in received if event['event'] == 'finished'] == ['fast']
+
+def test_verifiers_emit_events_instead_of_printing(client, capsys):
+    """Verifiers report timings and metrics through the event sink, not stdout."""
+    from app.routes.math_routes import event_sink, result_cache
+    event_sink.clear()
+    result_cache.clear()
+    client.get("/math/api/verification/golden-ratio?plots=none")
+
+    assert capsys.readouterr().out == ''
+    computed = event_sink.latest('golden_ratio.computed')
+    assert computed['convergence_error'] < 1e-10
+    verification = event_sink.latest('verification')
+    assert verification['verification'] == 'golden-ratio'
+    assert verification['duration'] >= 0 and 'cached' in verification
+
+def test_dashboard_is_served_from_background_snapshot(client):
+    """The dashboard answers immediately and fills in once the background refresh completes."""
+    from app.routes.math_routes import dashboard
+    first = json.loads(client.get("/math/api/verification/dashboard").data)
+    assert first['success']
+
+    assert dashboard.wait(timeout=120)
+    data = json.loads(client.get("/math/api/verification/dashboard").data)
+    assert data['ready'] is True
+    assert data['verification_count'] == 8
+    assert {row['괘'] for row in data['summary']} >= {'건☰', '곤☷'}
+    assert 0 <= data['cache']['hit_rate'] <= 1
+    assert 'compute_time' in data['verifications']['pi']
+
+def test_pi_precision_and_engine_report(client):
+    """precision is honoured through Chudnovsky, and the engine reports digits vs time."""
+    data = json.loads(client.get("/math/api/verification/pi?plots=none&seed=1&precision=500").data)
+    assert data['result']['precision'] == 500
+    assert data['result']['chudnovsky_digits'] == 500
+    assert data['result']['chudnovsky_prefix'].startswith('3.14159265358979323846264338327950288')
+    assert client.get("/math/api/verification/pi?precision=0").status_code == 400
+
+    report = json.loads(client.get("/math/api/verification/pi/engine?plots=data&digits=1000").data)
+    assert report['success']
+    assert [run['digits'] for run in report['result']['Chudnovsky']] == [100, 1000]
+    leibniz = report['result']['Leibniz Series']
+    assert leibniz[-1]['error'] < leibniz[0]['error']
+    assert all(run['digits_per_second'] > 0 for run in leibniz)
+    assert set(report['plots']['digits_vs_time']) == set(report['result'])
+
+
+def test_estimator_convergence_report(client):
+    """Quasi-Monte Carlo beats pseudo-random sampling, and seeded reports are cached."""
+    url = "/math/api/verification/calculus/estimators?plots=data&estimators=pseudo,sobol&seed=3"
+    data = json.loads(client.get(url).data)
+    assert data['success'] and data['seed'] == 3 and not data['cached']
+    assert set(data['result']) == {'pseudo', 'sobol'}
+    assert data['result']['sobol']['rmse'][-1] < data['result']['pseudo']['rmse'][-1]
+    assert data['result']['sobol']['convergence_order'] > 0.8
+    assert set(data['plots']['estimator_convergence']) == {'pseudo', 'sobol'}
+    assert json.loads(client.get(url).data)['cached']
+    swapped = json.loads(client.get(url.replace("pseudo,sobol", "sobol,pseudo")).data)
+    assert swapped['result'] == data['result']
+
+    assert client.get("/math/api/verification/pi/estimators?estimators=bogus").status_code == 400
+    assert client.get("/math/api/verification/binary/estimators").status_code == 404
+
+
+def test_golden_ratio_big_n(client):
+    """F(n) for large n is computed exactly and summarised without printing every digit."""
+    data = json.loads(client.get("/math/api/verification/golden-ratio?plots=none&n=100000&modulus=1000").data)
+    big_n = data['result']['big_n']
+    assert big_n['fibonacci']['digits'] == 20899
+    assert big_n['lucas_identity']
+    assert round(big_n['ratio_error']['error_log10']) == -41797
+    assert data['result']['pisano_period'] == {'modulus': 1000, 'period': 1500}
+    assert client.get("/math/api/verification/golden-ratio?n=0").status_code == 400
+
+
+def test_continued_fraction_convergents(client):
+    """Convergents come from exact integer arithmetic, and deep prefixes are streamed."""
+    data = json.loads(client.get(
+        "/math/api/verification/continued-fraction?constant=pi&terms=5&max_denominator=1000"
+    ).data)
+    assert data['result']['quotients'] == [3, 7, 15, 1, 292]
+    assert data['result']['convergents'][-1] == ['103993', '33102']
+    assert data['result']['best_rational']['numerator'] == '355'
+
+    data = json.loads(client.get("/math/api/verification/continued-fraction?value=415/93").data)
+    assert data['result'] == {
+        'quotients': [4, 2, 6, 7], 'finite': True,
+        'convergents': [['4', '1'], ['9', '2'], ['58', '13'], ['415', '93']]
+    }
+    data = json.loads(client.get("/math/api/verification/continued-fraction?quadratic=0,7,1&terms=5").data)
+    assert data['result']['quotients'] == [2, 1, 1, 1, 4]
+
+    response = client.get("/math/api/verification/continued-fraction?constant=e&terms=3000&format=ndjson")
+    lines = [json.loads(line) for line in response.data.decode().splitlines()]
+    assert len(lines) == 3000 and lines[8]['quotient'] == 6
+    assert client.get("/math/api/verification/continued-fraction?constant=tau").status_code == 400
+    response = client.get("/math/api/verification/continued-fraction?value=1/0")
+    assert response.status_code == 400 and 'non-zero denominator' in json.loads(response.data)['error']
+
+
+def test_bayes_posterior_grid(client):
+    """The whole posterior tensor comes back in one request, as JSON or .npy."""
+    url = "/math/api/verification/probability/bayes-grid?prior=0.01,0.1&sensitivity=0.99&specificity=0.9:0.95:2"
+    data = json.loads(client.get(url).data)
+    assert data['shape'] == [2, 1, 2]
+    assert abs(data['result']['posterior'][0][0][1] - 0.99 * 0.01 / (0.99 * 0.01 + 0.05 * 0.99)) < 1e-12
+    assert data['plots'] == {}
+
+    tensor = np.load(io.BytesIO(client.get(url + "&format=npy").data))
+    np.testing.assert_allclose(tensor, data['result']['posterior'])
+
+    assert client.get("/math/api/verification/probability/bayes-grid?prior=2").status_code == 400
+    heatmap = json.loads(client.get("/math/api/verification/probability/bayes-grid?plots=png").data)
+    assert set(heatmap['plots']) == {'posterior_heatmap'}
+
+
+def test_primes_route_grows_the_shared_prime_table(client, storage_dir):
+    """A larger ?limit= extends the table in PRIME_TABLE_DIR, in-process and from a render worker."""
+    table_dir = storage_dir / "primes"
+
+    def stored_limits():
+        return sorted(int(path.stem.rsplit('_', 1)[1]) for path in table_dir.glob('odd_bitset_*.npy'))
+
+    base = max(stored_limits(), default=0)
+    url = "/math/api/verification/primes?mersenne=10&gaps=1000&limit={}"
+    data = json.loads(client.get(url.format(base + 10**6) + "&plots=none").data)
+    assert data['result']['sieve']['prime_count'] > 0
+    grown = stored_limits()
+    assert len(grown) == 1 and grown[0] >= base + 10**6
+
+    # plots=png runs in the render pool; the worker grows the same on-disk table
+    assert client.get(url.format(grown[0] + 10**6)).status_code == 200
+    regrown = stored_limits()
+    assert len(regrown) == 1 and regrown[0] >= grown[0] + 10**6
+
+
+def test_prime_counting_table(client):
+    """Exact π(10^k) from Lucy_Hedgehog; li(x) tracks it far more closely than x/ln x."""
+    data = json.loads(client.get("/math/api/verification/primes/counting?plots=data&max_exponent=11").data)
+    result = data['result']
+    assert result['pi'][-3:] == [50847534, 455052511, 4118054813]
+    assert abs(result['li_error'][-1]) < 1e-5 < abs(result['x_over_log_error'][-1])
+    assert len(data['plots']['prime_counting']['li_error']) == 11
+    assert client.get("/math/api/verification/primes/counting?max_exponent=13").status_code == 400
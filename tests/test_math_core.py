@@ -0,0 +1,252 @@
+import multiprocessing
+import threading
+from concurrent.futures import CancelledError, ProcessPoolExecutor
+
+import numpy as np
+import mpmath
+import pytest
+import sympy
+
+from app.services.math_core.clt import simulate_sample_means
+from app.services.math_core.expressions import X, compile_expression
+from app.services.math_core.fibonacci import (
+    describe, fibonacci, fibonacci_float, lucas, phi_ratio_error, pisano_period
+)
+from app.services.math_core.prime_gaps import GapStatistics, gap_statistics
+from app.services.math_core.prime_table import PrimeTable
+from app.services.math_core.primality import is_prime, lucas_lehmer, mersenne_batch, mersenne_exponents
+from app.services.math_core.quadrature import benchmark, left_riemann
+from app.services.math_core.sieve import PrimeIndex, count_primes, iter_primes, odd_bitset, primes_up_to
+from app.services.math_core.monte_carlo import estimate_pi, parallel_estimate_pi
+from app.services.symbolic_worker import SymbolicTimeoutError, SymbolicWorkerPool
+
+
+def test_streaming_monte_carlo_matches_dense_computation():
+    """Chunked estimation with cumulative checkpoints equals a dense recount of the same draws."""
+    n_points, chunk_size = 25_000, 1000
+    streamed = estimate_pi(n_points, np.random.default_rng(5), chunk_size=chunk_size, sample_size=10)
+
+    rng = np.random.default_rng(5)
+    hits = np.concatenate([
+        np.sum((rng.random((2, chunk_size)) * 2 - 1)**2, axis=0) <= 1
+        for _ in range(n_points // chunk_size)
+    ])
+    running = np.cumsum(hits)
+
+    assert streamed['inside'] == running[-1]
+    np.testing.assert_allclose(
+        streamed['checkpoint_estimates'],
+        4 * running[streamed['checkpoints'] - 1] / streamed['checkpoints']
+    )
+    low, high = streamed['confidence_interval']
+    assert low < streamed['estimate'] < high
+    assert len(streamed['sample'][0]) == 10
+
+
+def test_parallel_monte_carlo_is_reproducible_across_worker_counts():
+    """Same master seed gives bit-identical results serially and on a process pool."""
+    kwargs = dict(seed=123, block_size=30_000, chunk_size=7_000, sample_size=5)
+    serial = parallel_estimate_pi(100_000, **kwargs)
+    with ProcessPoolExecutor(max_workers=3, mp_context=multiprocessing.get_context('spawn')) as executor:
+        pooled = parallel_estimate_pi(100_000, mapper=executor.map, **kwargs)
+
+    assert serial['inside'] == pooled['inside']
+    assert serial['estimate'] == pooled['estimate']
+    np.testing.assert_array_equal(serial['checkpoint_estimates'], pooled['checkpoint_estimates'])
+    np.testing.assert_array_equal(serial['sample'][0], pooled['sample'][0])
+    assert parallel_estimate_pi(100_000, **dict(kwargs, seed=124))['inside'] != serial['inside']
+
+
+def test_segmented_sieve_matches_sympy_across_blocks_and_processes():
+    """Tiny blocks and segments exercise every boundary; a process pool gives the same bitset."""
+    options = dict(block_size=1024, segment_size=72)
+    expected = list(sympy.primerange(0, 50_001))
+    assert primes_up_to(50_000, **options).tolist() == expected
+    assert list(iter_primes(30_011, 40_000, **options)) == [p for p in expected if 30_011 <= p < 40_000]
+    assert [primes_up_to(n).tolist() for n in range(4)] == [[], [], [2], [2, 3]]
+    assert count_primes(50_000, **options) == len(expected)
+
+    with ProcessPoolExecutor(max_workers=2, mp_context=multiprocessing.get_context('spawn')) as executor:
+        pooled = odd_bitset(50_000, mapper=executor.map, window=3, **options)
+    np.testing.assert_array_equal(pooled, odd_bitset(50_000))
+    assert count_primes(10**7) == 664_579
+
+
+def test_prime_index_answers_vectorized_prime_counts():
+    """π(x) for a whole vector of x comes from the prefix table of a single sieve."""
+    index = PrimeIndex(20_000, block_size=512, segment_size=40)
+    x = np.arange(-2, 20_001)
+    np.testing.assert_array_equal(index.pi(x[::37]), [sympy.primepi(max(int(v), 0)) for v in x[::37]])
+    assert index.pi(20_000) == 2262 and index.pi(19_997) == 2262 and index.pi(19_996) == 2261
+    assert x[index.is_prime(x)].tolist() == list(sympy.primerange(0, 20_001))
+    assert index.primes(19_000, 19_100).tolist() == list(sympy.primerange(19_000, 19_100))
+
+
+def test_prime_table_grows_incrementally_and_reopens_read_only(tmp_path):
+    """Growing keeps one bitset/prefix pair on disk; a new table maps it without sieving."""
+    table = PrimeTable(str(tmp_path), granule=64)
+    assert table.index(1000).limit == 1024
+    grown = table.index(20_000)
+    assert sorted(path.name for path in tmp_path.iterdir()) == ['odd_bitset_20096.npy', 'pi_table_20096.npy']
+
+    reopened = PrimeTable(str(tmp_path), granule=64).index(5000)
+    assert reopened.limit == 20_096 and isinstance(reopened.words, np.memmap)
+    assert not reopened.words.flags.writeable
+    x = np.arange(20_097)
+    fresh = PrimeIndex(20_096)
+    np.testing.assert_array_equal(reopened.pi(x), fresh.pi(x))
+    np.testing.assert_array_equal(grown.is_prime(x), fresh.is_prime(x))
+    assert table.is_prime(19_997) and table.is_prime(20_097) is None
+
+
+def test_gap_statistics_merge_per_block_partials_like_a_single_pass():
+    """Partials from tiny blocks (and a process pool) merge into the single-array statistics."""
+    options = dict(block_size=256, segment_size=32)
+    primes = np.array(list(sympy.primerange(0, 100_000)))
+    expected = GapStatistics.from_primes(primes).summary()
+    assert gap_statistics(0, 100_000, **options).summary() == expected
+    with ProcessPoolExecutor(max_workers=2, mp_context=multiprocessing.get_context('spawn')) as executor:
+        assert gap_statistics(0, 100_000, mapper=executor.map, window=3, **options).summary() == expected
+
+    assert expected['pairs'] == {'twin': 1224, 'cousin': 1216, 'sexy': 2447}
+    assert expected['maximal_gaps'][-1] == {'gap': 72, 'prime': 31_397}
+    assert expected['first_occurrence']['14'] == 113
+    assert sum(expected['gap_counts']) == len(primes) - 1
+    middle = gap_statistics(31_000, 32_000, **options).summary()
+    assert middle['max_gap'] == 72 and middle['first_prime'] == 31_013
+
+
+def test_miller_rabin_and_lucas_lehmer_agree_with_known_primes():
+    """Strong pseudoprimes are rejected, big ints go probabilistic and LL finds the Mersenne exponents."""
+    assert [n for n in range(3000) if is_prime(n)] == list(sympy.primerange(0, 3000))
+    for n in [561, 3215031751, 3825123056546413051, 318665857834031151167461, 2**64 - 59, 2**127 - 1,
+              (2**89 - 1) * (2**61 - 1)]:
+        assert is_prime(n) == sympy.isprime(n)
+    assert not lucas_lehmer(11) and lucas_lehmer(127)
+    assert mersenne_exponents(700) == [2, 3, 5, 7, 13, 17, 19, 31, 61, 89, 107, 127, 521, 607]
+
+    with ProcessPoolExecutor(max_workers=2, mp_context=multiprocessing.get_context('spawn')) as executor:
+        batch = mersenne_batch([11, 13, 23, 29, 521], mapper=executor.map)
+    assert batch == [(11, False, 23), (13, True, None), (23, False, 47), (29, False, 233), (521, True, None)]
+
+    def unused_mapper(func, items):
+        raise AssertionError("small batches must not be dispatched")
+    assert mersenne_batch([3, 2, 11], mapper=unused_mapper) == [(3, True, None), (2, True, None), (11, False, 23)]
+
+
+def test_fast_doubling_fibonacci_matches_recurrence():
+    """Fast doubling, the float path, Pisano periods and the φ error agree with brute force."""
+    fib = [0, 1]
+    for _ in range(300):
+        fib.append(fib[-1] + fib[-2])
+    assert [fibonacci(k) for k in range(len(fib))] == fib
+    assert [lucas(k) for k in range(5)] == [2, 1, 3, 4, 7]
+    np.testing.assert_allclose(fibonacci_float(np.arange(300)), np.array(fib[:300], dtype=float), rtol=1e-12)
+    assert describe(fib[300]) == {
+        'digits': len(str(fib[300])), 'leading': str(fib[300])[:20], 'trailing': str(fib[300])[-20:]
+    }
+
+    for m in range(2, 60):
+        period, (a, b) = 1, (1, 1 % m)
+        while (a, b) != (0, 1 % m):
+            a, b, period = b, (a + b) % m, period + 1
+        assert pisano_period(m) == period
+
+    with mpmath.workdps(60):
+        exact = mpmath.mpf(fib[101]) / fib[100] - (1 + mpmath.sqrt(5)) / 2
+        assert mpmath.almosteq(mpmath.mpf(phi_ratio_error(100, digits=40)['error']), exact, rel_eps=1e-35)
+
+
+def test_clt_histograms_stream_in_bounded_blocks():
+    """Block size does not change the histogram, and only finite-variance sources converge."""
+    small = simulate_sample_means('uniform', 30, 20_000, np.random.default_rng(3), block_elements=1000)
+    large = simulate_sample_means('uniform', 30, 20_000, np.random.default_rng(3))
+    np.testing.assert_array_equal(small['counts'], large['counts'])
+    assert small['counts'].sum() + small['underflow'] + small['overflow'] == 20_000
+
+    exponential = [simulate_sample_means('exponential', n, 50_000, np.random.default_rng(n))
+                   for n in (1, 100)]
+    assert exponential[1]['ks_distance'] < exponential[0]['ks_distance'] / 4
+    assert abs(exponential[1]['std'] - exponential[1]['theoretical_std']) < 0.01
+
+    cauchy = simulate_sample_means('cauchy', 100, 50_000, np.random.default_rng(0))
+    assert cauchy['theoretical_std'] is None
+    assert cauchy['ks_distance'] < 0.02  # the mean of Cauchy samples is still standard Cauchy
+
+
+def test_compiled_expressions_are_cached_and_vectorized():
+    """One parse per expression; grid evaluation matches per-point sympy substitution."""
+    f = compile_expression('sin(x) * x**2')
+    assert compile_expression(sympy.sin(X) * X**2) is f
+    assert sympy.simplify(f.derivative - (2 * X * sympy.sin(X) + X**2 * sympy.cos(X))) == 0
+    assert f.definite_integral(0, sympy.pi) == sympy.pi**2 - 4
+
+    x, h = np.linspace(-2, 2, 7), np.array([1e-1, 1e-3])
+    grid = f.central_difference(x[:, None], h[None, :])
+    expected = [[float((f.expr.subs(X, xi + hi) - f.expr.subs(X, xi - hi)) / (2 * hi)) for hi in h] for xi in x]
+    np.testing.assert_allclose(grid, expected, rtol=1e-9)
+    np.testing.assert_array_equal(compile_expression('3').function(x), np.full(7, 3.0))
+
+
+def test_quadrature_rules_reach_their_convergence_orders():
+    """Composite rules show their textbook orders and large n needs no Python loop."""
+    f = compile_expression('exp(x)')
+    exact = float(f.definite_integral(0, 3))
+    report = benchmark(f, 0.0, 3.0, exact, subdivisions=[2**k for k in range(2, 9)])
+    assert abs(report['left_riemann']['convergence_order'] - 1) < 0.1
+    assert abs(report['midpoint']['convergence_order'] - 2) < 0.1
+    assert abs(report['simpson']['convergence_order'] - 4) < 0.3
+    assert min(report['gauss_legendre']['errors']) < 1e-12
+    assert report['adaptive_simpson']['errors'][-1] < 1e-11
+
+    estimate, evaluations = left_riemann(compile_expression('x**2'), 0.0, 3.0, 10**7, chunk_size=2**18)
+    assert evaluations == 10**7 and abs(estimate - 9) < 2e-6
+
+
+def test_symbolic_pool_kills_slow_jobs_and_memo_survives_restart(tmp_path):
+    """A hung integral is killed at its deadline or on its own cancel event; other jobs keep running,
+    and finished results are decoded from disk by a new pool without eval."""
+    memo_path = str(tmp_path / 'memo.sqlite3')
+    hung = sympy.sympify('exp(x**x)*log(x)**x/sin(x)**x')
+    pool = SymbolicWorkerPool(max_workers=2, timeout=30, memo_path=memo_path)
+    try:
+        # the deadline starts once the (cold) worker has imported sympy
+        with pytest.raises(SymbolicTimeoutError):
+            pool.run('integrate', hung, X, timeout=0.5)
+        assert pool.run('integrate', X**2, (X, 0, 3)) == 9  # a fresh worker replaced the killed one
+
+        cancel, outcome = threading.Event(), []
+        def run_hung():
+            try:
+                pool.run('integrate', hung, X, cancel=cancel)
+            except CancelledError:
+                outcome.append('cancelled')
+        thread = threading.Thread(target=run_hung)
+        thread.start()
+        assert pool.run('diff', sympy.sin(X), X) == sympy.cos(X)
+        cancel.set()
+        thread.join(timeout=10)
+        assert outcome == ['cancelled']
+    finally:
+        pool.shutdown()
+
+    restarted = SymbolicWorkerPool(max_workers=0, memo_path=memo_path)
+    assert restarted.run('integrate', X**2, (X, 0, 3)) == 9
+    assert restarted.run('diff', sympy.sin(X), X) == sympy.cos(X)
+    assert (restarted.hits, restarted.misses, len(restarted.memo)) == (2, 0, 2)
+
+    hostile = tmp_path / 'hostile'
+    restarted.memo.set(restarted.make_key('diff', (X**3, X)), f"__import__('pathlib').Path({str(hostile)!r}).touch()")
+    assert restarted.run('diff', X**3, X) == 3 * X**2 and not hostile.exists()
+
+
+def test_symbolic_worker_runs_under_memory_limit():
+    """A job that exhausts the worker's address-space limit fails cleanly and the pool recovers."""
+    pool = SymbolicWorkerPool(max_workers=1, timeout=60, memory_limit=2**29, cpu_limit=30)
+    try:
+        blowup = sympy.Pow(sympy.Mul(X, X + 1, X + 2, evaluate=False), 10**7, evaluate=False)
+        with pytest.raises(RuntimeError, match='limit'):
+            pool.run('simplify', blowup)
+        assert pool.run('diff', sympy.sin(X), X) == sympy.cos(X)
+    finally:
+        pool.shutdown()
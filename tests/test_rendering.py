@@ -0,0 +1,67 @@
+import os
+import random
+from concurrent.futures import ThreadPoolExecutor
+
+from app.services.math_core import (
+    PiVerification, PhiVerification, ProbabilityVerification,
+    CalculusVerification, BinaryVerification, PrimesVerification,
+    SymmetryVerification, EVerification
+)
+from app.services.render_pool import RenderPool
+from app.services.visualization.plot_store import PlotStore
+
+N_THREADS = 8
+
+VERIFIERS = {
+    'pi': lambda: PiVerification().verify_pi_with_visualization(seed=42),
+    'golden-ratio': lambda: PhiVerification().verify_golden_ratio_with_visualization(),
+    'probability': lambda: ProbabilityVerification().verify_probability_with_visualization(seed=42),
+    'calculus': lambda: CalculusVerification().verify_calculus_with_visualization(),
+    'binary': lambda: BinaryVerification().verify_binary_with_visualization(),
+    'primes': lambda: PrimesVerification().verify_primes_with_visualization(),
+    'symmetry': lambda: SymmetryVerification().verify_symmetry_with_visualization(),
+    'e': lambda: EVerification().verify_e_with_visualization(),
+}
+
+
+def test_concurrent_rendering_is_byte_identical():
+    """Rendering every verifier from several threads gives the same PNGs as a serial run."""
+    expected = {name: run()[1] for name, run in VERIFIERS.items()}
+
+    jobs = [name for name in VERIFIERS for _ in range(2)]
+    random.Random(0).shuffle(jobs)
+    with ThreadPoolExecutor(max_workers=N_THREADS) as executor:
+        results = list(executor.map(lambda name: (name, VERIFIERS[name]()[1]), jobs))
+
+    for name, plots in results:
+        assert plots == expected[name], name
+
+
+def test_render_pool_matches_local_rendering():
+    """Verifications dispatched to the warm process pool match in-process results."""
+    pool = RenderPool(max_workers=2, verifiers=('binary', 'pi'))
+    try:
+        futures = [pool.submit('binary'), pool.submit('pi', seed=42)]
+        (binary_result, binary_plots), (pi_result, pi_plots) = [f.result(timeout=120) for f in futures]
+    finally:
+        pool.shutdown()
+
+    assert binary_plots == VERIFIERS['binary']()[1]
+    assert pi_result == VERIFIERS['pi']()[0]
+    assert pi_plots == VERIFIERS['pi']()[1]
+
+
+def test_plot_store_prunes_least_recently_used_files_past_disk_cap(tmp_path):
+    """Past max_disk_bytes the oldest blobs are deleted; a blob read recently survives."""
+    store = PlotStore(str(tmp_path), memory_items=0, max_disk_bytes=10_000)
+    digests = []
+    for i in range(8):
+        digests.append(store.put(bytes([i]) * 2000))
+        os.utime(tmp_path / f'{digests[-1]}.png', (i, i))  # distinct, increasing mtimes
+        if i == 1:
+            assert store.get(digests[0]) is not None  # touching the first blob makes it recent
+
+    sizes = [path.stat().st_size for path in tmp_path.iterdir()]
+    assert sum(sizes) <= 10_000
+    assert store.get(digests[-1]) is not None and store.get(digests[0]) is not None
+    assert store.get(digests[1]) is None